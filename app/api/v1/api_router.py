@@ -1,18 +1,38 @@
-from fastapi import APIRouter
-
-from ...api.v1.endpoints import courses, exercises, lessons
-
-api_router = APIRouter()
+from fastapi import APIRouter, Depends
+
+from ...api.v1.endpoints import (
+    authors,
+    courses,
+    exercises,
+    export,
+    internal,
+    lessons,
+    search,
+)
+from ...db.query_budget import enforce_query_budget
+
+api_router = APIRouter(dependencies=[Depends(enforce_query_budget)])
 api_router.include_router(courses.router, prefix="/courses", tags=["courses"])
 
 api_router.include_router(lessons.router, prefix="/lessons", tags=["lessons"])
 
 api_router.include_router(exercises.router, prefix="/exercises", tags=["exercises"])
 
+api_router.include_router(authors.router, prefix="/authors", tags=["authors"])
+
+api_router.include_router(search.router, prefix="/search", tags=["search"])
+
+api_router.include_router(export.router, prefix="/export", tags=["export"])
+
+api_router.include_router(internal.router, prefix="/internal", tags=["internal"])
+
 """
 /api/v1/courses
+/api/v1/courses?author_id=
+/api/v1/courses/suggest?prefix=
 /api/v1/courses/{id}
 /api/v1/courses/{id}/lessons
+/api/v1/courses/{id}/tree
 
 /api/v1/lessons
 /api/v1/lessons/{id}
@@ -21,4 +41,20 @@ api_router.include_router(exercises.router, prefix="/exercises", tags=["exercise
 /api/v1/exercises
 /api/v1/exercises/{id}
 
+/api/v1/authors/{id}/courses
+
+/api/v1/search?q=
+
+/api/v1/export/courses.ndjson
+/api/v1/export/lessons.ndjson
+/api/v1/export/exercises.ndjson
+/api/v1/export/catalog.ndjson
+
+/api/v1/internal/cache
+/api/v1/internal/cache/suggest
+/api/v1/internal/replicas
+/api/v1/internal/pool
+/api/v1/internal/coalescing
+/api/v1/internal/import
+
 """
@@ -0,0 +1,109 @@
+"""
+Conditional GET support (ETag / Last-Modified) derived from ``updated_at``.
+
+Items carry a weak ETag built from their id and ``updated_at`` and a
+Last-Modified header. Lists carry a weak ETag hashed from the
+``(id, updated_at)`` of every row on the page, so updates, inserts and
+deletes within the page all change it. Only If-None-Match is honoured for
+lists because the newest ``updated_at`` cannot reveal a deleted row.
+
+``variant`` distinguishes representations of the same rows, e.g. different
+sparse fieldsets, so that each gets its own ETag.
+"""
+
+import hashlib
+from collections.abc import Iterable, Sequence
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional
+
+from fastapi import Request, Response, status
+
+from ...crud.pagination import Row
+
+CACHE_CONTROL = "no-cache"
+
+
+def _as_utc(value: datetime) -> datetime:
+    # naive timestamps from the database are treated as UTC
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def item_etag(item_id: int, updated_at: datetime, variant: str = "") -> str:
+    tag = f"{item_id}-{_as_utc(updated_at).timestamp():.6f}"
+    if variant:
+        tag += "-" + hashlib.blake2b(variant.encode(), digest_size=8).hexdigest()
+    return f'W/"{tag}"'
+
+
+def list_etag(rows: Iterable[Row], variant: str = "") -> str:
+    digest = hashlib.blake2b(variant.encode(), digest_size=16)
+    for row in rows:
+        stamp = _as_utc(row["updated_at"]).timestamp()
+        digest.update(f"{row['id']}:{stamp:.6f};".encode())
+    return f'W/"{digest.hexdigest()}"'
+
+
+def list_last_modified(rows: Sequence[Row]) -> Optional[datetime]:
+    return max((row["updated_at"] for row in rows), default=None)
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    if header.strip() == "*":
+        return True
+    # weak comparison: W/"x" and "x" are considered equal
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in header.split(",")
+    )
+
+
+def is_not_modified(
+    request: Request, etag: str, last_modified: Optional[datetime] = None
+) -> bool:
+    """
+    Evaluate If-None-Match and, when it is absent, If-Modified-Since.
+
+    Pass ``last_modified=None`` to ignore If-Modified-Since.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or last_modified is None:
+        return False
+
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        return False
+
+    # HTTP dates have one second resolution
+    return _as_utc(last_modified).replace(microsecond=0) <= since
+
+
+def has_conditional_headers(request: Request) -> bool:
+    return "if-none-match" in request.headers or "if-modified-since" in request.headers
+
+
+def set_validators(
+    response: Response, etag: str, last_modified: Optional[datetime] = None
+) -> None:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    if last_modified is not None:
+        response.headers["Last-Modified"] = format_datetime(
+            _as_utc(last_modified), usegmt=True
+        )
+
+
+def not_modified(etag: str, last_modified: Optional[datetime] = None) -> Response:
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_validators(response, etag, last_modified)
+    return response
@@ -0,0 +1,58 @@
+"""
+Author views:
+- GET    /authors/{id}/courses → Courses of an author with lesson and exercise counts
+"""
+
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .... import crud
+from ....db.session import get_read_db
+from ....schemas import AuthorCourseResponse
+from ..conditional import (
+    is_not_modified,
+    list_etag,
+    list_last_modified,
+    not_modified,
+    set_validators,
+)
+from ..pagination import set_next_cursor, set_total_count
+from ..serialization import author_course_list
+
+router = APIRouter()
+
+
+@router.get(
+    "/{author_id}/courses",
+    response_model=List[AuthorCourseResponse],
+    summary="Get courses of an author",
+)
+async def get_author_courses(
+    author_id: int,
+    request: Request,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_read_db),
+) -> Response:
+    courses = await crud.get_author_courses(
+        db, author_id=author_id, skip=skip, limit=limit, cursor=cursor
+    )
+    total = await crud.get_courses_count(db, author_id=author_id)
+    # child counts change without touching the course's updated_at
+    counts = ",".join(
+        f"{course['lesson_count']}:{course['exercise_count']}" for course in courses
+    )
+    etag = list_etag(courses, counts)
+    if is_not_modified(request, etag):
+        response = not_modified(etag)
+        set_total_count(response, total)
+        return response
+
+    response = author_course_list.response(courses)
+    set_next_cursor(response, courses, limit, "id")
+    set_validators(response, etag, list_last_modified(courses))
+    set_total_count(response, total)
+    return response
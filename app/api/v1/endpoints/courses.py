@@ -1,21 +1,55 @@
 """
 CRUD Operations:
 - POST   /courses          → Create course
-- GET    /courses          → List all courses
+- POST   /courses/bulk     → Create many courses
+- GET    /courses          → List all courses, or those in ?ids=
+- GET    /courses/suggest  → Suggest courses by title prefix
 - GET    /courses/{id}     → Get specific course
+- GET    /courses/{id}/tree → Get course with lessons and exercises
 - PUT    /courses/{id}     → Update course
 - DELETE /courses/{id}     → Delete course
 """
 
-from typing import List, Sequence
+from typing import Annotated, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .... import crud
-from ....db.session import get_db
+from ....core.cache import Payload
+from ....core.config import settings
+from ....crud.counts import CountMode
+from ....db.session import get_db, get_read_db
 from ....models import Course
-from ....schemas import CourseCreate, CourseResponse, CourseUpdate
+from ....schemas import (
+    BulkItemResult,
+    CourseCreate,
+    CourseResponse,
+    CourseSuggestion,
+    CourseTreeResponse,
+    CourseUpdate,
+)
+from ..conditional import (
+    has_conditional_headers,
+    is_not_modified,
+    item_etag,
+    list_etag,
+    list_last_modified,
+    not_modified,
+    set_validators,
+)
+from ..ids import IDS_DESCRIPTION, ids_response, parse_ids
+from ..pagination import set_next_cursor, set_total_count
+from ..serialization import FIELDS_DESCRIPTION, course_fields
 
 router = APIRouter()
 
@@ -32,16 +66,88 @@ async def create_course(
     return await crud.create_course(db=db, course=course)
 
 
+@router.post(
+    "/bulk",
+    response_model=List[BulkItemResult[CourseResponse]],
+    status_code=status.HTTP_207_MULTI_STATUS,
+    summary="Create many courses at once",
+)
+async def create_courses(
+    courses: Annotated[
+        List[CourseCreate], Body(min_length=1, max_length=settings.BULK_MAX_ITEMS)
+    ],
+    db: AsyncSession = Depends(get_db),
+) -> List[BulkItemResult[CourseResponse]]:
+    db_courses = await crud.create_courses(db, courses=courses)
+    return [
+        BulkItemResult(
+            index=index,
+            created=True,
+            item=CourseResponse.model_validate(db_course),
+        )
+        for index, db_course in enumerate(db_courses)
+    ]
+
+
 @router.get(
     "",
     response_model=List[CourseResponse],
     summary="Get list of courses",
 )
 async def get_courses(
-    skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_db)
-) -> Sequence[Course]:
-    courses = await crud.get_courses(db, skip=skip, limit=limit)
-    return courses
+    request: Request,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    count: CountMode = "exact",
+    fields: Annotated[Optional[str], Query(description=FIELDS_DESCRIPTION)] = None,
+    ids: Annotated[Optional[str], Query(description=IDS_DESCRIPTION)] = None,
+    author_id: Optional[int] = None,
+    db: AsyncSession = Depends(get_read_db),
+) -> Response:
+    selected = course_fields.parse(fields, course_fields.list_default)
+    if ids is not None:
+        requested = parse_ids(ids)
+        rows = await crud.get_courses_by_ids(
+            db, ids=requested, columns=course_fields.columns(selected)
+        )
+        return ids_response(request, rows, requested, course_fields, selected)
+
+    courses = await crud.get_courses(
+        db,
+        skip=skip,
+        limit=limit,
+        cursor=cursor,
+        columns=course_fields.columns(selected),
+        author_id=author_id,
+    )
+    total = await crud.get_courses_count(db, author_id=author_id, mode=count)
+    etag = list_etag(courses, course_fields.variant(selected))
+    if is_not_modified(request, etag):
+        response = not_modified(etag)
+        set_total_count(response, total)
+        return response
+
+    response = course_fields.serializer(selected).response(courses)
+    set_next_cursor(response, courses, limit, "id")
+    set_validators(response, etag, list_last_modified(courses))
+    set_total_count(response, total)
+    return response
+
+
+@router.get(
+    "/suggest",
+    response_model=List[CourseSuggestion],
+    summary="Suggest courses by title",
+    description="Top matches for a typed title fragment, titles starting with it first.",
+)
+async def suggest_courses(
+    prefix: Annotated[str, Query(min_length=1, max_length=100)],
+    limit: Annotated[int, Query(ge=1, le=50)] = settings.SUGGEST_LIMIT,
+    db: AsyncSession = Depends(get_read_db),
+) -> Response:
+    body = await crud.get_course_suggestions(db, prefix=prefix.strip(), limit=limit)
+    return Response(content=body, media_type="application/json")
 
 
 @router.get(
@@ -49,16 +155,71 @@ async def get_courses(
     response_model=CourseResponse,
     summary="Get a specific course",
 )
-async def get_course(course_id: int, db: AsyncSession = Depends(get_db)) -> Course:
-    course = await crud.get_course(db, course_id=course_id)
+async def get_course(
+    course_id: int,
+    request: Request,
+    fields: Annotated[Optional[str], Query(description=FIELDS_DESCRIPTION)] = None,
+    db: AsyncSession = Depends(get_read_db),
+) -> Response:
+    selected = course_fields.parse(fields, course_fields.all)
+    variant = course_fields.variant(selected)
+
+    if has_conditional_headers(request):
+        updated_at = await crud.get_course_updated_at(db, course_id=course_id)
+        if updated_at is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Course with id {course_id} not found",
+            )
+
+        etag = item_etag(course_id, updated_at, variant)
+        if is_not_modified(request, etag, updated_at):
+            return not_modified(etag, updated_at)
+
+    if variant:
+        row = await crud.get_course_fields(
+            db, course_id=course_id, columns=course_fields.columns(selected)
+        )
+        payload = (
+            Payload(
+                course_fields.serializer(selected).dump_item(row), row["updated_at"]
+            )
+            if row is not None
+            else None
+        )
+    else:
+        payload = await crud.get_course_payload(db, course_id=course_id)
+
+    if payload is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Course with id {course_id} not found",
+        )
+
+    response = Response(content=payload.body, media_type="application/json")
+    set_validators(
+        response, item_etag(course_id, payload.updated_at, variant), payload.updated_at
+    )
+    return response
+
+
+@router.get(
+    "/{course_id}/tree",
+    response_model=CourseTreeResponse,
+    summary="Get a course with its lessons and exercises",
+)
+async def get_course_tree(
+    course_id: int, db: AsyncSession = Depends(get_read_db)
+) -> Response:
+    body = await crud.get_course_tree_payload(db, course_id=course_id)
 
-    if course is None:
+    if body is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Course with id {course_id} not found",
         )
 
-    return course
+    return Response(content=body, media_type="application/json")
 
 
 @router.put(
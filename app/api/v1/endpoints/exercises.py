@@ -1,22 +1,52 @@
 """
 CRUD Operations:
 - POST   /exercises                → Create exercise
-- GET    /exercises                → List all exercises
+- POST   /exercises/bulk           → Create many exercises
+- GET    /exercises                → List all exercises, or those in ?ids=
 - GET    /exercises/{id}           → Get specific exercise
 - GET    /lessons/{id}/exercises   → Get exercises by lesson (NESTED!)
 - PUT    /exercises/{id}           → Update exercise
 - DELETE /exercises/{id}           → Delete exercise
 """
 
-from typing import List, Sequence
+from typing import Annotated, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .... import crud
-from ....db.session import get_db
+from ....core.cache import Payload
+from ....core.config import settings
+from ....crud.counts import CountMode
+from ....db.session import get_db, get_read_db
 from ....models import Exercise
-from ....schemas import ExerciseCreate, ExerciseResponse, ExerciseUpdate
+from ....schemas import (
+    BulkItemResult,
+    ExerciseCreate,
+    ExerciseResponse,
+    ExerciseUpdate,
+)
+from ..conditional import (
+    has_conditional_headers,
+    is_not_modified,
+    item_etag,
+    list_etag,
+    list_last_modified,
+    not_modified,
+    set_validators,
+)
+from ..ids import IDS_DESCRIPTION, ids_response, parse_ids
+from ..pagination import set_next_cursor, set_total_count
+from ..serialization import FIELDS_DESCRIPTION, exercise_fields
 
 router = APIRouter()
 
@@ -30,14 +60,45 @@ router = APIRouter()
 async def create_exercise(
     exercise: ExerciseCreate, db: AsyncSession = Depends(get_db)
 ) -> Exercise:
-    lesson = await crud.get_lesson(db, lesson_id=exercise.lesson_id)
-    if lesson is None:
+    db_exercise = await crud.create_exercise(db=db, exercise=exercise)
+    if db_exercise is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Lesson with id {exercise.lesson_id} not found",
         )
 
-    return await crud.create_exercise(db=db, exercise=exercise)
+    return db_exercise
+
+
+@router.post(
+    "/bulk",
+    response_model=List[BulkItemResult[ExerciseResponse]],
+    status_code=status.HTTP_207_MULTI_STATUS,
+    summary="Create many exercises at once",
+)
+async def create_exercises(
+    exercises: Annotated[
+        List[ExerciseCreate], Body(min_length=1, max_length=settings.BULK_MAX_ITEMS)
+    ],
+    db: AsyncSession = Depends(get_db),
+) -> List[BulkItemResult[ExerciseResponse]]:
+    db_exercises = await crud.create_exercises(db, exercises=exercises)
+    return [
+        (
+            BulkItemResult(
+                index=index,
+                created=True,
+                item=ExerciseResponse.model_validate(db_exercise),
+            )
+            if db_exercise is not None
+            else BulkItemResult(
+                index=index,
+                created=False,
+                detail=f"Lesson with id {exercise.lesson_id} not found",
+            )
+        )
+        for index, (exercise, db_exercise) in enumerate(zip(exercises, db_exercises))
+    ]
 
 
 @router.get(
@@ -46,10 +107,42 @@ async def create_exercise(
     summary="Get list of all exercises",
 )
 async def get_exercises(
-    skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_db)
-) -> Sequence[Exercise]:
-    exercises = await crud.get_exercises(db, skip=skip, limit=limit)
-    return exercises
+    request: Request,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    count: CountMode = "exact",
+    fields: Annotated[Optional[str], Query(description=FIELDS_DESCRIPTION)] = None,
+    ids: Annotated[Optional[str], Query(description=IDS_DESCRIPTION)] = None,
+    db: AsyncSession = Depends(get_read_db),
+) -> Response:
+    selected = exercise_fields.parse(fields, exercise_fields.list_default)
+    if ids is not None:
+        requested = parse_ids(ids)
+        rows = await crud.get_exercises_by_ids(
+            db, ids=requested, columns=exercise_fields.columns(selected)
+        )
+        return ids_response(request, rows, requested, exercise_fields, selected)
+
+    exercises = await crud.get_exercises(
+        db,
+        skip=skip,
+        limit=limit,
+        cursor=cursor,
+        columns=exercise_fields.columns(selected),
+    )
+    total = await crud.get_exercises_count(db, mode=count)
+    etag = list_etag(exercises, exercise_fields.variant(selected))
+    if is_not_modified(request, etag):
+        response = not_modified(etag)
+        set_total_count(response, total)
+        return response
+
+    response = exercise_fields.serializer(selected).response(exercises)
+    set_next_cursor(response, exercises, limit, "id")
+    set_validators(response, etag, list_last_modified(exercises))
+    set_total_count(response, total)
+    return response
 
 
 @router.get(
@@ -58,19 +151,41 @@ async def get_exercises(
     summary="Get exercises from specific lesson",
 )
 async def get_exercises_by_lesson(
-    lesson_id: int, skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_db)
-) -> Sequence[Exercise]:
-    lesson = await crud.get_lesson(db, lesson_id=lesson_id)
-    if lesson is None:
+    lesson_id: int,
+    request: Request,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    fields: Annotated[Optional[str], Query(description=FIELDS_DESCRIPTION)] = None,
+    db: AsyncSession = Depends(get_read_db),
+) -> Response:
+    selected = exercise_fields.parse(fields, exercise_fields.list_default)
+    exercises = await crud.get_exercises_by_lesson(
+        db,
+        lesson_id=lesson_id,
+        skip=skip,
+        limit=limit,
+        cursor=cursor,
+        columns=exercise_fields.columns(selected),
+    )
+    if exercises is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Lesson with id {lesson_id} not found",
         )
 
-    exercises = await crud.get_exercises_by_lesson(
-        db, lesson_id=lesson_id, skip=skip, limit=limit
-    )
-    return exercises
+    total = await crud.get_exercises_count(db, lesson_id=lesson_id)
+    etag = list_etag(exercises, exercise_fields.variant(selected))
+    if is_not_modified(request, etag):
+        response = not_modified(etag)
+        set_total_count(response, total)
+        return response
+
+    response = exercise_fields.serializer(selected).response(exercises)
+    set_next_cursor(response, exercises, limit, "lesson_id", "id")
+    set_validators(response, etag, list_last_modified(exercises))
+    set_total_count(response, total)
+    return response
 
 
 @router.get(
@@ -79,17 +194,53 @@ async def get_exercises_by_lesson(
     summary="Get a specific exercise",
 )
 async def get_exercise(
-    exercise_id: int, db: AsyncSession = Depends(get_db)
-) -> Exercise:
-    exercise = await crud.get_exercise(db, exercise_id=exercise_id)
+    exercise_id: int,
+    request: Request,
+    fields: Annotated[Optional[str], Query(description=FIELDS_DESCRIPTION)] = None,
+    db: AsyncSession = Depends(get_read_db),
+) -> Response:
+    selected = exercise_fields.parse(fields, exercise_fields.all)
+    variant = exercise_fields.variant(selected)
 
-    if exercise is None:
+    if has_conditional_headers(request):
+        updated_at = await crud.get_exercise_updated_at(db, exercise_id=exercise_id)
+        if updated_at is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Exercise with id {exercise_id} not found",
+            )
+
+        etag = item_etag(exercise_id, updated_at, variant)
+        if is_not_modified(request, etag, updated_at):
+            return not_modified(etag, updated_at)
+
+    if variant:
+        row = await crud.get_exercise_fields(
+            db, exercise_id=exercise_id, columns=exercise_fields.columns(selected)
+        )
+        payload = (
+            Payload(
+                exercise_fields.serializer(selected).dump_item(row), row["updated_at"]
+            )
+            if row is not None
+            else None
+        )
+    else:
+        payload = await crud.get_exercise_payload(db, exercise_id=exercise_id)
+
+    if payload is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Exercise with id {exercise_id} not found",
         )
 
-    return exercise
+    response = Response(content=payload.body, media_type="application/json")
+    set_validators(
+        response,
+        item_etag(exercise_id, payload.updated_at, variant),
+        payload.updated_at,
+    )
+    return response
 
 
 @router.put(
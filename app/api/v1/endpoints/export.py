@@ -0,0 +1,137 @@
+"""
+Catalog export as newline delimited JSON:
+- GET    /export/courses.ndjson    → All courses
+- GET    /export/lessons.ndjson    → All lessons
+- GET    /export/exercises.ndjson  → All exercises
+- GET    /export/catalog.ndjson    → Courses with nested lessons and exercises
+
+Rows are streamed from a server-side cursor in batches of
+``EXPORT_BATCH_SIZE``, so memory use does not grow with the table. The body
+is gzip encoded when the client sends ``Accept-Encoding: gzip``.
+"""
+
+import zlib
+from collections.abc import AsyncIterator, Callable, Sequence
+from datetime import datetime, timezone
+from typing import Annotated, Any, Optional
+
+from fastapi import APIRouter, Query, Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from pydantic_core import to_json
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .... import crud
+from ....core.config import settings
+from ....db.session import open_read_session
+from ....schemas import (
+    CourseResponse,
+    CourseTreeResponse,
+    ExerciseResponse,
+    LessonResponse,
+)
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+UpdatedSince = Annotated[
+    Optional[datetime],
+    Query(description="Only export rows updated at or after this timestamp"),
+]
+
+Stream = Callable[[AsyncSession, Optional[datetime], int], AsyncIterator[Sequence[Any]]]
+
+router = APIRouter()
+
+
+async def _ndjson(
+    stream: Stream, model: type[BaseModel], updated_since: Optional[datetime]
+) -> AsyncIterator[bytes]:
+    # the response is sent after the endpoint returns, so the stream owns
+    # its session instead of borrowing the request scoped one
+    async with await open_read_session() as db:
+        async for batch in stream(db, updated_since, settings.EXPORT_BATCH_SIZE):
+            yield b"".join(to_json(model.model_validate(row)) + b"\n" for row in batch)
+
+
+async def _gzip(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+    async for chunk in chunks:
+        # flush every batch so the consumer can start decoding right away
+        yield compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    yield compressor.flush()
+
+
+def _accepts_gzip(request: Request) -> bool:
+    for coding in request.headers.get("accept-encoding", "").split(","):
+        name, _, params = coding.partition(";")
+        if name.strip().lower() == "gzip":
+            _, _, quality = params.replace(" ", "").partition("q=")
+            try:
+                return float(quality or 1) > 0
+            except ValueError:
+                return False
+    return False
+
+
+def _export(
+    request: Request,
+    stream: Stream,
+    model: type[BaseModel],
+    updated_since: Optional[datetime],
+) -> StreamingResponse:
+    # the columns are naive UTC; comparing them with an aware value would fail
+    # inside the stream, after the 200 has been sent
+    if updated_since is not None and updated_since.tzinfo is not None:
+        updated_since = updated_since.astimezone(timezone.utc).replace(tzinfo=None)
+
+    body = _ndjson(stream, model, updated_since)
+    headers = {"Vary": "Accept-Encoding"}
+    if _accepts_gzip(request):
+        body = _gzip(body)
+        headers["Content-Encoding"] = "gzip"
+
+    return StreamingResponse(body, media_type=NDJSON_MEDIA_TYPE, headers=headers)
+
+
+@router.get(
+    "/courses.ndjson",
+    response_class=StreamingResponse,
+    summary="Export all courses",
+)
+async def export_courses(
+    request: Request, updated_since: UpdatedSince = None
+) -> StreamingResponse:
+    return _export(request, crud.stream_courses, CourseResponse, updated_since)
+
+
+@router.get(
+    "/lessons.ndjson",
+    response_class=StreamingResponse,
+    summary="Export all lessons",
+)
+async def export_lessons(
+    request: Request, updated_since: UpdatedSince = None
+) -> StreamingResponse:
+    return _export(request, crud.stream_lessons, LessonResponse, updated_since)
+
+
+@router.get(
+    "/exercises.ndjson",
+    response_class=StreamingResponse,
+    summary="Export all exercises",
+)
+async def export_exercises(
+    request: Request, updated_since: UpdatedSince = None
+) -> StreamingResponse:
+    return _export(request, crud.stream_exercises, ExerciseResponse, updated_since)
+
+
+@router.get(
+    "/catalog.ndjson",
+    response_class=StreamingResponse,
+    summary="Export courses with their lessons and exercises",
+)
+async def export_catalog(
+    request: Request, updated_since: UpdatedSince = None
+) -> StreamingResponse:
+    return _export(request, crud.stream_course_trees, CourseTreeResponse, updated_since)
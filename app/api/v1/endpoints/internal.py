@@ -0,0 +1,107 @@
+"""
+Operational endpoints:
+- GET    /internal/cache       → Response cache statistics
+- GET    /internal/cache/suggest → Course suggestion cache statistics
+- GET    /internal/replicas    → Read replica health
+- GET    /internal/pool        → Connection pool usage and checkout waits
+- GET    /internal/coalescing  → Reads run vs. coalesced into one in flight
+- POST   /internal/import      → Bulk import of a catalog through COPY
+"""
+
+import io
+from contextlib import ExitStack
+from typing import Any, Optional
+
+from fastapi import APIRouter, HTTPException, UploadFile, status
+
+from ....core.cache import response_cache, suggest_cache
+from ....core.config import settings
+from ....crud.coalesce import read_flights
+from ....db.pool import pool_info
+from ....db.session import engine, replicas
+from ....importer import CatalogImportError, ImportSource, import_catalog, source_format
+
+router = APIRouter()
+
+
+@router.get(
+    "/cache",
+    summary="Get response cache statistics",
+)
+async def get_cache_stats() -> dict[str, int | float | bool]:
+    return response_cache.info()
+
+
+@router.get(
+    "/cache/suggest",
+    summary="Get course suggestion cache statistics",
+)
+async def get_suggest_cache_stats() -> dict[str, int | float | bool]:
+    return suggest_cache.info()
+
+
+@router.get(
+    "/replicas",
+    summary="Get read replica health",
+)
+async def get_replicas() -> list[dict[str, str | int | bool]]:
+    return replicas.info()
+
+
+@router.get(
+    "/pool",
+    summary="Get connection pool usage and checkout wait times",
+)
+async def get_pool_stats() -> dict[str, Any]:
+    return {
+        "primary": pool_info(engine),
+        "replicas": [pool_info(replica.engine) for replica in replicas.replicas],
+    }
+
+
+@router.get(
+    "/coalescing",
+    summary="Get counts of reads run and of reads coalesced into one in flight",
+)
+async def get_coalescing_stats() -> dict[str, Any]:
+    return read_flights.info()
+
+
+def _source(stack: ExitStack, upload: Optional[UploadFile]) -> Optional[ImportSource]:
+    if upload is None:
+        return None
+    name = upload.filename or ""
+    text = stack.enter_context(io.TextIOWrapper(upload.file, "utf-8", newline=""))
+    return ImportSource(name, text, source_format(name))
+
+
+@router.post(
+    "/import",
+    summary="Import courses, lessons and exercises from NDJSON or CSV files",
+)
+async def import_files(
+    courses: Optional[UploadFile] = None,
+    lessons: Optional[UploadFile] = None,
+    exercises: Optional[UploadFile] = None,
+) -> dict[str, int | float]:
+    if courses is None and lessons is None and exercises is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No files to import",
+        )
+
+    try:
+        with ExitStack() as stack:
+            report = await import_catalog(
+                courses=_source(stack, courses),
+                lessons=_source(stack, lessons),
+                exercises=_source(stack, exercises),
+                chunk_size=settings.IMPORT_CHUNK_SIZE,
+            )
+    except CatalogImportError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Import failed, nothing was written: {exc}",
+        ) from exc
+
+    return report.as_dict()
@@ -2,22 +2,52 @@
 ================
 CRUD Operations:
 - POST   /lessons              → Create lesson
-- GET    /lessons              → List all lessons
+- POST   /lessons/bulk         → Create many lessons
+- GET    /lessons              → List all lessons, or those in ?ids=
 - GET    /lessons/{id}         → Get specific lesson
 - GET    /courses/{id}/lessons → Get lessons by course (NESTED!)
 - PUT    /lessons/{id}         → Update lesson
 - DELETE /lessons/{id}         → Delete lesson
 """
 
-from typing import List, Sequence
+from typing import Annotated, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .... import crud
-from ....db.session import get_db
+from ....core.cache import Payload
+from ....core.config import settings
+from ....crud.counts import CountMode
+from ....db.session import get_db, get_read_db
 from ....models import Lesson
-from ....schemas import LessonCreate, LessonResponse, LessonUpdate
+from ....schemas import (
+    BulkItemResult,
+    LessonCreate,
+    LessonResponse,
+    LessonUpdate,
+)
+from ..conditional import (
+    has_conditional_headers,
+    is_not_modified,
+    item_etag,
+    list_etag,
+    list_last_modified,
+    not_modified,
+    set_validators,
+)
+from ..ids import IDS_DESCRIPTION, ids_response, parse_ids
+from ..pagination import set_next_cursor, set_total_count
+from ..serialization import FIELDS_DESCRIPTION, lesson_fields
 
 router = APIRouter()
 
@@ -31,14 +61,45 @@ router = APIRouter()
 async def create_lesson(
     lesson: LessonCreate, db: AsyncSession = Depends(get_db)
 ) -> Lesson:
-    course = await crud.get_course(db, course_id=lesson.course_id)
-    if course is None:
+    db_lesson = await crud.create_lesson(db=db, lesson=lesson)
+    if db_lesson is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Course with id {lesson.course_id} not found",
         )
 
-    return await crud.create_lesson(db=db, lesson=lesson)
+    return db_lesson
+
+
+@router.post(
+    "/bulk",
+    response_model=List[BulkItemResult[LessonResponse]],
+    status_code=status.HTTP_207_MULTI_STATUS,
+    summary="Create many lessons at once",
+)
+async def create_lessons(
+    lessons: Annotated[
+        List[LessonCreate], Body(min_length=1, max_length=settings.BULK_MAX_ITEMS)
+    ],
+    db: AsyncSession = Depends(get_db),
+) -> List[BulkItemResult[LessonResponse]]:
+    db_lessons = await crud.create_lessons(db, lessons=lessons)
+    return [
+        (
+            BulkItemResult(
+                index=index,
+                created=True,
+                item=LessonResponse.model_validate(db_lesson),
+            )
+            if db_lesson is not None
+            else BulkItemResult(
+                index=index,
+                created=False,
+                detail=f"Course with id {lesson.course_id} not found",
+            )
+        )
+        for index, (lesson, db_lesson) in enumerate(zip(lessons, db_lessons))
+    ]
 
 
 @router.get(
@@ -47,10 +108,42 @@ async def create_lesson(
     summary="Get list of all lessons",
 )
 async def get_lessons(
-    skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_db)
-) -> Sequence[Lesson]:
-    lessons = await crud.get_lessons(db, skip=skip, limit=limit)
-    return lessons
+    request: Request,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    count: CountMode = "exact",
+    fields: Annotated[Optional[str], Query(description=FIELDS_DESCRIPTION)] = None,
+    ids: Annotated[Optional[str], Query(description=IDS_DESCRIPTION)] = None,
+    db: AsyncSession = Depends(get_read_db),
+) -> Response:
+    selected = lesson_fields.parse(fields, lesson_fields.list_default)
+    if ids is not None:
+        requested = parse_ids(ids)
+        rows = await crud.get_lessons_by_ids(
+            db, ids=requested, columns=lesson_fields.columns(selected)
+        )
+        return ids_response(request, rows, requested, lesson_fields, selected)
+
+    lessons = await crud.get_lessons(
+        db,
+        skip=skip,
+        limit=limit,
+        cursor=cursor,
+        columns=lesson_fields.columns(selected),
+    )
+    total = await crud.get_lessons_count(db, mode=count)
+    etag = list_etag(lessons, lesson_fields.variant(selected))
+    if is_not_modified(request, etag):
+        response = not_modified(etag)
+        set_total_count(response, total)
+        return response
+
+    response = lesson_fields.serializer(selected).response(lessons)
+    set_next_cursor(response, lessons, limit, "id")
+    set_validators(response, etag, list_last_modified(lessons))
+    set_total_count(response, total)
+    return response
 
 
 @router.get(
@@ -59,19 +152,41 @@ async def get_lessons(
     summary="Get lessons from specific course",
 )
 async def get_lessons_by_course(
-    course_id: int, skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_db)
-) -> Sequence[Lesson]:
-    course = await crud.get_course(db, course_id=course_id)
-    if course is None:
+    course_id: int,
+    request: Request,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    fields: Annotated[Optional[str], Query(description=FIELDS_DESCRIPTION)] = None,
+    db: AsyncSession = Depends(get_read_db),
+) -> Response:
+    selected = lesson_fields.parse(fields, lesson_fields.list_default)
+    lessons = await crud.get_lessons_by_course(
+        db,
+        course_id=course_id,
+        skip=skip,
+        limit=limit,
+        cursor=cursor,
+        columns=lesson_fields.columns(selected),
+    )
+    if lessons is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Course with id {course_id} not found",
         )
 
-    lessons = await crud.get_lessons_by_course(
-        db, course_id=course_id, skip=skip, limit=limit
-    )
-    return lessons
+    total = await crud.get_lessons_count(db, course_id=course_id)
+    etag = list_etag(lessons, lesson_fields.variant(selected))
+    if is_not_modified(request, etag):
+        response = not_modified(etag)
+        set_total_count(response, total)
+        return response
+
+    response = lesson_fields.serializer(selected).response(lessons)
+    set_next_cursor(response, lessons, limit, "course_id", "id")
+    set_validators(response, etag, list_last_modified(lessons))
+    set_total_count(response, total)
+    return response
 
 
 @router.get(
@@ -79,16 +194,52 @@ async def get_lessons_by_course(
     response_model=LessonResponse,
     summary="Get a specific lesson",
 )
-async def get_lesson(lesson_id: int, db: AsyncSession = Depends(get_db)) -> Lesson:
-    lesson = await crud.get_lesson(db, lesson_id=lesson_id)
+async def get_lesson(
+    lesson_id: int,
+    request: Request,
+    fields: Annotated[Optional[str], Query(description=FIELDS_DESCRIPTION)] = None,
+    db: AsyncSession = Depends(get_read_db),
+) -> Response:
+    selected = lesson_fields.parse(fields, lesson_fields.all)
+    variant = lesson_fields.variant(selected)
+
+    if has_conditional_headers(request):
+        updated_at = await crud.get_lesson_updated_at(db, lesson_id=lesson_id)
+        if updated_at is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Lesson with id {lesson_id} not found",
+            )
 
-    if lesson is None:
+        etag = item_etag(lesson_id, updated_at, variant)
+        if is_not_modified(request, etag, updated_at):
+            return not_modified(etag, updated_at)
+
+    if variant:
+        row = await crud.get_lesson_fields(
+            db, lesson_id=lesson_id, columns=lesson_fields.columns(selected)
+        )
+        payload = (
+            Payload(
+                lesson_fields.serializer(selected).dump_item(row), row["updated_at"]
+            )
+            if row is not None
+            else None
+        )
+    else:
+        payload = await crud.get_lesson_payload(db, lesson_id=lesson_id)
+
+    if payload is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Lesson with id {lesson_id} not found",
         )
 
-    return lesson
+    response = Response(content=payload.body, media_type="application/json")
+    set_validators(
+        response, item_etag(lesson_id, payload.updated_at, variant), payload.updated_at
+    )
+    return response
 
 
 @router.put(
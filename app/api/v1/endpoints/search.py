@@ -0,0 +1,53 @@
+"""
+Search:
+- GET    /search?q=            → Ranked full-text search over the catalog
+"""
+
+from typing import Annotated, List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .... import crud
+from ....db.session import get_read_db
+from ....schemas import SearchKind, SearchResult
+from ..pagination import set_next_cursor
+
+router = APIRouter()
+
+
+@router.get(
+    "",
+    response_model=List[SearchResult],
+    summary="Search courses, lessons and exercises",
+    description=(
+        "Supports quoted phrases, `or` and `-word` exclusions. Results are "
+        "ordered by relevance; follow `X-Next-Cursor` for further pages."
+    ),
+)
+async def search(
+    response: Response,
+    q: Annotated[str, Query(min_length=1, max_length=200)],
+    kind: Annotated[Optional[List[SearchKind]], Query()] = None,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_read_db),
+) -> List[SearchResult]:
+    try:
+        rows = await crud.search(db, q, kinds=kind, limit=limit, cursor=cursor)
+    except NotImplementedError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED, detail=str(exc)
+        ) from exc
+
+    set_next_cursor(response, rows, limit, "neg_rank", "kind", "id")
+    return [
+        SearchResult(
+            type=crud.SEARCH_KINDS[row["kind"]],
+            id=row["id"],
+            title=row["title"],
+            snippet=row["snippet"],
+            rank=row["rank"],
+        )
+        for row in rows
+    ]
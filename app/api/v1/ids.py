@@ -0,0 +1,75 @@
+import re
+from collections.abc import Sequence
+from typing import Any
+
+from fastapi import HTTPException, Request, Response, status
+
+from ...core.config import settings
+from ...crud.pagination import INT4_MAX, Row
+from .conditional import (
+    is_not_modified,
+    list_etag,
+    list_last_modified,
+    not_modified,
+    set_validators,
+)
+from .serialization import Fieldset
+
+MISSING_IDS_HEADER = "X-Missing-Ids"
+
+_DIGITS = re.compile(r"[0-9]+")
+
+IDS_DESCRIPTION = (
+    "Comma separated ids, e.g. `7,3,12`, fetched in one query. Rows come back "
+    "in this order, paging and filters are ignored, and ids without a row are "
+    f"listed in the `{MISSING_IDS_HEADER}` header instead of failing the call."
+)
+
+
+def parse_ids(ids: str) -> list[int]:
+    """Validate ``?ids=``; a repeated id keeps the place of its first occurrence."""
+    # plain digits only: int() would also take " 7", "+3" and "1_000"
+    parts = [value for value in ids.split(",") if value]
+    if not all(_DIGITS.fullmatch(value) for value in parts):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="ids must be comma separated integers",
+        )
+    values = [int(value) for value in parts]
+
+    # ids are INTEGER columns; anything outside them cannot be bound
+    if not all(0 < value <= INT4_MAX for value in values):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"ids must be between 1 and {INT4_MAX}",
+        )
+
+    unique = list(dict.fromkeys(values))
+    if not unique or len(unique) > settings.IDS_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Between 1 and {settings.IDS_MAX_ITEMS} ids can be requested",
+        )
+    return unique
+
+
+def ids_response(
+    request: Request,
+    rows: Sequence[Row],
+    ids: Sequence[int],
+    fieldset: Fieldset[Any],
+    selected: tuple[str, ...],
+) -> Response:
+    """List response of a multi-get, conditional like the other lists."""
+    etag = list_etag(rows, fieldset.variant(selected))
+    if is_not_modified(request, etag):
+        response = not_modified(etag)
+    else:
+        response = fieldset.serializer(selected).response(rows)
+        set_validators(response, etag, list_last_modified(rows))
+
+    found = {row["id"] for row in rows}
+    missing = [id_ for id_ in ids if id_ not in found]
+    if missing:
+        response.headers[MISSING_IDS_HEADER] = ",".join(map(str, missing))
+    return response
@@ -0,0 +1,25 @@
+from collections.abc import Sequence
+
+from fastapi import Response
+
+from ...crud.pagination import Row, next_cursor
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+TOTAL_COUNT_HEADER = "X-Total-Count"
+
+
+def set_next_cursor(
+    response: Response, rows: Sequence[Row], limit: int, *key: str
+) -> None:
+    """Expose the cursor of the following page, if there is one."""
+    cursor = next_cursor(rows, limit, *key)
+    if cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = cursor
+
+
+def set_total_count(response: Response, total: int) -> None:
+    """
+    Expose the number of rows across all pages. It is also sent on 304
+    responses, from which caches refresh the headers they stored.
+    """
+    response.headers[TOTAL_COUNT_HEADER] = str(total)
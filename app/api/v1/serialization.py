@@ -0,0 +1,124 @@
+"""
+Fast JSON path for list responses.
+
+Returning ORM objects from an endpoint makes FastAPI validate them through
+``from_attributes``, dump them to Python objects, run ``jsonable_encoder``
+and finally encode with the stdlib ``json`` module. List endpoints instead
+hand plain row mappings to a pre-built ``TypeAdapter``, which validates
+them once and dumps straight to JSON bytes in pydantic-core.
+
+Responses can be narrowed to a sparse fieldset with ``?fields=id,title``.
+Large text columns are left out of list responses unless requested.
+"""
+
+from collections.abc import Sequence
+from typing import Any, Generic, List, Optional, TypeVar
+
+from fastapi import HTTPException, Response, status
+from pydantic import BaseModel, TypeAdapter, create_model
+
+from ...crud.pagination import Row
+from ...schemas import (
+    AuthorCourseResponse,
+    CourseResponse,
+    ExerciseResponse,
+    LessonResponse,
+)
+
+M = TypeVar("M", bound=BaseModel)
+
+FIELDS_DESCRIPTION = (
+    "Comma separated fields to return, e.g. `id,title`. "
+    "List endpoints omit large text fields unless they are requested."
+)
+
+
+class ListSerializer(Generic[M]):
+    def __init__(self, model: type[M]) -> None:
+        self.model = model
+        self._adapter: TypeAdapter[List[M]] = TypeAdapter(List[model])  # type: ignore[valid-type]
+        self._item_adapter: TypeAdapter[M] = TypeAdapter(model)
+
+    def dump(self, rows: Sequence[Row]) -> bytes:
+        return self._adapter.dump_json(self._adapter.validate_python(rows))
+
+    def dump_item(self, row: Row) -> bytes:
+        return self._item_adapter.dump_json(self._item_adapter.validate_python(row))
+
+    def response(self, rows: Sequence[Row]) -> Response:
+        return Response(content=self.dump(rows), media_type="application/json")
+
+
+class Fieldset(Generic[M]):
+    """
+    Sparse fieldsets of one response model.
+
+    ``deferred`` fields are omitted from list responses unless requested.
+    ``required`` columns are always selected (pagination keys, ETags) even
+    when they are not part of the response.
+    """
+
+    def __init__(
+        self,
+        model: type[M],
+        deferred: Sequence[str] = (),
+        required: Sequence[str] = (),
+    ) -> None:
+        self.model = model
+        self.all = tuple(model.model_fields)
+        self.list_default = tuple(name for name in self.all if name not in deferred)
+        self.required = ("id", "updated_at", *required)
+        self._serializers: dict[tuple[str, ...], ListSerializer[Any]] = {}
+
+    def parse(self, fields: Optional[str], default: tuple[str, ...]) -> tuple[str, ...]:
+        """Validate ``?fields=`` and return the fields in model order."""
+        if fields is None:
+            return default
+
+        requested = {name.strip() for name in fields.split(",") if name.strip()}
+        unknown = sorted(requested.difference(self.all))
+        if unknown or not requested:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=(
+                    f"Unknown fields: {', '.join(unknown)}. "
+                    if unknown
+                    else "No fields requested. "
+                )
+                + f"Allowed fields: {', '.join(self.all)}",
+            )
+
+        return tuple(name for name in self.all if name in requested)
+
+    def columns(self, selected: tuple[str, ...]) -> tuple[str, ...]:
+        """Columns to SELECT for ``selected`` fields."""
+        return (*selected, *(name for name in self.required if name not in selected))
+
+    def variant(self, selected: tuple[str, ...]) -> str:
+        """ETag variant of ``selected``; empty for the full representation."""
+        return "" if selected == self.all else ",".join(selected)
+
+    def serializer(self, selected: tuple[str, ...]) -> ListSerializer[Any]:
+        serializer = self._serializers.get(selected)
+        if serializer is None:
+            model = self.model
+            if selected != self.all:
+                model = create_model(  # type: ignore[call-overload]
+                    f"{self.model.__name__}Fields",
+                    **{
+                        name: (info.annotation, info)
+                        for name, info in self.model.model_fields.items()
+                        if name in selected
+                    },
+                )
+            serializer = self._serializers[selected] = ListSerializer(model)
+        return serializer
+
+
+course_fields = Fieldset(CourseResponse)
+lesson_fields = Fieldset(LessonResponse, deferred=("content",), required=("course_id",))
+exercise_fields = Fieldset(
+    ExerciseResponse, deferred=("content", "exercise"), required=("lesson_id",)
+)
+
+author_course_list = ListSerializer(AuthorCourseResponse)
@@ -0,0 +1,41 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ... import crud
+from .serialization import course_fields, exercise_fields, lesson_fields
+
+# no row has id 0, the queries run without returning or caching anything
+MISSING = 0
+
+
+async def prepare_hot_statements(db: AsyncSession) -> None:
+    """Run the queries of the busiest endpoints once, as the endpoints build them."""
+    course_columns = course_fields.columns(course_fields.list_default)
+    lesson_columns = lesson_fields.columns(lesson_fields.list_default)
+    exercise_columns = exercise_fields.columns(exercise_fields.list_default)
+
+    await crud.get_courses(db, limit=1, columns=course_columns)
+    await crud.get_courses_count(db)
+    await crud.get_courses_by_ids(db, ids=[MISSING], columns=course_columns)
+    await crud.get_course_updated_at(db, course_id=MISSING)
+    await crud.get_course_payload(db, course_id=MISSING)
+    await crud.get_course_tree(db, course_id=MISSING)
+    await crud.get_author_courses(db, author_id=MISSING, limit=1)
+    await crud.get_courses_count(db, author_id=MISSING)
+
+    await crud.get_lessons(db, limit=1, columns=lesson_columns)
+    await crud.get_lessons_count(db)
+    await crud.get_lessons_by_ids(db, ids=[MISSING], columns=lesson_columns)
+    await crud.get_lessons_by_course(
+        db, course_id=MISSING, limit=1, columns=lesson_columns
+    )
+    await crud.get_lessons_count(db, course_id=MISSING)
+    await crud.get_lesson_payload(db, lesson_id=MISSING)
+
+    await crud.get_exercises(db, limit=1, columns=exercise_columns)
+    await crud.get_exercises_count(db)
+    await crud.get_exercises_by_ids(db, ids=[MISSING], columns=exercise_columns)
+    await crud.get_exercises_by_lesson(
+        db, lesson_id=MISSING, limit=1, columns=exercise_columns
+    )
+    await crud.get_exercises_count(db, lesson_id=MISSING)
+    await crud.get_exercise_payload(db, exercise_id=MISSING)
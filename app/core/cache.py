@@ -0,0 +1,147 @@
+"""
+Bounded in-process LRU cache with per-entry TTL.
+
+Entries may be registered under parent keys (e.g. a lesson under its
+course) so that invalidating a parent also drops everything cached
+beneath it, mirroring ON DELETE CASCADE in the database. The links are
+kept whether or not the parent itself is cached, so an entry is
+registered under every ancestor that can be deleted (an exercise under
+its lesson and its course), not only under the nearest one.
+
+The cache is per process: with several workers each one holds its own
+copy, and the TTL bounds how long a worker can serve a stale entry after
+a write handled by another worker.
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, Sequence
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Generic, NamedTuple, Optional, TypeVar
+
+from .config import settings
+
+V = TypeVar("V")
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+
+class _Entry(NamedTuple, Generic[V]):
+    value: V
+    expires_at: float
+    parents: tuple[Hashable, ...]
+
+
+class LRUCache(Generic[V]):
+    def __init__(self, maxsize: int, ttl: float, enabled: bool = True) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.enabled = enabled and maxsize > 0
+        self.stats = CacheStats()
+        self._entries: OrderedDict[Hashable, _Entry[V]] = OrderedDict()
+        self._children: dict[Hashable, set[Hashable]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[V]:
+        if not self.enabled:
+            return None
+
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+
+        if entry.expires_at <= time.monotonic():
+            self._remove(key)
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return entry.value
+
+    def set(self, key: Hashable, value: V, parents: Sequence[Hashable] = ()) -> None:
+        if not self.enabled:
+            return
+
+        if key in self._entries:
+            self._remove(key, cascade=False)
+
+        self._entries[key] = _Entry(value, time.monotonic() + self.ttl, tuple(parents))
+        for parent in parents:
+            self._children.setdefault(parent, set()).add(key)
+
+        while len(self._entries) > self.maxsize:
+            oldest = next(iter(self._entries))
+            self._remove(oldest, cascade=False)
+            self.stats.evictions += 1
+
+    def discard(self, key: Hashable) -> None:
+        """Drop a single entry, e.g. after the row behind it was updated."""
+        if key in self._entries:
+            self._remove(key, cascade=False)
+            self.stats.invalidations += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop an entry together with everything cached under it."""
+        if key in self._entries or key in self._children:
+            self._remove(key)
+            self.stats.invalidations += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._children.clear()
+
+    def info(self) -> dict[str, int | float | bool]:
+        return {
+            "enabled": self.enabled,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            **asdict(self.stats),
+        }
+
+    def _remove(self, key: Hashable, cascade: bool = True) -> None:
+        entry = self._entries.pop(key, None)
+        for parent in entry.parents if entry is not None else ():
+            siblings = self._children.get(parent)
+            if siblings is not None:
+                siblings.discard(key)
+                if not siblings:
+                    del self._children[parent]
+
+        if cascade:
+            for child in self._children.pop(key, set()):
+                self._remove(child)
+
+
+class Payload(NamedTuple):
+    """Serialized response body with the updated_at it was rendered from."""
+
+    body: bytes
+    updated_at: datetime
+
+
+response_cache: LRUCache[Payload] = LRUCache(
+    maxsize=settings.CACHE_MAX_ENTRIES,
+    ttl=settings.CACHE_TTL_SECONDS,
+    enabled=settings.CACHE_ENABLED,
+)
+
+# serialized suggestions for short title prefixes, which match the most rows
+suggest_cache: LRUCache[bytes] = LRUCache(
+    maxsize=settings.SUGGEST_CACHE_MAX_ENTRIES,
+    ttl=settings.SUGGEST_CACHE_TTL_SECONDS,
+    enabled=settings.CACHE_ENABLED,
+)
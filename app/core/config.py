@@ -14,14 +14,78 @@ class Settings(BaseSettings):
     DB_PASSWORD: str | None = None
     DB_HOST: str | None = None
     DB_PORT: int | None = None
+    # full DSN of the primary, takes precedence over the DB_* parts
+    DB_URL: str | None = None
+    # comma separated DSNs of read replicas, empty to read from the primary
+    DB_REPLICA_URLS: str = ""
+    # per engine, so each replica gets a pool of its own
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    # seconds before a connection is replaced, -1 to keep it
+    DB_POOL_RECYCLE: int = -1
+    DB_POOL_PRE_PING: bool = True
+    # connections all workers of app.server may open to one database, below
+    # its max_connections with room for migrations and admin sessions
+    DB_MAX_CONNECTIONS: int = 90
+    # connections opened and prepared at startup, per engine
+    DB_POOL_WARMUP: int = 5
+    # refuse to start unless the database is at the Alembic head revision
+    SCHEMA_CHECK: bool = True
+    # prepared statements kept per asyncpg connection, 0 behind PgBouncer
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    REPLICA_RETRY_SECONDS: float = 30.0
+    # a replica is probed before use when it was last checked longer ago
+    REPLICA_CHECK_SECONDS: float = 5.0
+    READ_YOUR_WRITES_SECONDS: int = 5
+
+    CACHE_ENABLED: bool = True
+    CACHE_MAX_ENTRIES: int = 2048
+    CACHE_TTL_SECONDS: float = 60.0
+    # concurrent identical reads of read-only handlers share one query
+    COALESCE_READS: bool = True
+
+    SUGGEST_LIMIT: int = 10
+    SUGGEST_CACHE_MAX_PREFIX: int = 3
+    SUGGEST_CACHE_MAX_ENTRIES: int = 1024
+    SUGGEST_CACHE_TTL_SECONDS: float = 30.0
+
+    METRICS_ENABLED: bool = True
+
+    # app.server: worker processes, 0 for one per available CPU
+    WORKERS: int = 0
+    # seconds /ready fails before a SIGTERM stops the server, then the most
+    # it waits for requests in flight
+    SHUTDOWN_DRAIN_SECONDS: float = 5.0
+    SHUTDOWN_TIMEOUT_SECONDS: int = 30
+
+    # queries allowed per request, 0 for no limit; QUERY_BUDGETS overrides
+    # it per route, e.g. {"GET /api/v1/courses/{course_id}": 2}
+    QUERY_BUDGET: int = 0
+    QUERY_BUDGETS: dict[str, int] = {}
+    # raise instead of logging when a request goes over its budget
+    QUERY_BUDGET_STRICT: bool = False
+
+    BULK_MAX_ITEMS: int = 1000
+    # ids a single ?ids= multi-get may ask for
+    IDS_MAX_ITEMS: int = 1000
+
+    EXPORT_BATCH_SIZE: int = 1000
+    IMPORT_CHUNK_SIZE: int = 5000
 
     @property
     def DATABASE_URL(self) -> str:
+        if self.DB_URL:
+            return self.DB_URL
         return (
             f"postgresql+asyncpg://{self.DB_USER}:{self.DB_PASSWORD}"
             f"@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
         )
 
+    @property
+    def REPLICA_URLS(self) -> list[str]:
+        return [url.strip() for url in self.DB_REPLICA_URLS.split(",") if url.strip()]
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
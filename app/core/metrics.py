@@ -0,0 +1,253 @@
+"""
+In-process metrics, exposed in the Prometheus text format.
+
+``MetricsMiddleware`` records per-route latency, status counts and the
+number of requests in flight. DB time and query counts are attributed to
+the request running them through cursor events (``track_queries``) and a
+context variable. Everything runs on the event loop thread, so plain
+integer updates need no locks. Label strings are rendered once per route.
+
+Values live in the worker that records them; with several workers each one
+reports its own, and Prometheus should scrape every worker.
+"""
+
+import time
+from bisect import bisect_left
+from collections.abc import Iterator, Sequence
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Optional
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import Engine, event
+from sqlalchemy.engine import ExecutionContext
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# seconds, from sub-millisecond pool checkouts to slow requests
+LATENCY_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class Histogram:
+    """Counts of observed values per bucket, each bucket by its upper bound."""
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        # the last slot counts values above the largest bound
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> list[tuple[float, int]]:
+        """``(upper bound, values at or below it)`` pairs, ending with +Inf."""
+        pairs = []
+        total = 0
+        for bound, count in zip((*self.buckets, float("inf")), self.counts):
+            total += count
+            pairs.append((bound, total))
+        return pairs
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the ``q`` quantile."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        for bound, total in self.cumulative():
+            if total >= rank:
+                return bound
+        return float("inf")
+
+    def info(self) -> dict[str, float | int | dict[str, int]]:
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "buckets": {
+                ("+Inf" if bound == float("inf") else str(bound)): total
+                for bound, total in self.cumulative()
+            },
+        }
+
+
+def render_histogram(name: str, labels: str, histogram: Histogram) -> Iterator[str]:
+    prefix = f"{labels}," if labels else ""
+    for bound, total in histogram.cumulative():
+        le = "+Inf" if bound == float("inf") else repr(bound)
+        yield f'{name}_bucket{{{prefix}le="{le}"}} {total}'
+    yield f"{name}_sum{{{labels}}} {histogram.sum}"
+    yield f"{name}_count{{{labels}}} {histogram.count}"
+
+
+@dataclass
+class QueryTiming:
+    queries: int = 0
+    seconds: float = 0.0
+
+
+# set by the middleware for each request, None outside of one
+current_queries: ContextVar[Optional[QueryTiming]] = ContextVar(
+    "current_queries", default=None
+)
+
+
+def track_queries(engine: Engine) -> None:
+    """Add the time of every cursor execution to the current request."""
+    # start time per execution context: a statement that raises never reaches
+    # after_cursor_execute, and its entry goes away with the context
+    started_at: WeakKeyDictionary[ExecutionContext, float] = WeakKeyDictionary()
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        *args: Any,
+    ) -> None:
+        if context is not None:
+            started_at[context] = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        *args: Any,
+    ) -> None:
+        started = started_at.pop(context, None) if context is not None else None
+        timing = current_queries.get()
+        if started is not None and timing is not None:
+            timing.queries += 1
+            timing.seconds += time.perf_counter() - started
+
+
+class RouteMetrics:
+    __slots__ = ("labels", "statuses", "latency", "db_time", "queries")
+
+    def __init__(self, method: str, route: str) -> None:
+        self.labels = f'method="{method}",route="{route}"'
+        # status code -> (rendered labels, count)
+        self.statuses: dict[int, list[Any]] = {}
+        self.latency = Histogram()
+        self.db_time = Histogram()
+        self.queries = 0
+
+    def observe(self, status: int, seconds: float, timing: QueryTiming) -> None:
+        counter = self.statuses.get(status)
+        if counter is None:
+            counter = self.statuses[status] = [f'{self.labels},status="{status}"', 0]
+        counter[1] += 1
+        self.latency.observe(seconds)
+        self.db_time.observe(timing.seconds)
+        self.queries += timing.queries
+
+
+# requests that matched no route share one label set, so that scanners
+# probing random paths cannot grow the number of series
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class RequestMetrics:
+    def __init__(self) -> None:
+        self.routes: dict[tuple[str, str], RouteMetrics] = {}
+        self.in_flight = 0
+
+    def route(self, method: str, route: str) -> RouteMetrics:
+        metrics = self.routes.get((method, route))
+        if metrics is None:
+            metrics = self.routes[method, route] = RouteMetrics(method, route)
+        return metrics
+
+    def render(self) -> Iterator[str]:
+        routes = list(self.routes.values())
+
+        yield "# HELP http_requests_total Requests handled, by route and status."
+        yield "# TYPE http_requests_total counter"
+        for metrics in routes:
+            for labels, count in metrics.statuses.values():
+                yield f"http_requests_total{{{labels}}} {count}"
+
+        yield "# HELP http_request_duration_seconds Request latency."
+        yield "# TYPE http_request_duration_seconds histogram"
+        for metrics in routes:
+            yield from render_histogram(
+                "http_request_duration_seconds", metrics.labels, metrics.latency
+            )
+
+        yield "# HELP http_requests_in_flight Requests being handled."
+        yield "# TYPE http_requests_in_flight gauge"
+        yield f"http_requests_in_flight {self.in_flight}"
+
+        yield "# HELP http_request_db_seconds Database time spent per request."
+        yield "# TYPE http_request_db_seconds histogram"
+        for metrics in routes:
+            yield from render_histogram(
+                "http_request_db_seconds", metrics.labels, metrics.db_time
+            )
+
+        yield "# HELP http_request_db_queries_total Queries run by requests."
+        yield "# TYPE http_request_db_queries_total counter"
+        for metrics in routes:
+            yield f"http_request_db_queries_total{{{metrics.labels}}} {metrics.queries}"
+
+
+request_metrics = RequestMetrics()
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware, cheaper than BaseHTTPMiddleware per request."""
+
+    def __init__(self, app: ASGIApp, metrics: RequestMetrics = request_metrics) -> None:
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        timing = QueryTiming()
+        token = current_queries.set(timing)
+        self.metrics.in_flight += 1
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            self.metrics.in_flight -= 1
+            current_queries.reset(token)
+            # the router stores the matched route in the shared scope
+            route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+            self.metrics.route(scope["method"], route).observe(status, elapsed, timing)
@@ -0,0 +1,98 @@
+"""
+Single-flight execution of concurrent identical calls.
+
+The first caller of a key runs the call; callers arriving with the same
+key while it is in flight await its outcome instead of running it again,
+and the key is forgotten as soon as the call finishes. Results are shared
+as they are, so they must not be mutated by whoever receives them.
+
+Like the response cache this is per process, and everything runs on the
+event loop thread, so no locks are needed.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Iterator
+from dataclasses import asdict, dataclass
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class FlightStats:
+    # calls that ran, and calls that awaited one of those instead
+    executed: int = 0
+    coalesced: int = 0
+
+
+class _LeaderCancelled(Exception):
+    """The call was cancelled with its caller; the followers run it again."""
+
+
+def _consume(future: "asyncio.Future[Any]") -> None:
+    # keeps asyncio from logging a failure that no follower awaited
+    if not future.cancelled():
+        future.exception()
+
+
+class SingleFlight:
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self.stats: dict[str, FlightStats] = {}
+        self._calls: dict[Hashable, asyncio.Future[Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do(self, name: str, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        """
+        Result of ``call()``, or of the identical call already in flight
+        under ``key``. ``name`` groups the statistics, e.g. by function.
+        """
+        if not self.enabled:
+            return await call()
+
+        stats = self.stats.get(name)
+        if stats is None:
+            stats = self.stats[name] = FlightStats()
+
+        while (future := self._calls.get(key)) is not None:
+            stats.coalesced += 1
+            try:
+                # shielded, so a follower going away does not cancel the call
+                return await asyncio.shield(future)
+            except _LeaderCancelled:
+                stats.coalesced -= 1
+
+        future = asyncio.get_running_loop().create_future()
+        future.add_done_callback(_consume)
+        self._calls[key] = future
+        stats.executed += 1
+        try:
+            result = await call()
+        except asyncio.CancelledError:
+            future.set_exception(_LeaderCancelled())
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
+
+    def info(self) -> dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "in_flight": len(self._calls),
+            "calls": {name: asdict(stats) for name, stats in self.stats.items()},
+        }
+
+    def render(self, metric: str) -> Iterator[str]:
+        """Counters in the Prometheus text format, by function and outcome."""
+        yield f"# HELP {metric} Calls run, or coalesced into one already running."
+        yield f"# TYPE {metric} counter"
+        for name, stats in self.stats.items():
+            yield f'{metric}{{function="{name}",result="executed"}} {stats.executed}'
+            yield f'{metric}{{function="{name}",result="coalesced"}} {stats.coalesced}'
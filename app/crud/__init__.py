@@ -1,9 +1,18 @@
 # Course CRUD operations
 from ..crud.course import (
     create_course,
+    create_courses,
     delete_course,
+    get_author_courses,
     get_course,
+    get_course_fields,
+    get_course_payload,
+    get_course_suggestions,
+    get_course_tree,
+    get_course_tree_payload,
+    get_course_updated_at,
     get_courses,
+    get_courses_by_ids,
     get_courses_count,
     update_course,
 )
@@ -11,48 +20,96 @@ from ..crud.course import (
 # Exercise CRUD operations
 from ..crud.exercise import (
     create_exercise,
+    create_exercises,
     delete_exercise,
     get_exercise,
+    get_exercise_fields,
+    get_exercise_payload,
+    get_exercise_updated_at,
     get_exercises,
+    get_exercises_by_ids,
     get_exercises_by_lesson,
     get_exercises_count,
     update_exercise,
 )
 
+# Catalog export streams
+from ..crud.export import (
+    stream_course_trees,
+    stream_courses,
+    stream_exercises,
+    stream_lessons,
+)
+
 # Lesson CRUD operations
 from ..crud.lesson import (
     create_lesson,
+    create_lessons,
     delete_lesson,
     get_lesson,
+    get_lesson_fields,
+    get_lesson_payload,
+    get_lesson_updated_at,
     get_lessons,
     get_lessons_by_course,
+    get_lessons_by_ids,
     get_lessons_count,
     update_lesson,
 )
 
+# Full-text search
+from ..crud.search import SEARCH_KINDS, search
+
 # Export all CRUD functions
 __all__ = [
     # Course operations
     "create_course",
+    "create_courses",
     "get_course",
+    "get_course_fields",
+    "get_course_payload",
+    "get_course_suggestions",
+    "get_course_updated_at",
+    "get_course_tree",
+    "get_course_tree_payload",
     "get_courses",
+    "get_courses_by_ids",
     "get_courses_count",
+    "get_author_courses",
     "update_course",
     "delete_course",
     # Lesson operations
     "create_lesson",
+    "create_lessons",
     "get_lesson",
+    "get_lesson_fields",
+    "get_lesson_payload",
+    "get_lesson_updated_at",
     "get_lessons",
+    "get_lessons_by_ids",
     "get_lessons_by_course",
     "get_lessons_count",
     "update_lesson",
     "delete_lesson",
     # Exercise operations
     "create_exercise",
+    "create_exercises",
     "get_exercise",
+    "get_exercise_fields",
+    "get_exercise_payload",
+    "get_exercise_updated_at",
     "get_exercises",
+    "get_exercises_by_ids",
     "get_exercises_by_lesson",
     "get_exercises_count",
     "update_exercise",
     "delete_exercise",
+    # Export streams
+    "stream_courses",
+    "stream_lessons",
+    "stream_exercises",
+    "stream_course_trees",
+    # Search
+    "SEARCH_KINDS",
+    "search",
 ]
@@ -0,0 +1,51 @@
+import functools
+import inspect
+from collections.abc import Awaitable, Callable
+from typing import Any, Concatenate, ParamSpec, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.config import settings
+from ..core.singleflight import SingleFlight
+from ..db.session import READ_ONLY, bypasses_cache
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+read_flights = SingleFlight(enabled=settings.COALESCE_READS)
+
+
+def _hashable(value: Any) -> Any:
+    # column lists come from query parameters
+    if isinstance(value, (list, tuple)):
+        return tuple(value)
+    return value
+
+
+def coalesce(
+    fn: Callable[Concatenate[AsyncSession, P], Awaitable[T]],
+) -> Callable[Concatenate[AsyncSession, P], Awaitable[T]]:
+    """
+    Share one execution of ``fn`` among concurrent calls with the same
+    arguments, so a burst of requests for the same row runs one query.
+
+    Only sessions marked read-only by ``get_read_db`` take part: a session
+    with writes of its own must see them, and must not show them to others.
+    Calls are keyed by the session's engine and its cache bypass too, so a
+    request reading its own writes from the primary never receives a
+    replica's result, nor one served from the response cache.
+    """
+    signature = inspect.signature(fn)
+
+    @functools.wraps(fn)
+    async def wrapper(db: AsyncSession, *args: P.args, **kwargs: P.kwargs) -> T:
+        if not db.info.get(READ_ONLY):
+            return await fn(db, *args, **kwargs)
+
+        bound = signature.bind(db, *args, **kwargs)
+        bound.apply_defaults()
+        arguments = tuple(_hashable(value) for value in bound.arguments.values())
+        key = (fn.__name__, db.bind, bypasses_cache(db), *arguments[1:])
+        return await read_flights.do(fn.__name__, key, lambda: fn(db, *args, **kwargs))
+
+    return wrapper
@@ -0,0 +1,20 @@
+from collections.abc import Sequence
+from typing import Any, Optional
+
+from sqlalchemy import Column
+
+
+def table_columns(
+    model: Any, names: Optional[Sequence[str]] = None
+) -> list[Column[Any]]:
+    """
+    Columns of ``model``'s table, narrowed to ``names`` when given.
+
+    Lists are read as row mappings straight from the table, so sparse
+    fieldsets narrow the SELECT list itself instead of deferring ORM
+    attributes with ``load_only``/``defer``.
+    """
+    table = model.__table__
+    if names is None:
+        return list(table.columns)
+    return [table.c[name] for name in names]
@@ -0,0 +1,151 @@
+"""
+Row counts without ``count(*)`` scans.
+
+Exact counts live in the ``counters`` table and are adjusted by the create
+and delete operations in the same transaction as the rows themselves.
+Approximate totals come from the planner statistics in ``pg_class``, which
+cost nothing to read but are only as fresh as the last VACUUM/ANALYZE.
+"""
+
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from typing import Any, Literal, Union
+
+from sqlalchemy import Select, and_, delete, func, insert, literal, select, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from ..models import Counter, Course, Exercise, Lesson
+
+CountMode = Literal["exact", "approximate"]
+
+COURSES = "courses"
+LESSONS = "lessons"
+EXERCISES = "exercises"
+AUTHOR_COURSES = "author_courses"
+COURSE_LESSONS = "course_lessons"
+LESSON_EXERCISES = "lesson_exercises"
+
+# (scope, scope_id) -> change of the count
+Deltas = Mapping[tuple[str, int], int]
+
+_INSERTS: dict[str, Callable[[Any], Any]] = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+def _upsert(dialect: str) -> Any:
+    """INSERT ... ON CONFLICT DO UPDATE adding to the existing value."""
+    try:
+        stmt = _INSERTS[dialect](Counter)
+    except KeyError:
+        raise NotImplementedError(f"Counters are not supported on {dialect}") from None
+    return stmt
+
+
+def _on_conflict_add(stmt: Any) -> Any:
+    return stmt.on_conflict_do_update(
+        index_elements=[Counter.scope, Counter.scope_id],
+        set_={"value": Counter.value + stmt.excluded.value},
+    )
+
+
+async def add_counts(db: AsyncSession, deltas: Deltas) -> None:
+    rows = [
+        {"scope": scope, "scope_id": scope_id, "value": value}
+        # a fixed order keeps concurrent writers from deadlocking on the rows
+        for (scope, scope_id), value in sorted(deltas.items())
+        if value
+    ]
+    if not rows:
+        return
+
+    stmt = _upsert(db.get_bind().dialect.name).values(rows)
+    await db.execute(_on_conflict_add(stmt))
+
+
+async def add_counts_from(conn: AsyncConnection, source: Select[Any]) -> None:
+    """Add ``(scope, scope_id, value)`` rows produced by ``source``."""
+    stmt = _upsert(conn.dialect.name).from_select(
+        ["scope", "scope_id", "value"], source
+    )
+    await conn.execute(_on_conflict_add(stmt))
+
+
+async def drop_counts(
+    db: AsyncSession, scope: str, scope_ids: Union[Iterable[int], Select[Any]]
+) -> int:
+    """Remove per-parent counters, e.g. before the parents are deleted."""
+    stmt = (
+        delete(Counter)
+        .where(Counter.scope == scope, Counter.scope_id.in_(scope_ids))
+        .returning(Counter.value)
+    )
+    result = await db.scalars(stmt)
+    return sum(result.all())
+
+
+async def get_count(db: AsyncSession, scope: str, scope_id: int = 0) -> int:
+    stmt = select(Counter.value).where(
+        Counter.scope == scope, Counter.scope_id == scope_id
+    )
+    return await db.scalar(stmt) or 0
+
+
+async def get_course_child_counts(
+    db: AsyncSession, course_ids: Sequence[int]
+) -> dict[int, tuple[int, int]]:
+    """
+    ``(lessons, exercises)`` per course in one grouped query: the lessons of
+    all courses joined to their per-lesson exercise counters.
+    """
+    if not course_ids:
+        return {}
+
+    stmt = (
+        select(
+            Lesson.course_id,
+            func.count(Lesson.id),
+            func.coalesce(func.sum(Counter.value), 0),
+        )
+        .outerjoin(
+            Counter,
+            and_(Counter.scope == LESSON_EXERCISES, Counter.scope_id == Lesson.id),
+        )
+        .where(Lesson.course_id.in_(course_ids))
+        .group_by(Lesson.course_id)
+    )
+    result = await db.execute(stmt)
+    return {
+        course_id: (lessons, int(exercises))
+        for course_id, lessons, exercises in result.all()
+    }
+
+
+async def get_total(db: AsyncSession, table: str, mode: CountMode = "exact") -> int:
+    if mode == "approximate" and db.get_bind().dialect.name == "postgresql":
+        stmt = text(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table AS regclass)"
+        )
+        estimate = await db.scalar(stmt, {"table": table})
+        # -1 until the table has been vacuumed or analyzed for the first time
+        if estimate is not None and estimate >= 0:
+            return int(estimate)
+
+    return await get_count(db, table)
+
+
+async def recount(conn: AsyncConnection) -> None:
+    """Rebuild all counters from the tables, e.g. after loading rows directly."""
+    await conn.execute(delete(Counter))
+    columns = ["scope", "scope_id", "value"]
+    for scope, model in ((COURSES, Course), (LESSONS, Lesson), (EXERCISES, Exercise)):
+        totals = select(literal(scope), literal(0), func.count()).select_from(model)
+        await conn.execute(insert(Counter).from_select(columns, totals))
+    for scope, parent_id in (
+        (AUTHOR_COURSES, Course.author_id),
+        (COURSE_LESSONS, Lesson.course_id),
+        (LESSON_EXERCISES, Exercise.lesson_id),
+    ):
+        per_parent = select(literal(scope), parent_id, func.count()).group_by(parent_id)
+        await conn.execute(insert(Counter).from_select(columns, per_parent))
@@ -1,62 +1,298 @@
+from collections import Counter
 from collections.abc import Sequence
-from typing import Optional
+from datetime import datetime
+from typing import Any, Optional
 
-from sqlalchemy import func, select
+from pydantic_core import to_json
+from sqlalchemy import RowMapping, delete, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
-from ..models import Course
-from ..schemas import CourseCreate, CourseUpdate
+from ..core.cache import Payload, response_cache, suggest_cache
+from ..core.config import settings
+from ..db.session import bypasses_cache
+from ..models import Course, Lesson
+from ..schemas import (
+    CourseCreate,
+    CourseResponse,
+    CourseSuggestion,
+    CourseTreeResponse,
+    CourseUpdate,
+)
+from .coalesce import coalesce
+from .columns import table_columns
+from .counts import (
+    AUTHOR_COURSES,
+    COURSE_LESSONS,
+    COURSES,
+    EXERCISES,
+    LESSON_EXERCISES,
+    LESSONS,
+    CountMode,
+    add_counts,
+    drop_counts,
+    get_count,
+    get_course_child_counts,
+    get_total,
+)
+from .ids import id_in, in_request_order
+from .pagination import paginate
 
 
 async def create_course(db: AsyncSession, course: CourseCreate) -> Course:
     db_course = Course(**course.model_dump())
     db.add(db_course)
+    await add_counts(db, {(COURSES, 0): 1, (AUTHOR_COURSES, course.author_id): 1})
     await db.commit()
+    suggest_cache.clear()
     await db.refresh(db_course)
     return db_course
 
 
+async def create_courses(
+    db: AsyncSession, courses: Sequence[CourseCreate]
+) -> Sequence[Course]:
+    """Insert all courses with one multi-row INSERT ... RETURNING."""
+    if not courses:
+        return []
+
+    stmt = insert(Course).returning(Course, sort_by_parameter_order=True)
+    result = await db.scalars(
+        stmt,
+        [course.model_dump() for course in courses],
+        # keep NULLs so every row shares one INSERT and is batched together
+        execution_options={"render_nulls": True},
+    )
+    db_courses = result.all()
+    per_author = Counter(course.author_id for course in courses)
+    await add_counts(
+        db,
+        {
+            (COURSES, 0): len(db_courses),
+            **{(AUTHOR_COURSES, id_): count for id_, count in per_author.items()},
+        },
+    )
+
+    await db.commit()
+    suggest_cache.clear()
+    return db_courses
+
+
 async def get_course(db: AsyncSession, course_id: int) -> Optional[Course]:
     stmt = select(Course).where(Course.id == course_id)
     result = await db.execute(stmt)
     return result.scalar_one_or_none()
 
 
+@coalesce
+async def get_course_payload(db: AsyncSession, course_id: int) -> Optional[Payload]:
+    """Serialized CourseResponse, read through the in-process response cache."""
+    key = ("course", course_id)
+    payload = None if bypasses_cache(db) else response_cache.get(key)
+    if payload is not None:
+        return payload
+
+    db_course = await get_course(db, course_id)
+    if db_course is None:
+        return None
+
+    response = CourseResponse.model_validate(db_course)
+    payload = Payload(to_json(response), response.updated_at)
+    response_cache.set(key, payload)
+    return payload
+
+
+@coalesce
+async def get_course_updated_at(db: AsyncSession, course_id: int) -> Optional[datetime]:
+    """Cheap freshness probe for conditional GETs: SELECT updated_at only."""
+    if not bypasses_cache(db):
+        payload = response_cache.get(("course", course_id))
+        if payload is not None:
+            return payload.updated_at
+
+    stmt = select(Course.updated_at).where(Course.id == course_id)
+    updated_at: Optional[datetime] = await db.scalar(stmt)
+    return updated_at
+
+
+@coalesce
+async def get_course_fields(
+    db: AsyncSession, course_id: int, columns: Sequence[str]
+) -> Optional[RowMapping]:
+    """Only the requested ``columns`` of a course, bypassing the response cache."""
+    stmt = select(*table_columns(Course, columns)).where(Course.id == course_id)
+    result = await db.execute(stmt)
+    return result.mappings().one_or_none()
+
+
+@coalesce
+async def get_course_suggestions(
+    db: AsyncSession, prefix: str, limit: int = 10
+) -> bytes:
+    """
+    Serialized ``[{id, title}]`` of courses whose title contains ``prefix``,
+    titles starting with it first.
+
+    Short prefixes match the most rows and are typed the most, so they are
+    served from ``suggest_cache``, which course writes clear.
+    """
+    key = (prefix.casefold(), limit)
+    cacheable = len(prefix) <= settings.SUGGEST_CACHE_MAX_PREFIX
+    if cacheable:
+        body = suggest_cache.get(key)
+        if body is not None:
+            return body
+
+    # ILIKE '%prefix%' is served by the pg_trgm GIN index on courses.title
+    stmt = (
+        select(Course.id, Course.title)
+        .where(Course.title.icontains(prefix, autoescape=True))
+        .order_by(
+            Course.title.istartswith(prefix, autoescape=True).desc(),
+            Course.title,
+            Course.id,
+        )
+        .limit(limit)
+    )
+    result = await db.execute(stmt)
+    body = to_json(
+        [CourseSuggestion.model_validate(row) for row in result.mappings().all()]
+    )
+
+    if cacheable:
+        suggest_cache.set(key, body)
+    return body
+
+
+async def get_course_tree(db: AsyncSession, course_id: int) -> Optional[Course]:
+    """Course with its lessons and their exercises in three queries total."""
+    stmt = (
+        select(Course)
+        .where(Course.id == course_id)
+        .options(selectinload(Course.lessons).selectinload(Lesson.exercises))
+    )
+    result = await db.execute(stmt)
+    return result.scalar_one_or_none()
+
+
+@coalesce
+async def get_course_tree_payload(db: AsyncSession, course_id: int) -> Optional[bytes]:
+    """
+    Serialized CourseTreeResponse. Coalesced readers share these bytes rather
+    than the ORM objects, which belong to the session of the first reader.
+    """
+    db_course = await get_course_tree(db, course_id)
+    if db_course is None:
+        return None
+    return to_json(CourseTreeResponse.model_validate(db_course))
+
+
+@coalesce
 async def get_courses(
-    db: AsyncSession, skip: int = 0, limit: int = 100
-) -> Sequence[Course]:
-    stmt = select(Course).offset(skip).limit(limit)
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    columns: Optional[Sequence[str]] = None,
+    author_id: Optional[int] = None,
+) -> Sequence[RowMapping]:
+    stmt = select(*table_columns(Course, columns))
+    if author_id is not None:
+        # served by the (author_id, id) index, keyset included
+        stmt = stmt.where(Course.author_id == author_id)
+    stmt = paginate(stmt, (Course.id,), skip, limit, cursor)
+    result = await db.execute(stmt)
+    return result.mappings().all()
+
+
+@coalesce
+async def get_courses_by_ids(
+    db: AsyncSession, ids: Sequence[int], columns: Optional[Sequence[str]] = None
+) -> list[RowMapping]:
+    """Courses with the given ``ids`` in one query, in the order of ``ids``."""
+    stmt = select(*table_columns(Course, columns)).where(id_in(db, Course.id, ids))
     result = await db.execute(stmt)
-    return result.scalars().all()
+    return in_request_order(result.mappings().all(), ids)
 
 
-async def get_courses_count(db: AsyncSession) -> int:
-    stmt = select(func.count()).select_from(Course)
-    results = await db.execute(stmt)
-    return results.scalar() or 0
+@coalesce
+async def get_author_courses(
+    db: AsyncSession,
+    author_id: int,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+) -> list[dict[str, Any]]:
+    """A page of an author's courses, each with its lesson and exercise counts."""
+    courses = await get_courses(db, skip, limit, cursor, author_id=author_id)
+    counts = await get_course_child_counts(db, [course["id"] for course in courses])
+    return [
+        {
+            **course,
+            "lesson_count": counts.get(course["id"], (0, 0))[0],
+            "exercise_count": counts.get(course["id"], (0, 0))[1],
+        }
+        for course in courses
+    ]
+
+
+@coalesce
+async def get_courses_count(
+    db: AsyncSession, author_id: Optional[int] = None, mode: CountMode = "exact"
+) -> int:
+    """Total number of courses or, given ``author_id``, courses of that author."""
+    if author_id is not None:
+        return await get_count(db, AUTHOR_COURSES, author_id)
+    return await get_total(db, COURSES, mode)
 
 
 async def update_course(
     db: AsyncSession, course_id: int, course_update: CourseUpdate
 ) -> Optional[Course]:
-    db_course = await get_course(db, course_id)
-    if not db_course:
-        return None
-
     update_data = course_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_course, field, value)
+    if not update_data:
+        return await get_course(db, course_id)
+
+    # single round trip: UPDATE ... WHERE id = :id RETURNING *
+    stmt = (
+        update(Course)
+        .where(Course.id == course_id)
+        .values(**update_data)
+        .returning(Course)
+    )
+    result = await db.execute(stmt)
+    db_course = result.scalar_one_or_none()
 
     await db.commit()
-    await db.refresh(db_course)
+    response_cache.discard(("course", course_id))
+    if "title" in update_data:
+        suggest_cache.clear()
     return db_course
 
 
 async def delete_course(db: AsyncSession, course_id: int) -> bool:
-    db_course = await get_course(db, course_id)
-    if not db_course:
-        return False
+    # counters of the children go first, the lessons are gone after the delete
+    lessons = await drop_counts(db, COURSE_LESSONS, [course_id])
+    exercises = await drop_counts(
+        db, LESSON_EXERCISES, select(Lesson.id).where(Lesson.course_id == course_id)
+    )
+
+    # children are removed by the database through ON DELETE CASCADE
+    stmt = delete(Course).where(Course.id == course_id).returning(Course.author_id)
+    result = await db.execute(stmt)
+    author_id = result.scalar_one_or_none()
+    if author_id is not None:
+        await add_counts(
+            db,
+            {
+                (COURSES, 0): -1,
+                (AUTHOR_COURSES, author_id): -1,
+                (LESSONS, 0): -lessons,
+                (EXERCISES, 0): -exercises,
+            },
+        )
 
-    await db.delete(db_course)
     await db.commit()
-    return True
+    response_cache.invalidate(("course", course_id))
+    suggest_cache.clear()
+    return author_id is not None
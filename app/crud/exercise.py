@@ -1,75 +1,267 @@
+from collections import Counter
 from collections.abc import Sequence
+from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import func, select
+from pydantic_core import to_json
+from sqlalchemy import RowMapping, and_, delete, exists, insert, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..models import Exercise
-from ..schemas import ExerciseCreate, ExerciseUpdate
+from ..core.cache import Payload, response_cache
+from ..db.session import bypasses_cache
+from ..models import Exercise, Lesson
+from ..schemas import ExerciseCreate, ExerciseResponse, ExerciseUpdate
+from .coalesce import coalesce
+from .columns import table_columns
+from .counts import (
+    EXERCISES,
+    LESSON_EXERCISES,
+    CountMode,
+    add_counts,
+    get_count,
+    get_total,
+)
+from .ids import id_in, in_request_order
+from .pagination import keyset_condition, paginate
 
 
-async def create_exercise(db: AsyncSession, exercise: ExerciseCreate) -> Exercise:
+async def create_exercise(
+    db: AsyncSession, exercise: ExerciseCreate
+) -> Optional[Exercise]:
+    """Returns None when the lesson does not exist (foreign key violation)."""
     db_exercise = Exercise(**exercise.model_dump())
     db.add(db_exercise)
-    await db.commit()
+    await add_counts(db, {(EXERCISES, 0): 1, (LESSON_EXERCISES, exercise.lesson_id): 1})
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        return None
+
     await db.refresh(db_exercise)
     return db_exercise
 
 
+async def create_exercises(
+    db: AsyncSession, exercises: Sequence[ExerciseCreate], retry: bool = True
+) -> list[Optional[Exercise]]:
+    """
+    Insert exercises with one multi-row INSERT ... RETURNING.
+
+    Lesson existence is checked with a single IN query. The result is
+    aligned with ``exercises``; None marks an exercise whose lesson does not exist.
+    """
+    lesson_ids = {exercise.lesson_id for exercise in exercises}
+    existing = set(
+        (await db.scalars(select(Lesson.id).where(Lesson.id.in_(lesson_ids)))).all()
+    )
+    valid = [exercise for exercise in exercises if exercise.lesson_id in existing]
+    if not valid:
+        return [None] * len(exercises)
+
+    stmt = insert(Exercise).returning(Exercise, sort_by_parameter_order=True)
+    try:
+        result = await db.scalars(
+            stmt,
+            [exercise.model_dump() for exercise in valid],
+            # keep NULLs so every row shares one INSERT and is batched together
+            execution_options={"render_nulls": True},
+        )
+    except IntegrityError:
+        # a lesson was deleted after the check; check again, once, and report
+        # its exercises as not found
+        await db.rollback()
+        if not retry:
+            raise
+        return await create_exercises(db, exercises, retry=False)
+    created = iter(result.all())
+    per_lesson = Counter(exercise.lesson_id for exercise in valid)
+    await add_counts(
+        db,
+        {
+            (EXERCISES, 0): len(valid),
+            **{(LESSON_EXERCISES, id_): count for id_, count in per_lesson.items()},
+        },
+    )
+
+    await db.commit()
+    return [
+        next(created) if exercise.lesson_id in existing else None
+        for exercise in exercises
+    ]
+
+
 async def get_exercise(db: AsyncSession, exercise_id: int) -> Optional[Exercise]:
     stmt = select(Exercise).where(Exercise.id == exercise_id)
     result = await db.execute(stmt)
     return result.scalar_one_or_none()
 
 
+@coalesce
+async def get_exercise_payload(db: AsyncSession, exercise_id: int) -> Optional[Payload]:
+    """Serialized ExerciseResponse, read through the in-process response cache."""
+    key = ("exercise", exercise_id)
+    payload = None if bypasses_cache(db) else response_cache.get(key)
+    if payload is not None:
+        return payload
+
+    # the course id comes along, so the entry goes when the course is deleted
+    # even if the lesson in between is not cached
+    stmt = (
+        select(Exercise, Lesson.course_id)
+        .join(Lesson, Lesson.id == Exercise.lesson_id)
+        .where(Exercise.id == exercise_id)
+    )
+    row = (await db.execute(stmt)).one_or_none()
+    if row is None:
+        return None
+
+    db_exercise, course_id = row
+    response = ExerciseResponse.model_validate(db_exercise)
+    payload = Payload(to_json(response), response.updated_at)
+    response_cache.set(
+        key,
+        payload,
+        parents=[("lesson", db_exercise.lesson_id), ("course", course_id)],
+    )
+    return payload
+
+
+@coalesce
+async def get_exercise_updated_at(
+    db: AsyncSession, exercise_id: int
+) -> Optional[datetime]:
+    """Cheap freshness probe for conditional GETs: SELECT updated_at only."""
+    if not bypasses_cache(db):
+        payload = response_cache.get(("exercise", exercise_id))
+        if payload is not None:
+            return payload.updated_at
+
+    stmt = select(Exercise.updated_at).where(Exercise.id == exercise_id)
+    updated_at: Optional[datetime] = await db.scalar(stmt)
+    return updated_at
+
+
+@coalesce
+async def get_exercise_fields(
+    db: AsyncSession, exercise_id: int, columns: Sequence[str]
+) -> Optional[RowMapping]:
+    """Only the requested ``columns`` of an exercise, bypassing the response cache."""
+    stmt = select(*table_columns(Exercise, columns)).where(Exercise.id == exercise_id)
+    result = await db.execute(stmt)
+    return result.mappings().one_or_none()
+
+
+@coalesce
 async def get_exercises(
-    db: AsyncSession, skip: int = 0, limit: int = 100
-) -> Sequence[Exercise]:
-    stmt = select(Exercise).offset(skip).limit(limit)
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    columns: Optional[Sequence[str]] = None,
+) -> Sequence[RowMapping]:
+    stmt = select(*table_columns(Exercise, columns))
+    stmt = paginate(stmt, (Exercise.id,), skip, limit, cursor)
+    result = await db.execute(stmt)
+    return result.mappings().all()
+
+
+@coalesce
+async def get_exercises_by_ids(
+    db: AsyncSession, ids: Sequence[int], columns: Optional[Sequence[str]] = None
+) -> list[RowMapping]:
+    """Exercises with the given ``ids`` in one query, in the order of ``ids``."""
+    stmt = select(*table_columns(Exercise, columns)).where(id_in(db, Exercise.id, ids))
     result = await db.execute(stmt)
-    return result.scalars().all()
+    return in_request_order(result.mappings().all(), ids)
 
 
+@coalesce
 async def get_exercises_by_lesson(
-    db: AsyncSession, lesson_id: int, skip: int = 0, limit: int = 100
-) -> Sequence[Exercise]:
+    db: AsyncSession,
+    lesson_id: int,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    columns: Optional[Sequence[str]] = None,
+) -> Optional[Sequence[RowMapping]]:
+    """
+    Exercises of a lesson or None if the lesson does not exist.
+
+    The lesson is LEFT JOINed to its exercises, so a single statement answers both
+    questions: no row means no lesson, one NULL row means no exercises.
+    """
+    key = (Exercise.lesson_id, Exercise.id)
+    join_on = Exercise.lesson_id == Lesson.id
+    if cursor is not None:
+        join_on = and_(join_on, keyset_condition(key, cursor))
+
     stmt = (
-        select(Exercise)
-        .where(Exercise.lesson_id == lesson_id)
-        .offset(skip)
+        select(*table_columns(Exercise, columns))
+        .select_from(Lesson)
+        .outerjoin(Exercise, join_on)
+        .where(Lesson.id == lesson_id)
+        .order_by(*key)
+        .offset(skip if cursor is None else 0)
         .limit(limit)
     )
     result = await db.execute(stmt)
-    return result.scalars().all()
+    rows = result.mappings().all()
 
+    if not rows:
+        # a zero limit or an offset past the last exercise drops the NULL row
+        # as well, so only then does the lesson need a separate existence check
+        if limit <= 0 or (skip and cursor is None):
+            stmt = select(exists().where(Lesson.id == lesson_id))
+            if await db.scalar(stmt):
+                return []
+        return None
+
+    return [row for row in rows if row["id"] is not None]
 
-async def get_exercises_count(db: AsyncSession) -> int:
-    stmt = select(func.count()).select_from(Exercise)
-    result = await db.execute(stmt)
-    return result.scalar() or 0
+
+@coalesce
+async def get_exercises_count(
+    db: AsyncSession, lesson_id: Optional[int] = None, mode: CountMode = "exact"
+) -> int:
+    """Total number of exercises or, given ``lesson_id``, exercises of that lesson."""
+    if lesson_id is not None:
+        return await get_count(db, LESSON_EXERCISES, lesson_id)
+    return await get_total(db, EXERCISES, mode)
 
 
 async def update_exercise(
     db: AsyncSession, exercise_id: int, exercise_update: ExerciseUpdate
 ) -> Optional[Exercise]:
-    db_exercise = await get_exercise(db, exercise_id)
-    if not db_exercise:
-        return None
-
     update_data = exercise_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_exercise, field, value)
+    if not update_data:
+        return await get_exercise(db, exercise_id)
+
+    # single round trip: UPDATE ... WHERE id = :id RETURNING *
+    stmt = (
+        update(Exercise)
+        .where(Exercise.id == exercise_id)
+        .values(**update_data)
+        .returning(Exercise)
+    )
+    result = await db.execute(stmt)
+    db_exercise = result.scalar_one_or_none()
 
     await db.commit()
-    await db.refresh(db_exercise)
+    response_cache.discard(("exercise", exercise_id))
     return db_exercise
 
 
 async def delete_exercise(db: AsyncSession, exercise_id: int) -> bool:
-    db_exercise = await get_exercise(db, exercise_id)
-    if not db_exercise:
-        return False
+    stmt = (
+        delete(Exercise).where(Exercise.id == exercise_id).returning(Exercise.lesson_id)
+    )
+    result = await db.execute(stmt)
+    lesson_id = result.scalar_one_or_none()
+    if lesson_id is not None:
+        await add_counts(db, {(EXERCISES, 0): -1, (LESSON_EXERCISES, lesson_id): -1})
 
-    await db.delete(db_exercise)
     await db.commit()
-    return True
+    response_cache.invalidate(("exercise", exercise_id))
+    return lesson_id is not None
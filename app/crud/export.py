@@ -0,0 +1,85 @@
+"""
+Streaming reads for the catalog export.
+
+Every function yields batches of ORM objects read through a server-side
+cursor (``stream_scalars`` with ``yield_per``), so memory stays bounded by
+the batch size however large the table is. Rows are ordered by id, which
+keeps the output stable between runs.
+"""
+
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import Select, exists, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from ..models import Course, Exercise, Lesson
+
+
+async def _stream(
+    db: AsyncSession, stmt: Select[Any], batch_size: int
+) -> AsyncIterator[Sequence[Any]]:
+    result = await db.stream_scalars(stmt, execution_options={"yield_per": batch_size})
+    async for batch in result.partitions():
+        yield batch
+
+
+def stream_courses(
+    db: AsyncSession, updated_since: Optional[datetime] = None, batch_size: int = 1000
+) -> AsyncIterator[Sequence[Course]]:
+    stmt = select(Course).order_by(Course.id)
+    if updated_since is not None:
+        stmt = stmt.where(Course.updated_at >= updated_since)
+    return _stream(db, stmt, batch_size)
+
+
+def stream_lessons(
+    db: AsyncSession, updated_since: Optional[datetime] = None, batch_size: int = 1000
+) -> AsyncIterator[Sequence[Lesson]]:
+    stmt = select(Lesson).order_by(Lesson.id)
+    if updated_since is not None:
+        stmt = stmt.where(Lesson.updated_at >= updated_since)
+    return _stream(db, stmt, batch_size)
+
+
+def stream_exercises(
+    db: AsyncSession, updated_since: Optional[datetime] = None, batch_size: int = 1000
+) -> AsyncIterator[Sequence[Exercise]]:
+    stmt = select(Exercise).order_by(Exercise.id)
+    if updated_since is not None:
+        stmt = stmt.where(Exercise.updated_at >= updated_since)
+    return _stream(db, stmt, batch_size)
+
+
+def stream_course_trees(
+    db: AsyncSession, updated_since: Optional[datetime] = None, batch_size: int = 1000
+) -> AsyncIterator[Sequence[Course]]:
+    """
+    Courses with their lessons and exercises.
+
+    Lessons and exercises are loaded with selectinload once per batch. With
+    ``updated_since`` a course is included when it or any of its lessons or
+    exercises changed since then.
+    """
+    stmt = (
+        select(Course)
+        .options(selectinload(Course.lessons).selectinload(Lesson.exercises))
+        .order_by(Course.id)
+    )
+    if updated_since is not None:
+        stmt = stmt.where(
+            or_(
+                Course.updated_at >= updated_since,
+                exists().where(
+                    Lesson.course_id == Course.id, Lesson.updated_at >= updated_since
+                ),
+                exists().where(
+                    Lesson.course_id == Course.id,
+                    Exercise.lesson_id == Lesson.id,
+                    Exercise.updated_at >= updated_since,
+                ),
+            )
+        )
+    return _stream(db, stmt, batch_size)
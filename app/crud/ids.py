@@ -0,0 +1,33 @@
+"""
+Multi-get by primary key.
+
+On PostgreSQL the ids are sent as one array parameter, ``id = ANY(:ids)``,
+so the statement text, and with it the prepared statement asyncpg caches
+per connection, is the same however many ids are asked for. ``IN`` with
+one parameter per id is used elsewhere.
+"""
+
+from collections.abc import Sequence
+from typing import TypeVar
+
+from sqlalchemy import ColumnElement, Integer, any_, bindparam
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .pagination import Row
+
+R = TypeVar("R", bound=Row)
+
+
+def id_in(
+    db: AsyncSession, column: ColumnElement[int], ids: Sequence[int]
+) -> ColumnElement[bool]:
+    if db.get_bind().dialect.name == "postgresql":
+        return column == any_(bindparam("ids", list(ids), type_=ARRAY(Integer)))
+    return column.in_(ids)
+
+
+def in_request_order(rows: Sequence[R], ids: Sequence[int]) -> list[R]:
+    """``rows`` in the order of ``ids``, skipping ids that have no row."""
+    by_id = {row["id"]: row for row in rows}
+    return [by_id[id_] for id_ in ids if id_ in by_id]
@@ -1,70 +1,265 @@
+from collections import Counter
 from collections.abc import Sequence
+from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import func, select
+from pydantic_core import to_json
+from sqlalchemy import RowMapping, and_, delete, exists, insert, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..models import Lesson
-from ..schemas import LessonCreate, LessonUpdate
+from ..core.cache import Payload, response_cache
+from ..db.session import bypasses_cache
+from ..models import Course, Lesson
+from ..schemas import LessonCreate, LessonResponse, LessonUpdate
+from .coalesce import coalesce
+from .columns import table_columns
+from .counts import (
+    COURSE_LESSONS,
+    EXERCISES,
+    LESSON_EXERCISES,
+    LESSONS,
+    CountMode,
+    add_counts,
+    drop_counts,
+    get_count,
+    get_total,
+)
+from .ids import id_in, in_request_order
+from .pagination import keyset_condition, paginate
 
 
-async def create_lesson(db: AsyncSession, lesson: LessonCreate) -> Lesson:
+async def create_lesson(db: AsyncSession, lesson: LessonCreate) -> Optional[Lesson]:
+    """Returns None when the course does not exist (foreign key violation)."""
     db_lesson = Lesson(**lesson.model_dump())
     db.add(db_lesson)
-    await db.commit()
+    await add_counts(db, {(LESSONS, 0): 1, (COURSE_LESSONS, lesson.course_id): 1})
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        return None
+
     await db.refresh(db_lesson)
     return db_lesson
 
 
+async def create_lessons(
+    db: AsyncSession, lessons: Sequence[LessonCreate], retry: bool = True
+) -> list[Optional[Lesson]]:
+    """
+    Insert lessons with one multi-row INSERT ... RETURNING.
+
+    Course existence is checked with a single IN query. The result is
+    aligned with ``lessons``; None marks a lesson whose course does not exist.
+    """
+    course_ids = {lesson.course_id for lesson in lessons}
+    existing = set(
+        (await db.scalars(select(Course.id).where(Course.id.in_(course_ids)))).all()
+    )
+    valid = [lesson for lesson in lessons if lesson.course_id in existing]
+    if not valid:
+        return [None] * len(lessons)
+
+    stmt = insert(Lesson).returning(Lesson, sort_by_parameter_order=True)
+    try:
+        result = await db.scalars(
+            stmt,
+            [lesson.model_dump() for lesson in valid],
+            # keep NULLs so every row shares one INSERT and is batched together
+            execution_options={"render_nulls": True},
+        )
+    except IntegrityError:
+        # a course was deleted after the check; check again, once, and report
+        # its lessons as not found
+        await db.rollback()
+        if not retry:
+            raise
+        return await create_lessons(db, lessons, retry=False)
+    created = iter(result.all())
+    per_course = Counter(lesson.course_id for lesson in valid)
+    await add_counts(
+        db,
+        {
+            (LESSONS, 0): len(valid),
+            **{(COURSE_LESSONS, id_): count for id_, count in per_course.items()},
+        },
+    )
+
+    await db.commit()
+    return [
+        next(created) if lesson.course_id in existing else None for lesson in lessons
+    ]
+
+
 async def get_lesson(db: AsyncSession, lesson_id: int) -> Optional[Lesson]:
     stmt = select(Lesson).where(Lesson.id == lesson_id)
     result = await db.execute(stmt)
     return result.scalar_one_or_none()
 
 
+@coalesce
+async def get_lesson_payload(db: AsyncSession, lesson_id: int) -> Optional[Payload]:
+    """Serialized LessonResponse, read through the in-process response cache."""
+    key = ("lesson", lesson_id)
+    payload = None if bypasses_cache(db) else response_cache.get(key)
+    if payload is not None:
+        return payload
+
+    db_lesson = await get_lesson(db, lesson_id)
+    if db_lesson is None:
+        return None
+
+    response = LessonResponse.model_validate(db_lesson)
+    payload = Payload(to_json(response), response.updated_at)
+    response_cache.set(key, payload, parents=[("course", db_lesson.course_id)])
+    return payload
+
+
+@coalesce
+async def get_lesson_updated_at(db: AsyncSession, lesson_id: int) -> Optional[datetime]:
+    """Cheap freshness probe for conditional GETs: SELECT updated_at only."""
+    if not bypasses_cache(db):
+        payload = response_cache.get(("lesson", lesson_id))
+        if payload is not None:
+            return payload.updated_at
+
+    stmt = select(Lesson.updated_at).where(Lesson.id == lesson_id)
+    updated_at: Optional[datetime] = await db.scalar(stmt)
+    return updated_at
+
+
+@coalesce
+async def get_lesson_fields(
+    db: AsyncSession, lesson_id: int, columns: Sequence[str]
+) -> Optional[RowMapping]:
+    """Only the requested ``columns`` of a lesson, bypassing the response cache."""
+    stmt = select(*table_columns(Lesson, columns)).where(Lesson.id == lesson_id)
+    result = await db.execute(stmt)
+    return result.mappings().one_or_none()
+
+
+@coalesce
 async def get_lessons(
-    db: AsyncSession, skip: int = 0, limit: int = 100
-) -> Sequence[Lesson]:
-    stmt = select(Lesson).offset(skip).limit(limit)
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    columns: Optional[Sequence[str]] = None,
+) -> Sequence[RowMapping]:
+    stmt = select(*table_columns(Lesson, columns))
+    stmt = paginate(stmt, (Lesson.id,), skip, limit, cursor)
     results = await db.execute(stmt)
-    return results.scalars().all()
+    return results.mappings().all()
+
+
+@coalesce
+async def get_lessons_by_ids(
+    db: AsyncSession, ids: Sequence[int], columns: Optional[Sequence[str]] = None
+) -> list[RowMapping]:
+    """Lessons with the given ``ids`` in one query, in the order of ``ids``."""
+    stmt = select(*table_columns(Lesson, columns)).where(id_in(db, Lesson.id, ids))
+    result = await db.execute(stmt)
+    return in_request_order(result.mappings().all(), ids)
 
 
+@coalesce
 async def get_lessons_by_course(
-    db: AsyncSession, course_id: int, skip: int = 0, limit: int = 100
-) -> Sequence[Lesson]:
-    stmt = select(Lesson).where(Lesson.course_id == course_id).offset(skip).limit(limit)
-    results = await db.execute(stmt)
-    return results.scalars().all()
+    db: AsyncSession,
+    course_id: int,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    columns: Optional[Sequence[str]] = None,
+) -> Optional[Sequence[RowMapping]]:
+    """
+    Lessons of a course or None if the course does not exist.
 
+    The course is LEFT JOINed to its lessons, so a single statement answers both
+    questions: no row means no course, one NULL row means no lessons.
+    """
+    key = (Lesson.course_id, Lesson.id)
+    join_on = Lesson.course_id == Course.id
+    if cursor is not None:
+        join_on = and_(join_on, keyset_condition(key, cursor))
 
-async def get_lessons_count(db: AsyncSession) -> int:
-    stmt = select(func.count()).select_from(Lesson)
+    stmt = (
+        select(*table_columns(Lesson, columns))
+        .select_from(Course)
+        .outerjoin(Lesson, join_on)
+        .where(Course.id == course_id)
+        .order_by(*key)
+        .offset(skip if cursor is None else 0)
+        .limit(limit)
+    )
     result = await db.execute(stmt)
-    return result.scalar() or 0
+    rows = result.mappings().all()
+
+    if not rows:
+        # a zero limit or an offset past the last lesson drops the NULL row
+        # as well, so only then does the course need a separate existence check
+        if limit <= 0 or (skip and cursor is None):
+            exists_stmt = select(exists().where(Course.id == course_id))
+            if await db.scalar(exists_stmt):
+                return []
+        return None
+
+    return [row for row in rows if row["id"] is not None]
+
+
+@coalesce
+async def get_lessons_count(
+    db: AsyncSession, course_id: Optional[int] = None, mode: CountMode = "exact"
+) -> int:
+    """Total number of lessons or, given ``course_id``, lessons of that course."""
+    if course_id is not None:
+        return await get_count(db, COURSE_LESSONS, course_id)
+    return await get_total(db, LESSONS, mode)
 
 
 async def update_lesson(
     db: AsyncSession, lesson_id: int, lesson_update: LessonUpdate
 ) -> Optional[Lesson]:
-    db_lesson = await get_lesson(db, lesson_id)
-    if not db_lesson:
-        return None
+    update_data = lesson_update.model_dump(
+        exclude_unset=True,
+        # LessonUpdate.exercise has no matching column on lessons
+        exclude={"exercise"},
+    )
+    if not update_data:
+        return await get_lesson(db, lesson_id)
 
-    update_data = lesson_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_lesson, field, value)
+    # single round trip: UPDATE ... WHERE id = :id RETURNING *
+    stmt = (
+        update(Lesson)
+        .where(Lesson.id == lesson_id)
+        .values(**update_data)
+        .returning(Lesson)
+    )
+    result = await db.execute(stmt)
+    db_lesson = result.scalar_one_or_none()
 
     await db.commit()
-    await db.refresh(db_lesson)
+    response_cache.discard(("lesson", lesson_id))
     return db_lesson
 
 
 async def delete_lesson(db: AsyncSession, lesson_id: int) -> bool:
-    db_lesson = await get_lesson(db, lesson_id)
-    if not db_lesson:
-        return False
+    exercises = await drop_counts(db, LESSON_EXERCISES, [lesson_id])
+
+    # children are removed by the database through ON DELETE CASCADE
+    stmt = delete(Lesson).where(Lesson.id == lesson_id).returning(Lesson.course_id)
+    result = await db.execute(stmt)
+    course_id = result.scalar_one_or_none()
+    if course_id is not None:
+        await add_counts(
+            db,
+            {
+                (LESSONS, 0): -1,
+                (COURSE_LESSONS, course_id): -1,
+                (EXERCISES, 0): -exercises,
+            },
+        )
 
-    await db.delete(db_lesson)
     await db.commit()
-    return True
+    response_cache.invalidate(("lesson", lesson_id))
+    return course_id is not None
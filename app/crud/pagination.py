@@ -0,0 +1,100 @@
+"""
+Keyset (cursor) pagination helpers.
+
+A cursor is an opaque, url-safe token wrapping the sort key of the last row
+of a page, e.g. ``(id,)``, ``(course_id, id)`` or a search rank and id. The
+next page is selected with ``WHERE (key) > (cursor)`` so the database seeks
+straight to it through the index instead of scanning and discarding
+``skip`` rows.
+"""
+
+import base64
+import binascii
+import json
+from collections.abc import Mapping, Sequence
+from typing import Any, Optional
+
+from sqlalchemy import ColumnElement, Float, Select, literal, tuple_
+
+# a result row: a RowMapping or a dict built from one
+Row = Mapping[Any, Any]
+
+# range of the INTEGER columns the keys are made of
+INT4_MIN = -(2**31)
+INT4_MAX = 2**31 - 1
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+def encode_cursor(*key: float) -> str:
+    raw = json.dumps(list(key), separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def _fits(value: Any, kind: type[float]) -> bool:
+    """Integer keys take int4 values only, float keys any number."""
+    if type(value) is int:
+        return kind is float or INT4_MIN <= value <= INT4_MAX
+    return kind is float and type(value) is float
+
+
+def decode_cursor(cursor: str, kinds: Sequence[type[float]]) -> tuple[float, ...]:
+    """
+    Decode a cursor of a key whose values are of ``kinds`` (``int`` or
+    ``float``), so that a forged cursor is rejected here rather than by the
+    database when it is bound.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        key = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise InvalidCursorError(f"Invalid cursor: {cursor!r}") from exc
+
+    if (
+        not isinstance(key, list)
+        or len(key) != len(kinds)
+        or not all(_fits(value, kind) for value, kind in zip(key, kinds))
+    ):
+        raise InvalidCursorError(f"Invalid cursor: {cursor!r}")
+
+    return tuple(key)
+
+
+def paginate(
+    stmt: Select[Any],
+    key: Sequence[ColumnElement[Any]],
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+) -> Select[Any]:
+    """
+    Order ``stmt`` by ``key`` and apply either keyset (``cursor``) or
+    offset (``skip``) pagination. ``skip`` is ignored when a cursor is given.
+    """
+    stmt = stmt.order_by(*key).limit(limit)
+
+    if cursor is None:
+        return stmt.offset(skip)
+    return stmt.where(keyset_condition(key, cursor))
+
+
+def keyset_condition(
+    key: Sequence[ColumnElement[Any]], cursor: str
+) -> ColumnElement[bool]:
+    """``(key) > (cursor)``, i.e. rows following the one the cursor points at."""
+    kinds = [float if isinstance(column.type, Float) else int for column in key]
+    values = decode_cursor(cursor, kinds)
+    if len(key) == 1:
+        return key[0] > values[0]
+    return tuple_(*key) > tuple_(*(literal(value) for value in values))
+
+
+def next_cursor(rows: Sequence[Row], limit: int, *key: str) -> Optional[str]:
+    """Cursor of the page following ``rows`` or None if it was the last page."""
+    if not rows or len(rows) < limit:
+        return None
+
+    last = rows[-1]
+    return encode_cursor(*(last[column] for column in key))
@@ -0,0 +1,103 @@
+"""
+Ranked full-text search over courses, lessons and exercises.
+
+Each table has a generated ``search_vector`` tsvector column (title with
+weight A, description/content with weight B) indexed with GIN. The column
+is created by a migration and is not mapped on the models, because it only
+exists on PostgreSQL. Snippets are rendered with ``ts_headline`` for the
+rows of the requested page only.
+"""
+
+from collections.abc import Sequence
+from typing import Any, Optional
+
+from sqlalchemy import (
+    ColumnElement,
+    Float,
+    RowMapping,
+    func,
+    literal,
+    literal_column,
+    select,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..db.base import Base
+from ..models import Course, Exercise, Lesson
+from ..schemas import SearchKind
+from .pagination import keyset_condition
+
+SEARCH_CONFIG = "english"
+HEADLINE_OPTIONS = (
+    "StartSel=<mark>, StopSel=</mark>, MaxFragments=2, MinWords=5, MaxWords=20"
+)
+
+# position in the tuple is the ``kind`` value stored in search cursors
+SEARCH_KINDS: tuple[SearchKind, ...] = ("course", "lesson", "exercise")
+_SOURCES: dict[SearchKind, tuple[type[Base], ColumnElement[Any]]] = {
+    "course": (Course, Course.description),
+    "lesson": (Lesson, Lesson.content),
+    "exercise": (Exercise, Exercise.content),
+}
+
+
+def _search_vector(model: type[Base]) -> ColumnElement[Any]:
+    return literal_column(f"{model.__tablename__}.search_vector", TSVECTOR)
+
+
+async def search(
+    db: AsyncSession,
+    q: str,
+    kinds: Optional[Sequence[SearchKind]] = None,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+) -> Sequence[RowMapping]:
+    """
+    Rows ordered by rank, best first, with ``kind``, ``id``, ``title``,
+    ``rank``, ``snippet`` and the ``neg_rank`` pagination key.
+    """
+    if db.get_bind().dialect.name != "postgresql":
+        raise NotImplementedError("Full-text search requires PostgreSQL")
+
+    query = func.websearch_to_tsquery(SEARCH_CONFIG, q)
+    matches = []
+    for kind in kinds or SEARCH_KINDS:
+        model, body = _SOURCES[kind]
+        vector = _search_vector(model)
+        matches.append(
+            select(
+                literal(SEARCH_KINDS.index(kind)).label("kind"),
+                model.__table__.c.id,
+                # negated so that (neg_rank, kind, id) ascending is best first
+                (-func.ts_rank_cd(vector, query, type_=Float)).label("neg_rank"),
+                model.__table__.c.title,
+                body.label("body"),
+            ).where(vector.bool_op("@@")(query))
+        )
+
+    found = union_all(*matches).subquery("found")
+    key = (found.c.neg_rank, found.c.kind, found.c.id)
+    page_stmt = select(found).order_by(*key).limit(limit)
+    if cursor is not None:
+        page_stmt = page_stmt.where(keyset_condition(key, cursor))
+
+    # headlines are expensive, render them for the page only
+    page = page_stmt.subquery("page")
+    stmt = select(
+        page.c.kind,
+        page.c.id,
+        page.c.title,
+        (-page.c.neg_rank).label("rank"),
+        page.c.neg_rank,
+        func.ts_headline(
+            SEARCH_CONFIG,
+            func.coalesce(page.c.body, page.c.title),
+            query,
+            HEADLINE_OPTIONS,
+        ).label("snippet"),
+    ).order_by(page.c.neg_rank, page.c.kind, page.c.id)
+
+    result = await db.execute(stmt)
+    return result.mappings().all()
@@ -1,5 +1,6 @@
 import asyncio
 from logging.config import fileConfig
+from typing import Any, Optional
 
 from alembic import context
 from sqlalchemy import pool
@@ -26,10 +27,29 @@ config.set_main_option("sqlalchemy.url", DATABASE_URL)
 # for 'autogenerate' support
 # from myapp import mymodel
 # target_metadata = mymodel.Base.metadata
-from ...models import Course, Exercise, Lesson  # noqa
+from app.models import Counter, Course, Exercise, Lesson  # noqa
 
 target_metadata = Base.metadata
 
+# full-text search vectors, added with raw SQL by b41d7e0c9a25; they are
+# PostgreSQL only and are read through crud.search, not through the models
+SEARCH_VECTOR = "search_vector"
+SEARCH_VECTOR_INDEXES = {
+    f"ix_{table}_search_vector" for table in ("courses", "lessons", "exercises")
+}
+
+
+def include_object(
+    object: Any, name: Optional[str], type_: str, reflected: bool, compare_to: Any
+) -> bool:
+    """Keep autogenerate from dropping the unmapped search vectors."""
+    if type_ == "column" and name == SEARCH_VECTOR:
+        return False
+    if type_ == "index" and name in SEARCH_VECTOR_INDEXES:
+        return False
+    return True
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -52,6 +72,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -62,7 +83,11 @@ def run_migrations_offline() -> None:
 
 def do_run_migrations(connection: Connection) -> None:
     """Execute migrations within a connection."""
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_object=include_object,
+    )
 
     with context.begin_transaction():
         context.run_migrations()
@@ -0,0 +1,53 @@
+"""add row counters
+
+Revision ID: 7c2e9f4a1b3d
+Revises: 1f3b8c6d2a90
+Create Date: 2026-10-18 19:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7c2e9f4a1b3d"
+down_revision: Union[str, Sequence[str], None] = "1f3b8c6d2a90"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # the catalog tables come from 1f3b8c6d2a90; a database that create_all
+    # set up before the service had migrations, and that was stamped at that
+    # revision, may already have an empty counters table
+    if not sa.inspect(op.get_bind()).has_table("counters"):
+        op.create_table(
+            "counters",
+            sa.Column("scope", sa.String(length=32), nullable=False),
+            sa.Column("scope_id", sa.Integer(), nullable=False),
+            sa.Column("value", sa.BigInteger(), nullable=False),
+            sa.PrimaryKeyConstraint("scope", "scope_id"),
+        )
+
+    # backfill from the existing rows
+    op.execute("DELETE FROM counters")
+    for scope, scope_id, table in (
+        ("courses", "0", "courses"),
+        ("lessons", "0", "lessons"),
+        ("exercises", "0", "exercises"),
+        ("course_lessons", "course_id", "lessons"),
+        ("lesson_exercises", "lesson_id", "exercises"),
+    ):
+        group_by = f" GROUP BY {scope_id}" if scope_id != "0" else ""
+        op.execute(
+            "INSERT INTO counters (scope, scope_id, value) "
+            f"SELECT '{scope}', {scope_id}, count(*) FROM {table}{group_by}"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("counters")
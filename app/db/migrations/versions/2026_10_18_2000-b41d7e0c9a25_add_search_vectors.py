@@ -0,0 +1,49 @@
+"""add full-text search vectors
+
+Revision ID: b41d7e0c9a25
+Revises: 7c2e9f4a1b3d
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b41d7e0c9a25"
+down_revision: Union[str, Sequence[str], None] = "7c2e9f4a1b3d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# table -> column weighted below the title
+SEARCHABLE = {
+    "courses": "description",
+    "lessons": "content",
+    "exercises": "content",
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, body in SEARCHABLE.items():
+        op.execute(
+            f"ALTER TABLE {table} ADD COLUMN search_vector tsvector "
+            "GENERATED ALWAYS AS ("
+            "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+            f"setweight(to_tsvector('english', coalesce({body}, '')), 'B')"
+            ") STORED"
+        )
+        op.create_index(
+            f"ix_{table}_search_vector",
+            table,
+            ["search_vector"],
+            postgresql_using="gin",
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in SEARCHABLE:
+        op.drop_index(f"ix_{table}_search_vector", table_name=table)
+        op.drop_column(table, "search_vector")
@@ -0,0 +1,34 @@
+"""add course title trigram index
+
+Revision ID: e5a83c1f6d07
+Revises: b41d7e0c9a25
+Create Date: 2026-10-18 20:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e5a83c1f6d07"
+down_revision: Union[str, Sequence[str], None] = "b41d7e0c9a25"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_courses_title_trgm",
+        "courses",
+        ["title"],
+        postgresql_using="gin",
+        postgresql_ops={"title": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_courses_title_trgm", table_name="courses")
@@ -0,0 +1,35 @@
+"""add course author index and counters
+
+Revision ID: 3a9f5d2c8e61
+Revises: e5a83c1f6d07
+Create Date: 2026-10-18 21:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3a9f5d2c8e61"
+down_revision: Union[str, Sequence[str], None] = "e5a83c1f6d07"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_courses_author_id_id", "courses", ["author_id", "id"], if_not_exists=True
+    )
+    op.execute("DELETE FROM counters WHERE scope = 'author_courses'")
+    op.execute(
+        "INSERT INTO counters (scope, scope_id, value) "
+        "SELECT 'author_courses', author_id, count(*) FROM courses GROUP BY author_id"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DELETE FROM counters WHERE scope = 'author_courses'")
+    op.drop_index("ix_courses_author_id_id", table_name="courses")
@@ -0,0 +1,134 @@
+"""
+Connection pool telemetry.
+
+Connects, checkouts, checkins and invalidations are counted with SQLAlchemy
+pool events. Pool events fire only once a connection has been handed out,
+so the time spent waiting for one is measured around ``_do_get`` in a
+``AsyncAdaptedQueuePool`` subclass.
+"""
+
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+from ..core.metrics import Histogram, render_histogram
+
+
+@dataclass
+class PoolStats:
+    connects: int = 0
+    checkouts: int = 0
+    checkins: int = 0
+    invalidations: int = 0
+    timeouts: int = 0
+    checkout_wait: Histogram = field(default_factory=Histogram)
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            self.stats.timeouts += 1
+            raise
+        finally:
+            self.stats.checkout_wait.observe(time.perf_counter() - started)
+
+    def recreate(self) -> "InstrumentedPool":
+        # engine.dispose() swaps in a new pool, keep the numbers
+        pool = super().recreate()
+        assert isinstance(pool, InstrumentedPool)
+        pool.stats = self.stats
+        return pool
+
+
+def _pool(engine: AsyncEngine) -> InstrumentedPool:
+    pool = engine.sync_engine.pool
+    assert isinstance(pool, InstrumentedPool)
+    return pool
+
+
+def instrument(engine: AsyncEngine) -> None:
+    """Count pool events of an engine created with ``InstrumentedPool``."""
+    stats = _pool(engine).stats
+
+    def on_connect(*args: Any) -> None:
+        stats.connects += 1
+
+    def on_checkout(*args: Any) -> None:
+        stats.checkouts += 1
+
+    def on_checkin(*args: Any) -> None:
+        stats.checkins += 1
+
+    def on_invalidate(*args: Any) -> None:
+        stats.invalidations += 1
+
+    # listeners on the engine move with it to the pool that recreate() makes
+    event.listen(engine.sync_engine, "connect", on_connect)
+    event.listen(engine.sync_engine, "checkout", on_checkout)
+    event.listen(engine.sync_engine, "checkin", on_checkin)
+    event.listen(engine.sync_engine, "invalidate", on_invalidate)
+
+
+def pool_info(engine: AsyncEngine) -> dict[str, Any]:
+    pool = _pool(engine)
+    stats = pool.stats
+    return {
+        "url": engine.url.render_as_string(hide_password=True),
+        "size": pool.size(),
+        "max_overflow": pool._max_overflow,
+        "timeout": pool.timeout(),
+        "checked_out": pool.checkedout(),
+        "idle": pool.checkedin(),
+        # overflow() counts down from -size while the pool fills up
+        "overflow": max(pool.overflow(), 0),
+        "connects": stats.connects,
+        "checkouts": stats.checkouts,
+        "checkins": stats.checkins,
+        "invalidations": stats.invalidations,
+        "timeouts": stats.timeouts,
+        "checkout_wait_seconds": stats.checkout_wait.info(),
+    }
+
+
+def render_pools(engines: Iterable[tuple[str, AsyncEngine]]) -> Iterator[str]:
+    """Prometheus lines for the pools of ``(name, engine)`` pairs."""
+    pools = [(f'pool="{name}"', _pool(engine)) for name, engine in engines]
+    gauges = (
+        ("db_pool_checked_out", "Connections in use.", InstrumentedPool.checkedout),
+        ("db_pool_idle", "Connections idle in the pool.", InstrumentedPool.checkedin),
+        (
+            "db_pool_overflow",
+            "Connections open beyond the pool size.",
+            lambda pool: max(pool.overflow(), 0),
+        ),
+    )
+    for name, description, value in gauges:
+        yield f"# HELP {name} {description}"
+        yield f"# TYPE {name} gauge"
+        for labels, pool in pools:
+            yield f"{name}{{{labels}}} {value(pool)}"
+
+    yield "# HELP db_pool_timeouts_total Checkouts that gave up waiting."
+    yield "# TYPE db_pool_timeouts_total counter"
+    for labels, pool in pools:
+        yield f"db_pool_timeouts_total{{{labels}}} {pool.stats.timeouts}"
+
+    yield "# HELP db_pool_checkout_wait_seconds Time waited for a connection."
+    yield "# TYPE db_pool_checkout_wait_seconds histogram"
+    for labels, pool in pools:
+        yield from render_histogram(
+            "db_pool_checkout_wait_seconds", labels, pool.stats.checkout_wait
+        )
@@ -0,0 +1,138 @@
+"""
+Query budgets, to catch N+1 patterns in development and tests.
+
+A budget counts the statements run in its context. Every statement past
+the limit is logged with the application frames that issued it. With
+``strict`` the first one raises ``QueryBudgetExceeded`` at the offending
+call, so the traceback points at the loop that caused it.
+
+Requests get a budget from ``enforce_query_budget``, a dependency on the
+API router. The limit is ``QUERY_BUDGET`` or an override in
+``QUERY_BUDGETS`` keyed by ``"<METHOD> <route>"``; 0 turns it off. In tests
+wrap the code under test in ``assert_max_queries``:
+
+    with assert_max_queries(2):
+        response = await client.get("/api/v1/courses/1")
+"""
+
+import logging
+import traceback
+from collections.abc import AsyncIterator, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+from fastapi import Request
+from greenlet import getcurrent
+from sqlalchemy import Engine, event
+
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_APP_DIR = str(Path(__file__).resolve().parents[1])
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+@dataclass
+class QueryBudget:
+    limit: int
+    label: str = ""
+    strict: bool = False
+    statements: list[str] = field(default_factory=list)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def record(self, statement: str) -> None:
+        self.statements.append(statement)
+        if self.count <= self.limit:
+            return
+
+        message = (
+            f"{self.label or 'Query budget'}: query {self.count} exceeds "
+            f"the budget of {self.limit}\n{statement}\n{_origin()}"
+        )
+        logger.warning(message)
+        if self.strict:
+            raise QueryBudgetExceeded(message)
+
+
+_current: ContextVar[Optional[QueryBudget]] = ContextVar("query_budget", default=None)
+
+
+def _origin() -> str:
+    """The application frames that led to the current statement."""
+    stack = list(traceback.extract_stack())
+    # async sessions run the ORM in a greenlet; the awaiting coroutines are
+    # on the stack of the greenlet that switched to it
+    parent = getcurrent().parent
+    while parent is not None:
+        if parent.gr_frame is not None:
+            stack = [*traceback.extract_stack(parent.gr_frame), *stack]
+        parent = parent.parent
+    frames = [
+        frame
+        for frame in stack
+        if frame.filename.startswith(_APP_DIR) and frame.filename != __file__
+    ]
+    return "".join(traceback.format_list(frames[-5:]))
+
+
+def track_budget(engine: Engine) -> None:
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(
+        conn: Any, cursor: Any, statement: str, *args: Any
+    ) -> None:
+        budget = _current.get()
+        if budget is not None:
+            budget.record(statement)
+
+
+@contextmanager
+def query_budget(
+    limit: int, label: str = "", strict: bool = False
+) -> Iterator[QueryBudget]:
+    budget = QueryBudget(limit, label, strict)
+    token = _current.set(budget)
+    try:
+        yield budget
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def assert_max_queries(limit: int, label: str = "") -> Iterator[QueryBudget]:
+    """
+    Fail when the block runs more than ``limit`` statements.
+
+    Raises inside the block at the first statement over the limit. The
+    check is repeated on exit, because an endpoint may turn that error
+    into a 500 response.
+    """
+    with query_budget(limit, label, strict=True) as budget:
+        yield budget
+    if budget.count > limit:
+        statements = "\n\n".join(budget.statements)
+        raise QueryBudgetExceeded(
+            f"{label or 'Block'} ran {budget.count} queries, "
+            f"expected at most {limit}:\n\n{statements}"
+        )
+
+
+async def enforce_query_budget(request: Request) -> AsyncIterator[None]:
+    """Router dependency that gives each request the budget of its route."""
+    route = f"{request.method} {request.scope['route'].path}"
+    limit = settings.QUERY_BUDGETS.get(route, settings.QUERY_BUDGET)
+    # a budget set around the request, by assert_max_queries, takes precedence
+    if limit <= 0 or _current.get() is not None:
+        yield
+        return
+    with query_budget(limit, route, settings.QUERY_BUDGET_STRICT):
+        yield
@@ -0,0 +1,105 @@
+"""
+Read replicas for GET traffic.
+
+Replicas are taken in round-robin order. A replica whose connection fails
+is skipped for ``retry_after`` seconds and reads go to the next one, or to
+the primary once none is left. A replica not checked for ``check_after``
+seconds is probed with a short connect before it is handed out (one probe
+for all requests waiting on it), and a session that loses its replica
+connection marks it down, so no background task is needed.
+
+Replicas lag behind the primary. Clients that need their own writes send
+the recent-write cookie or header (see ``session.get_read_db``); their reads
+go to the primary and past the response cache, which a lagging replica may
+have refilled with the old row. For everyone else, responses cached from a
+lagging replica stay stale for at most ``CACHE_TTL_SECONDS``, the same bound
+as for writes handled by another worker.
+"""
+
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from ..core.singleflight import SingleFlight
+
+
+@dataclass
+class Replica:
+    engine: AsyncEngine
+    sessionmaker: async_sessionmaker[AsyncSession]
+    down_until: float = 0.0
+    checked_until: float = 0.0
+    failures: int = 0
+
+    @property
+    def healthy(self) -> bool:
+        return self.down_until <= time.monotonic()
+
+    @property
+    def checked(self) -> bool:
+        return self.checked_until > time.monotonic()
+
+
+class ReplicaSet:
+    def __init__(
+        self, replicas: Sequence[Replica], retry_after: float, check_after: float
+    ) -> None:
+        self.replicas = list(replicas)
+        self.retry_after = retry_after
+        self.check_after = check_after
+        self._next = 0
+        self._probes = SingleFlight()
+
+    def __len__(self) -> int:
+        return len(self.replicas)
+
+    def candidates(self) -> list[Replica]:
+        """Healthy replicas, starting with the next one in round-robin order."""
+        if not self.replicas:
+            return []
+        start = self._next % len(self.replicas)
+        self._next = start + 1
+        ordered = self.replicas[start:] + self.replicas[:start]
+        return [replica for replica in ordered if replica.healthy]
+
+    def mark_down(self, replica: Replica) -> None:
+        replica.failures += 1
+        replica.down_until = time.monotonic() + self.retry_after
+        replica.checked_until = 0.0
+
+    def mark_checked(self, replica: Replica) -> None:
+        replica.checked_until = time.monotonic() + self.check_after
+
+    async def check(self, replica: Replica) -> bool:
+        """Whether ``replica`` accepts connections, probing it if it is due."""
+        if replica.checked:
+            return True
+        return await self._probes.do("probe", id(replica), lambda: self._probe(replica))
+
+    async def _probe(self, replica: Replica) -> bool:
+        try:
+            # the connection goes straight back to the pool
+            async with replica.engine.connect():
+                pass
+        except (DBAPIError, OSError):
+            self.mark_down(replica)
+            return False
+        self.mark_checked(replica)
+        return True
+
+    def info(self) -> list[dict[str, str | int | bool]]:
+        return [
+            {
+                "url": replica.engine.url.render_as_string(hide_password=True),
+                "healthy": replica.healthy,
+                "failures": replica.failures,
+            }
+            for replica in self.replicas
+        ]
+
+    async def dispose(self) -> None:
+        for replica in self.replicas:
+            await replica.engine.dispose()
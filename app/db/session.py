@@ -1,30 +1,95 @@
 from collections.abc import AsyncGenerator
 
+from fastapi import Request, Response
+from sqlalchemy import make_url
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
 
 from ..core.config import settings
+from ..core.metrics import track_queries
+from .pool import InstrumentedPool, instrument
+from .query_budget import track_budget
+from .replicas import Replica, ReplicaSet
+
+# set after a write and honoured by get_read_db, so a client reads its own
+# writes from the primary while the replicas catch up; API clients that do
+# not keep cookies can send the header instead
+RECENT_WRITE_COOKIE = "recent_write"
+RECENT_WRITE_HEADER = "X-Recent-Write"
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# Session.info flag of the sessions get_read_db hands out; reads on them
+# may be coalesced with identical concurrent reads (crud.coalesce)
+READ_ONLY = "read_only"
+# Session.info key of the replica a read session is bound to
+REPLICA = "replica"
+# Session.info flag of read sessions pinned to the primary while replicas
+# are in use: the response cache may hold what a replica returned before it
+# caught up with the client's write, so they read past it
+BYPASS_CACHE = "bypass_cache"
+
+
+def _create_engine(url: str) -> AsyncEngine:
+    connect_args = {}
+    if make_url(url).get_driver_name() == "asyncpg":
+        connect_args["prepared_statement_cache_size"] = settings.DB_STATEMENT_CACHE_SIZE
+    engine = create_async_engine(
+        url,
+        echo=settings.DEBUG,
+        future=True,
+        poolclass=InstrumentedPool,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        connect_args=connect_args,
+    )
+    instrument(engine)
+    track_queries(engine.sync_engine)
+    track_budget(engine.sync_engine)
+    return engine
+
+
+def _sessionmaker(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        expire_on_commit=False,
+        bind=engine,
+    )
 
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=settings.DEBUG,
-    future=True,
-    pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
-)
 
-AsyncSessionLocal = async_sessionmaker(
-    autocommit=False,
-    autoflush=False,
-    bind=engine,
+engine = _create_engine(settings.DATABASE_URL)
+
+AsyncSessionLocal = _sessionmaker(engine)
+
+replicas = ReplicaSet(
+    [
+        Replica(replica_engine, _sessionmaker(replica_engine))
+        for replica_engine in map(_create_engine, settings.REPLICA_URLS)
+    ],
+    retry_after=settings.REPLICA_RETRY_SECONDS,
+    check_after=settings.REPLICA_CHECK_SECONDS,
 )
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
+async def get_db(
+    request: Request, response: Response
+) -> AsyncGenerator[AsyncSession, None]:
+    if request.method not in SAFE_METHODS and replicas:
+        response.set_cookie(
+            RECENT_WRITE_COOKIE,
+            "1",
+            max_age=settings.READ_YOUR_WRITES_SECONDS,
+            httponly=True,
+            samesite="lax",
+        )
     async with AsyncSessionLocal() as session:
         try:
             yield session
@@ -33,3 +98,59 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             raise
         finally:
             await session.close()
+
+
+async def open_read_session() -> AsyncSession:
+    """
+    Session on the next healthy replica, or on the primary when there are
+    no replicas or none of them accepts a connection.
+
+    The session checks out its connection on the first query, so a request
+    answered without one (a cache hit, a coalesced read) holds none. A
+    replica not checked recently is probed first (``ReplicaSet.check``).
+    """
+    for replica in replicas.candidates():
+        if not await replicas.check(replica):
+            continue
+        session = replica.sessionmaker()
+        session.info[REPLICA] = replica
+        return session
+    return AsyncSessionLocal()
+
+
+def _lost_connection(exc: Exception) -> bool:
+    if isinstance(exc, DBAPIError):
+        return exc.connection_invalidated or isinstance(exc.orig, OSError)
+    return isinstance(exc, OSError)
+
+
+def bypasses_cache(db: AsyncSession) -> bool:
+    return bool(db.info.get(BYPASS_CACHE))
+
+
+def reads_own_writes(request: Request) -> bool:
+    return (
+        RECENT_WRITE_COOKIE in request.cookies or RECENT_WRITE_HEADER in request.headers
+    )
+
+
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Like get_db, for handlers that only read."""
+    if reads_own_writes(request):
+        session = AsyncSessionLocal()
+        session.info[BYPASS_CACHE] = bool(replicas)
+    else:
+        session = await open_read_session()
+    session.info[READ_ONLY] = True
+    async with session:
+        try:
+            yield session
+        except Exception as exc:
+            # later requests go to the next replica; this one has failed
+            replica = session.info.get(REPLICA)
+            if replica is not None and _lost_connection(exc):
+                replicas.mark_down(replica)
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
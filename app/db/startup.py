@@ -0,0 +1,71 @@
+"""
+Startup checks and pool warm-up.
+
+The schema is owned by Alembic: instead of ``create_all``, startup compares
+the revision stamped in the database with the head of the migration
+scripts and refuses to start when they differ. Then a number of pool
+connections are opened up front and the hot statements run once on each,
+so the first requests after a scale-out neither connect nor prepare.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import Connection
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+
+ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+
+Prepare = Callable[[AsyncSession], Awaitable[None]]
+
+
+class SchemaMismatchError(RuntimeError):
+    pass
+
+
+def _current_heads(conn: Connection) -> set[str]:
+    return set(MigrationContext.configure(conn).get_current_heads())
+
+
+async def check_schema(engine: AsyncEngine) -> None:
+    """Raise ``SchemaMismatchError`` unless the database is at the head revision."""
+    # reads the revision ids from the scripts, nothing is imported or run
+    script = ScriptDirectory.from_config(Config(str(ALEMBIC_INI)))
+    expected = set(script.get_heads())
+
+    async with engine.connect() as conn:
+        current = await conn.run_sync(_current_heads)
+
+    if current != expected:
+        raise SchemaMismatchError(
+            f"Database schema is at {', '.join(sorted(current)) or 'no revision'}, "
+            f"the code expects {', '.join(sorted(expected))}; "
+            "run `alembic upgrade head`"
+        )
+
+
+async def _warm(conn: AsyncConnection, prepare: Prepare) -> None:
+    async with AsyncSession(bind=conn) as db:
+        await prepare(db)
+        await db.rollback()
+
+
+async def warm_pool(engine: AsyncEngine, connections: int, prepare: Prepare) -> None:
+    """
+    Open ``connections`` pool connections at once and run ``prepare`` on
+    each, which fills the per-connection prepared statement cache.
+    """
+    conns = []
+    try:
+        # held together, so the pool has to open every one of them
+        for _ in range(connections):
+            conns.append(await engine.connect())
+        await asyncio.gather(*(_warm(conn, prepare) for conn in conns))
+    finally:
+        for conn in conns:
+            # back to the pool, still open
+            await conn.close()
@@ -0,0 +1,16 @@
+from ..importer.loader import ImportReport, import_catalog
+from ..importer.reader import (
+    CatalogImportError,
+    ImportSource,
+    read_rows,
+    source_format,
+)
+
+__all__ = [
+    "CatalogImportError",
+    "ImportReport",
+    "ImportSource",
+    "import_catalog",
+    "read_rows",
+    "source_format",
+]
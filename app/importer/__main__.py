@@ -0,0 +1,66 @@
+"""
+Import a catalog from NDJSON or CSV files.
+
+    python -m app.importer --courses courses.ndjson --lessons lessons.csv \
+        --exercises exercises.ndjson
+
+Lessons reference courses by ``course_id`` or by the ``course_key`` of a
+course row with that ``key``; exercises use ``lesson_id`` / ``lesson_key``.
+"""
+
+import argparse
+import asyncio
+import sys
+from contextlib import ExitStack
+from typing import Optional
+
+from ..core.config import settings
+from ..db.session import engine
+from .loader import ImportReport, import_catalog
+from .reader import CatalogImportError, ImportSource, source_format
+
+
+def _open(stack: ExitStack, path: Optional[str]) -> Optional[ImportSource]:
+    if path is None:
+        return None
+    file = stack.enter_context(open(path, encoding="utf-8", newline=""))
+    return ImportSource(path, file, source_format(path))
+
+
+async def _run(args: argparse.Namespace) -> ImportReport:
+    try:
+        with ExitStack() as stack:
+            return await import_catalog(
+                courses=_open(stack, args.courses),
+                lessons=_open(stack, args.lessons),
+                exercises=_open(stack, args.exercises),
+                chunk_size=args.chunk_size,
+            )
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--courses", help="course rows (.ndjson, .jsonl or .csv)")
+    parser.add_argument("--lessons", help="lesson rows")
+    parser.add_argument("--exercises", help="exercise rows")
+    parser.add_argument("--chunk-size", type=int, default=settings.IMPORT_CHUNK_SIZE)
+    args = parser.parse_args()
+    if not (args.courses or args.lessons or args.exercises):
+        parser.error("nothing to import")
+
+    try:
+        report = asyncio.run(_run(args))
+    except CatalogImportError as exc:
+        sys.exit(f"Import failed, nothing was written: {exc}")
+
+    print(
+        f"Imported {report.courses} courses, {report.lessons} lessons and "
+        f"{report.exercises} exercises in {report.seconds:.2f} s "
+        f"({report.rows_per_second:,.0f} rows/s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,285 @@
+"""
+Catalog import through PostgreSQL COPY.
+
+Rows are validated with the existing Create schemas and get their ids from
+the table sequences before they are written, so lessons and exercises can
+reference parents from the same import by an external ``key``. Each chunk
+is copied into a temporary staging table with asyncpg
+``copy_records_to_table``. The staging tables are then merged with
+INSERT ... SELECT and the row counters are raised. All of it runs in one
+transaction, so a failed import leaves no rows behind.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import column, exists, func, insert, literal, select, table, text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from ..core.cache import suggest_cache
+from ..crud import counts
+from ..db.base import Base
+from ..db.session import engine
+from ..models import Course, Exercise, Lesson
+from ..schemas import CourseCreate, ExerciseCreate, LessonCreate
+from .reader import CatalogImportError, ImportSource, chunked, read_rows
+
+
+@dataclass(frozen=True)
+class _Target:
+    model: type[Base]
+    schema: type[BaseModel]
+    parent: Optional[type[Base]] = None
+    # column holding the parent id and the external key that may replace it
+    parent_column: str = ""
+    parent_key: str = ""
+    # counters maintained for the table and per value of ``group_column``
+    scope: str = ""
+    group_scope: str = ""
+    group_column: str = ""
+
+    @property
+    def columns(self) -> list[str]:
+        return ["id", *self.schema.model_fields]
+
+    @property
+    def staging(self) -> str:
+        return f"import_{self.model.__tablename__}"
+
+
+COURSES = _Target(
+    Course,
+    CourseCreate,
+    scope=counts.COURSES,
+    group_scope=counts.AUTHOR_COURSES,
+    group_column="author_id",
+)
+LESSONS = _Target(
+    Lesson,
+    LessonCreate,
+    Course,
+    "course_id",
+    "course_key",
+    counts.LESSONS,
+    counts.COURSE_LESSONS,
+    "course_id",
+)
+EXERCISES = _Target(
+    Exercise,
+    ExerciseCreate,
+    Lesson,
+    "lesson_id",
+    "lesson_key",
+    counts.EXERCISES,
+    counts.LESSON_EXERCISES,
+    "lesson_id",
+)
+
+
+@dataclass
+class ImportReport:
+    courses: int = 0
+    lessons: int = 0
+    exercises: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows(self) -> int:
+        return self.courses + self.lessons + self.exercises
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    def as_dict(self) -> dict[str, int | float]:
+        return {
+            "courses": self.courses,
+            "lessons": self.lessons,
+            "exercises": self.exercises,
+            "rows": self.rows,
+            "seconds": round(self.seconds, 3),
+            "rows_per_second": round(self.rows_per_second, 1),
+        }
+
+
+async def import_catalog(
+    courses: Optional[ImportSource] = None,
+    lessons: Optional[ImportSource] = None,
+    exercises: Optional[ImportSource] = None,
+    chunk_size: int = 5000,
+) -> ImportReport:
+    """
+    Import courses, lessons and exercises in one transaction.
+
+    A lesson names its course either by ``course_id`` (an existing course) or
+    by ``course_key`` (the ``key`` of a course in this import); exercises use
+    ``lesson_id`` / ``lesson_key`` the same way.
+    """
+    report = ImportReport()
+    started = time.perf_counter()
+
+    async with engine.connect() as conn:
+        if conn.dialect.driver != "asyncpg":
+            raise CatalogImportError("Bulk import requires PostgreSQL with asyncpg")
+
+        async with conn.begin():
+            course_keys: dict[str, int] = {}
+            lesson_keys: dict[str, int] = {}
+            staged: list[_Target] = []
+
+            if courses is not None:
+                report.courses = await _stage(
+                    conn, COURSES, courses, chunk_size, keys=course_keys
+                )
+                staged.append(COURSES)
+            if lessons is not None:
+                report.lessons = await _stage(
+                    conn, LESSONS, lessons, chunk_size, course_keys, lesson_keys
+                )
+                staged.append(LESSONS)
+            if exercises is not None:
+                report.exercises = await _stage(
+                    conn, EXERCISES, exercises, chunk_size, lesson_keys
+                )
+                staged.append(EXERCISES)
+
+            for target in staged:
+                await _merge(conn, target)
+
+    if report.courses:
+        suggest_cache.clear()
+    report.seconds = time.perf_counter() - started
+    return report
+
+
+async def _stage(
+    conn: AsyncConnection,
+    target: _Target,
+    source: ImportSource,
+    chunk_size: int,
+    parents: Optional[dict[str, int]] = None,
+    keys: Optional[dict[str, int]] = None,
+) -> int:
+    tablename = target.model.__tablename__
+    await conn.execute(
+        text(
+            f"CREATE TEMPORARY TABLE {target.staging} "
+            f"(LIKE {tablename} INCLUDING DEFAULTS) ON COMMIT DROP"
+        )
+    )
+    # COPY goes through the asyncpg connection inside the same transaction
+    raw = await conn.get_raw_connection()
+    driver = raw.driver_connection
+    assert driver is not None
+
+    # reading, parsing and validating the rows run in a worker thread, so a
+    # large upload does not hold up the event loop between COPY chunks
+    chunks = chunked(read_rows(source), chunk_size)
+    chunk: list[Any]
+    count = 0
+    while chunk := await asyncio.to_thread(next, chunks, []):
+        ids = await _allocate_ids(conn, tablename, len(chunk))
+        records = await asyncio.to_thread(
+            _records, target, source.name, chunk, ids, parents, keys
+        )
+        await driver.copy_records_to_table(
+            target.staging, records=records, columns=target.columns
+        )
+        count += len(records)
+
+    return count
+
+
+async def _allocate_ids(conn: AsyncConnection, tablename: str, count: int) -> list[int]:
+    sequence = func.pg_get_serial_sequence(tablename, "id")
+    stmt = select(func.nextval(sequence)).select_from(func.generate_series(1, count))
+    result = await conn.scalars(stmt)
+    return list(result.all())
+
+
+def _records(
+    target: _Target,
+    name: str,
+    chunk: list[tuple[int, dict[str, Any]]],
+    ids: list[int],
+    parents: Optional[dict[str, int]],
+    keys: Optional[dict[str, int]],
+) -> list[tuple[Any, ...]]:
+    return [
+        _record(target, f"{name}:{line_num}", row, new_id, parents, keys)
+        for (line_num, row), new_id in zip(chunk, ids)
+    ]
+
+
+def _record(
+    target: _Target,
+    where: str,
+    row: dict[str, Any],
+    new_id: int,
+    parents: Optional[dict[str, int]],
+    keys: Optional[dict[str, int]],
+) -> tuple[Any, ...]:
+    key = row.pop("key", None)
+
+    if target.parent_key in row:
+        parent_key = str(row.pop(target.parent_key))
+        if parents is None or parent_key not in parents:
+            raise CatalogImportError(
+                f"{where}: unknown {target.parent_key} {parent_key!r}"
+            )
+        row[target.parent_column] = parents[parent_key]
+
+    try:
+        item = target.schema.model_validate(row)
+    except ValidationError as exc:
+        errors = "; ".join(
+            f"{'.'.join(map(str, error['loc']))}: {error['msg']}"
+            for error in exc.errors()
+        )
+        raise CatalogImportError(f"{where}: {errors}") from None
+
+    if keys is not None and key is not None:
+        key = str(key)
+        if key in keys:
+            raise CatalogImportError(f"{where}: duplicate key {key!r}")
+        keys[key] = new_id
+
+    return (new_id, *item.model_dump().values())
+
+
+async def _merge(conn: AsyncConnection, target: _Target) -> None:
+    staging = table(target.staging, *(column(name) for name in target.columns))
+
+    if target.parent is not None:
+        parent_id = staging.c[target.parent_column]
+        stmt = (
+            select(parent_id)
+            .where(~exists().where(target.parent.__table__.c.id == parent_id))
+            .distinct()
+            .limit(10)
+        )
+        missing = (await conn.scalars(stmt)).all()
+        if missing:
+            raise CatalogImportError(
+                f"{target.parent.__tablename__} not found: "
+                f"{', '.join(map(str, missing))}"
+            )
+
+    await conn.execute(
+        insert(target.model).from_select(
+            target.columns, select(*staging.c).order_by(staging.c.id)
+        )
+    )
+
+    await counts.add_counts_from(
+        conn,
+        select(literal(target.scope), literal(0), func.count()).select_from(staging),
+    )
+    group_id = staging.c[target.group_column]
+    await counts.add_counts_from(
+        conn,
+        select(literal(target.group_scope), group_id, func.count()).group_by(group_id),
+    )
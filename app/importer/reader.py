@@ -0,0 +1,65 @@
+import csv
+import json
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from pathlib import PurePath
+from typing import IO, Any, Literal, NamedTuple
+
+Format = Literal["ndjson", "csv"]
+
+SUFFIXES: dict[str, Format] = {
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+    ".csv": "csv",
+}
+
+
+class CatalogImportError(Exception):
+    pass
+
+
+class ImportSource(NamedTuple):
+    """A text stream of course, lesson or exercise rows."""
+
+    name: str
+    file: IO[str]
+    format: Format
+
+
+def source_format(filename: str) -> Format:
+    suffix = PurePath(filename).suffix.lower()
+    try:
+        return SUFFIXES[suffix]
+    except KeyError:
+        raise CatalogImportError(
+            f"{filename}: unsupported file type, expected one of {', '.join(SUFFIXES)}"
+        ) from None
+
+
+def read_rows(source: ImportSource) -> Iterator[tuple[int, dict[str, Any]]]:
+    """Yield ``(line number, row)`` pairs without loading the whole file."""
+    if source.format == "csv":
+        reader = csv.DictReader(source.file)
+        for row in reader:
+            # CSV has no NULL, an empty cell means the field is not set
+            yield reader.line_num, {
+                name: value for name, value in row.items() if value != ""
+            }
+        return
+
+    for line_num, line in enumerate(source.file, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as exc:
+            raise CatalogImportError(f"{source.name}:{line_num}: {exc}") from None
+        if not isinstance(row, dict):
+            raise CatalogImportError(f"{source.name}:{line_num}: expected an object")
+        yield line_num, row
+
+
+def chunked(rows: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
@@ -1,23 +1,48 @@
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
+from sqlalchemy.exc import DBAPIError
 
 from .api.v1.api_router import api_router
+from .api.v1.ids import MISSING_IDS_HEADER
+from .api.v1.pagination import NEXT_CURSOR_HEADER, TOTAL_COUNT_HEADER
+from .api.v1.warmup import prepare_hot_statements
 from .core.config import settings
-from .db.base import Base
-from .db.session import engine
+from .core.metrics import MetricsMiddleware, request_metrics
+from .crud.coalesce import read_flights
+from .crud.pagination import InvalidCursorError
+from .db.pool import render_pools
+from .db.session import engine, replicas
+from .db.startup import check_schema, warm_pool
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     print("Starting...")
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    app.state.ready = False
+    if settings.SCHEMA_CHECK:
+        await check_schema(engine)
+    warmup = min(settings.DB_POOL_WARMUP, settings.DB_POOL_SIZE)
+    await warm_pool(engine, warmup, prepare_hot_statements)
+    for replica in replicas.replicas:
+        try:
+            await warm_pool(replica.engine, warmup, prepare_hot_statements)
+        except (DBAPIError, OSError):
+            # reads fall back to the primary until the replica is back
+            replicas.mark_down(replica)
+        else:
+            replicas.mark_checked(replica)
+    app.state.ready = True
     yield
 
     print("Stopping...")
+    # fail readiness first, so the load balancer stops sending requests
+    app.state.ready = False
+    await replicas.dispose()
+    await engine.dispose()
 
 
 app = FastAPI(
@@ -33,8 +58,24 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, TOTAL_COUNT_HEADER, MISSING_IDS_HEADER, "ETag"],
 )
 
+if settings.METRICS_ENABLED:
+    # added last so that it wraps everything, CORS preflights included
+    app.add_middleware(MetricsMiddleware)
+
+
+@app.exception_handler(InvalidCursorError)
+async def invalid_cursor_handler(
+    request: Request, exc: InvalidCursorError
+) -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content={"detail": str(exc)},
+    )
+
+
 app.include_router(
     api_router,
     prefix="/api/v1",
@@ -49,3 +90,33 @@ def health_check() -> dict[str, str]:
         "docs": "/docs",
         "status": "running",
     }
+
+
+@app.get("/ready", tags=["Root"])
+def readiness_check(request: Request) -> JSONResponse:
+    """Ready once the schema is checked and the pool is warm, unlike ``/``."""
+    if not getattr(request.app.state, "ready", False):
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"status": "starting"},
+        )
+    return JSONResponse(content={"status": "ready"})
+
+
+@app.get(
+    "/metrics",
+    tags=["Root"],
+    response_class=PlainTextResponse,
+    include_in_schema=False,
+)
+def metrics() -> PlainTextResponse:
+    pools = [("primary", engine)]
+    pools += [(f"replica{i}", r.engine) for i, r in enumerate(replicas.replicas, 1)]
+    lines = [
+        *request_metrics.render(),
+        *render_pools(pools),
+        *read_flights.render("db_read_calls_total"),
+    ]
+    return PlainTextResponse(
+        "\n".join(lines) + "\n", media_type="text/plain; version=0.0.4"
+    )
@@ -1,12 +1,13 @@
 """
 usage
-from app.models import Course, Lesson, Exercise
+from app.models import Course, Lesson, Exercise, Counter
 """
 
 from typing import List
 
+from ..models.counter import Counter
 from ..models.course import Course
 from ..models.exercise import Exercise
 from ..models.lesson import Lesson
 
-__all__: List = [Course, Lesson, Exercise]
+__all__: List = [Course, Lesson, Exercise, Counter]
@@ -0,0 +1,21 @@
+from sqlalchemy import BigInteger, Column, Integer, String
+
+from ..db.base import Base
+
+
+class Counter(Base):
+    """
+    Row counts maintained in the same transaction as the writes.
+
+    ``scope_id`` is 0 for table totals and the parent id for per-course
+    lesson and per-lesson exercise counts.
+    """
+
+    __tablename__ = "counters"
+
+    scope = Column(String(32), primary_key=True)
+    scope_id = Column(Integer, primary_key=True, default=0)
+    value = Column(BigInteger, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return f"<Counter(scope='{self.scope}', scope_id={self.scope_id}, value={self.value})>"
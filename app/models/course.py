@@ -1,4 +1,4 @@
-from sqlalchemy import Column, DateTime, Integer, String, Text, func
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text, func
 from sqlalchemy.orm import relationship
 
 from ..db.base import Base
@@ -6,6 +6,16 @@ from ..db.base import Base
 
 class Course(Base):
     __tablename__ = "courses"
+    __table_args__ = (
+        Index("ix_courses_author_id_id", "author_id", "id"),
+        # needs the pg_trgm extension, created by the e5a83c1f6d07 migration
+        Index(
+            "ix_courses_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     author_id = Column(Integer, nullable=False)
@@ -18,6 +28,8 @@ class Course(Base):
         "Lesson",
         back_populates="course",
         cascade="all, delete-orphan",
+        order_by="Lesson.id",
+        passive_deletes=True,
     )
 
     def __repr__(self) -> str:
@@ -29,6 +29,8 @@ class Lesson(Base):
         "Exercise",
         back_populates="lesson",
         cascade="all, delete-orphan",
+        order_by="Exercise.id",
+        passive_deletes=True,
     )
 
     def __repr__(self) -> str:
@@ -3,14 +3,30 @@ usage
 from app.schemas import CourseCreate, LessonResponse, ExerciseUpdate
 """
 
-from ..schemas.course import CourseBase, CourseCreate, CourseResponse, CourseUpdate
+from ..schemas.bulk import BulkItemResult
+from ..schemas.course import (
+    AuthorCourseResponse,
+    CourseBase,
+    CourseCreate,
+    CourseResponse,
+    CourseSuggestion,
+    CourseTreeResponse,
+    CourseUpdate,
+)
 from ..schemas.exercise import (
     ExerciseBase,
     ExerciseCreate,
     ExerciseResponse,
     ExerciseUpdate,
 )
-from ..schemas.lesson import LessonBase, LessonCreate, LessonResponse, LessonUpdate
+from ..schemas.lesson import (
+    LessonBase,
+    LessonCreate,
+    LessonResponse,
+    LessonTreeResponse,
+    LessonUpdate,
+)
+from ..schemas.search import SearchKind, SearchResult
 
 __all__ = [
     # Course
@@ -18,14 +34,23 @@ __all__ = [
     "CourseCreate",
     "CourseUpdate",
     "CourseResponse",
+    "CourseTreeResponse",
+    "CourseSuggestion",
+    "AuthorCourseResponse",
     # Lesson
     "LessonBase",
     "LessonCreate",
     "LessonUpdate",
     "LessonResponse",
+    "LessonTreeResponse",
     # Exercise
     "ExerciseBase",
     "ExerciseCreate",
     "ExerciseUpdate",
     "ExerciseResponse",
+    # Bulk
+    "BulkItemResult",
+    # Search
+    "SearchKind",
+    "SearchResult",
 ]
@@ -0,0 +1,12 @@
+from typing import Generic, Optional, TypeVar
+
+from pydantic import BaseModel, Field
+
+T = TypeVar("T")
+
+
+class BulkItemResult(BaseModel, Generic[T]):
+    index: int = Field(description="Position of the item in the request body")
+    created: bool = Field(description="Whether the item was created")
+    item: Optional[T] = Field(None, description="Created item")
+    detail: Optional[str] = Field(None, description="Reason the item was rejected")
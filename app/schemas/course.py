@@ -1,8 +1,10 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
+from .lesson import LessonTreeResponse
+
 
 class CourseBase(BaseModel):
 
@@ -35,3 +37,19 @@ class CourseResponse(CourseBase):
     updated_at: datetime = Field(description="Modification date")
 
     model_config = {"from_attributes": True}
+
+
+class CourseTreeResponse(CourseResponse):
+    lessons: List[LessonTreeResponse] = Field(
+        description="Lessons of the course with their exercises"
+    )
+
+
+class AuthorCourseResponse(CourseResponse):
+    lesson_count: int = Field(description="Number of lessons in the course")
+    exercise_count: int = Field(description="Number of exercises in the course")
+
+
+class CourseSuggestion(BaseModel):
+    id: int
+    title: str
@@ -1,8 +1,10 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
+from .exercise import ExerciseResponse
+
 
 class LessonBase(BaseModel):
     title: str = Field(
@@ -37,3 +39,7 @@ class LessonResponse(LessonBase):
     updated_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class LessonTreeResponse(LessonResponse):
+    exercises: List[ExerciseResponse] = Field(description="Exercises of the lesson")
@@ -0,0 +1,15 @@
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+SearchKind = Literal["course", "lesson", "exercise"]
+
+
+class SearchResult(BaseModel):
+    type: SearchKind = Field(description="Kind of the matched item")
+    id: int = Field(description="Id of the matched item")
+    title: str
+    snippet: str = Field(
+        description="Matching fragments with the search terms wrapped in <mark>"
+    )
+    rank: float = Field(description="Relevance, higher is better")
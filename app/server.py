@@ -0,0 +1,118 @@
+"""
+Production entry point:
+
+    python -m app.server --host 0.0.0.0 --port 8000
+
+Runs uvicorn with uvloop and httptools, one worker process per available
+CPU unless ``WORKERS`` says otherwise. Every worker has its own connection
+pool, so the pool size and overflow are scaled down until all workers
+together fit in ``DB_MAX_CONNECTIONS``.
+
+On SIGTERM a worker first fails ``/ready`` and keeps serving for
+``SHUTDOWN_DRAIN_SECONDS``, giving the load balancer time to stop sending
+it requests. It then stops accepting connections and waits up to
+``SHUTDOWN_TIMEOUT_SECONDS`` for the requests in flight. A second signal,
+or SIGINT, skips the drain.
+"""
+
+import argparse
+import math
+import os
+import signal
+import time
+from pathlib import Path
+from types import FrameType
+from typing import Optional
+
+import uvicorn
+from uvicorn.supervisors import Multiprocess
+
+from .core.config import settings
+
+CGROUP_CPU_MAX = Path("/sys/fs/cgroup/cpu.max")
+
+
+def available_cpus() -> int:
+    """CPUs this process may use: its affinity mask, capped by a cgroup quota."""
+    if hasattr(os, "sched_getaffinity"):
+        cpus = len(os.sched_getaffinity(0))
+    else:
+        cpus = os.cpu_count() or 1
+    try:
+        quota, period = CGROUP_CPU_MAX.read_text().split()
+        if quota != "max":
+            cpus = min(cpus, max(math.ceil(int(quota) / int(period)), 1))
+    except (OSError, ValueError):
+        pass
+    return cpus
+
+
+def pool_per_worker(workers: int) -> tuple[int, int]:
+    """Pool size and overflow for each worker, within ``DB_MAX_CONNECTIONS``."""
+    share = max(settings.DB_MAX_CONNECTIONS // workers, 1)
+    size = min(settings.DB_POOL_SIZE, share)
+    overflow = min(settings.DB_MAX_OVERFLOW, share - size)
+    return size, overflow
+
+
+class DrainingServer(uvicorn.Server):
+    drain_until: Optional[float] = None
+
+    def handle_exit(self, sig: int, frame: Optional[FrameType]) -> None:
+        draining = self.drain_until is not None
+        if draining or sig != signal.SIGTERM or settings.SHUTDOWN_DRAIN_SECONDS <= 0:
+            super().handle_exit(sig, frame)
+            return
+
+        from .main import app
+
+        app.state.ready = False
+        self.drain_until = time.monotonic() + settings.SHUTDOWN_DRAIN_SECONDS
+
+    async def on_tick(self, counter: int) -> bool:
+        if self.drain_until is not None and time.monotonic() >= self.drain_until:
+            self.should_exit = True
+        return await super().on_tick(counter)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the API in production mode.")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument(
+        "--workers", type=int, default=settings.WORKERS or available_cpus()
+    )
+    args = parser.parse_args()
+
+    # spawned workers read their settings from the environment again
+    pool_size, max_overflow = pool_per_worker(args.workers)
+    os.environ["DB_POOL_SIZE"] = str(pool_size)
+    os.environ["DB_MAX_OVERFLOW"] = str(max_overflow)
+    settings.DB_POOL_SIZE = pool_size
+    settings.DB_MAX_OVERFLOW = max_overflow
+    print(
+        f"{args.workers} workers, pool {pool_size} + {max_overflow} overflow each, "
+        f"{args.workers * (pool_size + max_overflow)} connections at most per database"
+    )
+
+    config = uvicorn.Config(
+        "app.main:app",
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        loop="uvloop",
+        http="httptools",
+        timeout_graceful_shutdown=settings.SHUTDOWN_TIMEOUT_SECONDS,
+    )
+    server = DrainingServer(config)
+    if args.workers == 1:
+        server.run()
+        return
+
+    # what uvicorn.run does for workers > 1, but with the draining server
+    sock = config.bind_socket()
+    Multiprocess(config, target=server.run, sockets=[sock]).run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,18 @@
+"""
+Benchmark: latency, throughput and query counts of every API endpoint.
+
+``run`` seeds a deterministic catalog of N courses x M lessons x K
+exercises, drives each route of ``api_router`` in-process and writes a JSON
+report. ``compare`` diffs two reports and exits with 1 on regressions, so
+it can gate a release.
+
+The database is the one configured in ``.env`` or given with
+``--database``; a SQLite file works as a stand-in, though search only runs
+on PostgreSQL. Seeding refuses a database that already holds courses
+unless ``--reset`` is passed, which deletes them.
+
+    python -m benchmarks.api run --database sqlite+aiosqlite:///bench.db \\
+        --reset --output before.json
+    python -m benchmarks.api run --reset --courses 200 --output after.json
+    python -m benchmarks.api compare before.json after.json --threshold 0.1
+"""
@@ -0,0 +1,67 @@
+import argparse
+import asyncio
+import json
+import os
+import sys
+from pathlib import Path
+
+from . import __doc__ as DESCRIPTION
+from .compare import compare
+
+
+async def _run(args: argparse.Namespace) -> None:
+    # the app reads its settings on import, after --database is applied
+    from app.db.session import engine
+
+    from .runner import run
+    from .seed import Catalog, seed
+
+    catalog = Catalog(args.courses, args.lessons, args.exercises)
+    try:
+        if not args.no_seed:
+            await seed(engine, catalog, reset=args.reset)
+        report = await run(catalog, args.requests, args.concurrency, args.warmup)
+    finally:
+        await engine.dispose()
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n")
+        print(f"report written to {args.output}", file=sys.stderr)
+    else:
+        print(output)
+
+
+def main() -> None:
+    assert DESCRIPTION
+    parser = argparse.ArgumentParser(description=DESCRIPTION.splitlines()[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="seed, drive every endpoint, report")
+    run.add_argument("--database", help="DSN, overrides the one in .env")
+    run.add_argument("--courses", type=int, default=100)
+    run.add_argument("--lessons", type=int, default=10, help="per course")
+    run.add_argument("--exercises", type=int, default=10, help="per lesson")
+    run.add_argument("--requests", type=int, default=200, help="per endpoint")
+    run.add_argument("--concurrency", type=int, default=1)
+    run.add_argument("--warmup", type=int, default=10)
+    run.add_argument("--reset", action="store_true", help="replace existing rows")
+    run.add_argument("--no-seed", action="store_true", help="use the data as is")
+    run.add_argument("--output", type=Path, help="JSON report, stdout by default")
+
+    diff = commands.add_parser("compare", help="flag regressions between two runs")
+    diff.add_argument("old", type=Path)
+    diff.add_argument("new", type=Path)
+    diff.add_argument("--threshold", type=float, default=0.1)
+
+    args = parser.parse_args()
+    if args.command == "compare":
+        sys.exit(compare(args.old, args.new, args.threshold))
+
+    if args.database:
+        os.environ["DB_URL"] = args.database
+    asyncio.run(_run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Compares two benchmark reports and flags regressions.
+
+An endpoint regresses when its p50 or p95 latency grows, or its request
+rate drops, by more than the threshold, or when it runs more queries per
+request than before. Query counts are deterministic, so any growth there
+counts; latency needs the threshold to absorb noise.
+"""
+
+import json
+from pathlib import Path
+from typing import Any
+
+LATENCY_KEYS = ("p50_ms", "p95_ms")
+
+
+def load(path: Path) -> dict[str, Any]:
+    with path.open() as file:
+        report: dict[str, Any] = json.load(file)
+    return report
+
+
+def regressions(
+    old: dict[str, Any], new: dict[str, Any], threshold: float
+) -> list[str]:
+    """One line per regressed metric, empty when there are none."""
+    found = []
+    for name, before in old["endpoints"].items():
+        after = new["endpoints"].get(name)
+        if after is None:
+            continue
+        for key in LATENCY_KEYS:
+            if before[key] and after[key] > before[key] * (1 + threshold):
+                found.append(
+                    f"{name}: {key} {before[key]:.2f} -> {after[key]:.2f} "
+                    f"({after[key] / before[key] - 1:+.0%})"
+                )
+        if before["rps"] and after["rps"] < before["rps"] * (1 - threshold):
+            found.append(
+                f"{name}: rps {before['rps']:.1f} -> {after['rps']:.1f} "
+                f"({after['rps'] / before['rps'] - 1:+.0%})"
+            )
+        if after["queries_per_request"] > before["queries_per_request"]:
+            found.append(
+                f"{name}: queries per request {before['queries_per_request']} "
+                f"-> {after['queries_per_request']}"
+            )
+    return found
+
+
+def compare(old_path: Path, new_path: Path, threshold: float) -> int:
+    """Print the comparison and return the exit status, 1 on regressions."""
+    old, new = load(old_path), load(new_path)
+    for key in ("database", "courses", "lessons_per_course", "exercises_per_lesson"):
+        if old["meta"].get(key) != new["meta"].get(key):
+            print(
+                f"warning: runs differ in {key}: "
+                f"{old['meta'].get(key)} vs {new['meta'].get(key)}"
+            )
+
+    print(f"{'endpoint':<52} {'p50 ms':>17} {'p95 ms':>17} {'q/req':>11}")
+    for name, before in old["endpoints"].items():
+        after = new["endpoints"].get(name)
+        if after is None:
+            print(f"{name:<52} missing from {new_path}")
+            continue
+        print(
+            f"{name:<52} "
+            f"{before['p50_ms']:8.2f} {after['p50_ms']:8.2f} "
+            f"{before['p95_ms']:8.2f} {after['p95_ms']:8.2f} "
+            f"{before['queries_per_request']:5.1f} {after['queries_per_request']:5.1f}"
+        )
+    for name in new["endpoints"].keys() - old["endpoints"].keys():
+        print(f"{name:<52} new in {new_path}")
+
+    found = regressions(old, new, threshold)
+    if not found:
+        print(f"\nno regressions above {threshold:.0%}")
+        return 0
+    print(f"\n{len(found)} regressions above {threshold:.0%}:")
+    for line in found:
+        print(f"  {line}")
+    return 1
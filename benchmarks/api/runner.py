@@ -0,0 +1,352 @@
+"""
+Drives the API in-process and measures each endpoint.
+
+Requests go through ``httpx.AsyncClient`` with an ``ASGITransport``, so the
+whole stack runs (middleware, validation, serialization, the database) but
+no sockets or server processes are involved. Queries per request are
+counted with a query budget that never runs out.
+"""
+
+import asyncio
+import platform
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+import httpx
+from fastapi.routing import APIRoute
+
+from app.db.query_budget import query_budget
+from app.db.session import engine
+from app.main import app
+
+from .seed import AUTHORS, Catalog
+
+PREFIX = "/api/v1"
+
+# routes the benchmark leaves out on purpose
+SKIPPED_ROUTES = {
+    # needs multipart files and PostgreSQL COPY, see the importer CLI instead
+    f"POST {PREFIX}/internal/import",
+}
+
+
+@dataclass(frozen=True)
+class Scenario:
+    method: str
+    route: str
+    # request number -> URL and JSON body
+    url: Callable[[int], str]
+    body: Optional[Callable[[int], Any]] = None
+    # a share of ``requests`` for slow endpoints such as the exports
+    weight: float = 1.0
+    # ids returned by this scenario are kept for the ones after it
+    collect: Optional[str] = None
+    # one request per id kept under this key, instead of ``requests``
+    consume: Optional[str] = None
+
+    @property
+    def name(self) -> str:
+        return f"{self.method} {PREFIX}{self.route}"
+
+
+@dataclass
+class Measurement:
+    latencies: list[float] = field(default_factory=list)
+    queries: list[int] = field(default_factory=list)
+    errors: int = 0
+    seconds: float = 0.0
+    status: int = 0
+
+    def report(self) -> dict[str, Any]:
+        ms = sorted(latency * 1000 for latency in self.latencies)
+        cuts = (
+            statistics.quantiles(ms, n=100, method="inclusive") if len(ms) > 1 else []
+        )
+        return {
+            "requests": len(ms),
+            "errors": self.errors,
+            "status": self.status,
+            "p50_ms": round(cuts[49] if cuts else ms[0], 3),
+            "p95_ms": round(cuts[94] if cuts else ms[0], 3),
+            "p99_ms": round(cuts[98] if cuts else ms[0], 3),
+            "rps": round(len(ms) / self.seconds, 1) if self.seconds else 0.0,
+            "queries_per_request": round(statistics.fmean(self.queries), 2),
+        }
+
+
+def scenarios(catalog: Catalog, created: dict[str, list[int]]) -> list[Scenario]:
+    def spread(count: int) -> Callable[[int], int]:
+        # a fixed, well spread sequence of ids in 1..count
+        return lambda i: 1 + (i * 7919) % count
+
+    course = spread(catalog.courses)
+    lesson = spread(catalog.lessons)
+    exercise = spread(catalog.exercises)
+    author = spread(AUTHORS)
+
+    def new(key: str) -> Callable[[int], int]:
+        return lambda i: created[key][i % len(created[key])]
+
+    return [
+        Scenario("GET", "/courses", lambda i: f"/courses?limit=20&skip={i % 5 * 20}"),
+        Scenario(
+            "GET",
+            "/courses",
+            lambda i: f"/courses?limit=20&fields=id,title&author_id={author(i)}",
+        ),
+        Scenario("GET", "/courses/suggest", lambda i: f"/courses/suggest?prefix=C{i}"),
+        Scenario("GET", "/courses/{course_id}", lambda i: f"/courses/{course(i)}"),
+        Scenario(
+            "GET", "/courses/{course_id}/tree", lambda i: f"/courses/{course(i)}/tree"
+        ),
+        Scenario(
+            "GET",
+            "/authors/{author_id}/courses",
+            lambda i: f"/authors/{author(i)}/courses?limit=20",
+        ),
+        Scenario("GET", "/lessons", lambda i: "/lessons?limit=20"),
+        Scenario("GET", "/lessons/{lesson_id}", lambda i: f"/lessons/{lesson(i)}"),
+        Scenario(
+            "GET",
+            "/lessons/courses/{course_id}/lessons",
+            lambda i: f"/lessons/courses/{course(i)}/lessons",
+        ),
+        Scenario("GET", "/exercises", lambda i: "/exercises?limit=20"),
+        Scenario(
+            "GET", "/exercises/{exercise_id}", lambda i: f"/exercises/{exercise(i)}"
+        ),
+        Scenario(
+            "GET",
+            "/exercises/lessons/{lesson_id}/exercises",
+            lambda i: f"/exercises/lessons/{lesson(i)}/exercises",
+        ),
+        Scenario("GET", "/search", lambda i: "/search?q=python+loops", weight=0.5),
+        Scenario(
+            "GET",
+            "/export/courses.ndjson",
+            lambda i: "/export/courses.ndjson",
+            weight=0.05,
+        ),
+        Scenario(
+            "GET",
+            "/export/lessons.ndjson",
+            lambda i: "/export/lessons.ndjson",
+            weight=0.05,
+        ),
+        Scenario(
+            "GET",
+            "/export/exercises.ndjson",
+            lambda i: "/export/exercises.ndjson",
+            weight=0.05,
+        ),
+        Scenario(
+            "GET",
+            "/export/catalog.ndjson",
+            lambda i: "/export/catalog.ndjson",
+            weight=0.05,
+        ),
+        Scenario("GET", "/internal/cache", lambda i: "/internal/cache"),
+        Scenario("GET", "/internal/cache/suggest", lambda i: "/internal/cache/suggest"),
+        Scenario("GET", "/internal/replicas", lambda i: "/internal/replicas"),
+        Scenario("GET", "/internal/pool", lambda i: "/internal/pool"),
+        # writes last, on rows of their own so the reads above see the seed
+        Scenario(
+            "POST",
+            "/courses",
+            lambda i: "/courses",
+            lambda i: {"title": f"Benchmark course {i}", "author_id": author(i)},
+            collect="courses",
+        ),
+        Scenario(
+            "POST",
+            "/courses/bulk",
+            lambda i: "/courses/bulk",
+            lambda i: [
+                {"title": f"Bulk course {i} {n}", "author_id": author(i)}
+                for n in range(10)
+            ],
+            weight=0.2,
+        ),
+        Scenario(
+            "POST",
+            "/lessons",
+            lambda i: "/lessons",
+            lambda i: {
+                "title": f"Benchmark lesson {i}",
+                "course_id": new("courses")(i),
+            },
+            collect="lessons",
+        ),
+        Scenario(
+            "POST",
+            "/lessons/bulk",
+            lambda i: "/lessons/bulk",
+            lambda i: [
+                {"title": f"Bulk lesson {i} {n}", "course_id": new("courses")(i)}
+                for n in range(10)
+            ],
+            weight=0.2,
+        ),
+        Scenario(
+            "POST",
+            "/exercises",
+            lambda i: "/exercises",
+            lambda i: {
+                "title": f"Benchmark exercise {i}",
+                "lesson_id": new("lessons")(i),
+            },
+            collect="exercises",
+        ),
+        Scenario(
+            "POST",
+            "/exercises/bulk",
+            lambda i: "/exercises/bulk",
+            lambda i: [
+                {"title": f"Bulk exercise {i} {n}", "lesson_id": new("lessons")(i)}
+                for n in range(10)
+            ],
+            weight=0.2,
+        ),
+        Scenario(
+            "PUT",
+            "/courses/{course_id}",
+            lambda i: f"/courses/{new('courses')(i)}",
+            lambda i: {"description": f"Updated {i}"},
+        ),
+        Scenario(
+            "PUT",
+            "/lessons/{lesson_id}",
+            lambda i: f"/lessons/{new('lessons')(i)}",
+            lambda i: {"content": f"Updated {i}"},
+        ),
+        Scenario(
+            "PUT",
+            "/exercises/{exercise_id}",
+            lambda i: f"/exercises/{new('exercises')(i)}",
+            lambda i: {"content": f"Updated {i}"},
+        ),
+        # each created row is deleted once, children before parents
+        Scenario(
+            "DELETE",
+            "/exercises/{exercise_id}",
+            lambda i: f"/exercises/{created['exercises'][i]}",
+            consume="exercises",
+        ),
+        Scenario(
+            "DELETE",
+            "/lessons/{lesson_id}",
+            lambda i: f"/lessons/{created['lessons'][i]}",
+            consume="lessons",
+        ),
+        Scenario(
+            "DELETE",
+            "/courses/{course_id}",
+            lambda i: f"/courses/{created['courses'][i]}",
+            consume="courses",
+        ),
+    ]
+
+
+def uncovered_routes(names: set[str]) -> list[str]:
+    """API routes that no scenario exercises."""
+    routes = {
+        f"{method} {route.path}"
+        for route in app.routes
+        if isinstance(route, APIRoute) and route.path.startswith(PREFIX)
+        for method in route.methods
+    }
+    return sorted(routes - names - SKIPPED_ROUTES)
+
+
+async def _measure(
+    client: httpx.AsyncClient,
+    scenario: Scenario,
+    count: int,
+    concurrency: int,
+    created: dict[str, list[int]],
+) -> Measurement:
+    measurement = Measurement()
+    indexes = iter(range(count))
+
+    async def worker() -> None:
+        for i in indexes:
+            body = scenario.body(i) if scenario.body else None
+            with query_budget(sys.maxsize) as budget:
+                started = time.perf_counter()
+                response = await client.request(
+                    scenario.method, PREFIX + scenario.url(i), json=body
+                )
+                measurement.latencies.append(time.perf_counter() - started)
+            measurement.queries.append(budget.count)
+            measurement.status = response.status_code
+            if response.is_error:
+                measurement.errors += 1
+            elif scenario.collect:
+                created.setdefault(scenario.collect, []).append(response.json()["id"])
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    measurement.seconds = time.perf_counter() - started
+    return measurement
+
+
+async def run(
+    catalog: Catalog, requests: int, concurrency: int, warmup: int
+) -> dict[str, Any]:
+    created: dict[str, list[int]] = {}
+    plan = scenarios(catalog, created)
+    for route in uncovered_routes({scenario.name for scenario in plan}):
+        print(f"not benchmarked: {route}", file=sys.stderr)
+
+    results = {}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        for scenario in plan:
+            if scenario.consume:
+                count = len(created.get(scenario.consume, []))
+            else:
+                count = max(int(requests * scenario.weight), 1)
+            if count and scenario.method == "GET" and warmup:
+                await _measure(client, scenario, warmup, 1, created)
+            measurement = await _measure(client, scenario, count, concurrency, created)
+            # the same route may be measured with different parameters
+            name = scenario.name
+            while name in results:
+                name += "'"
+            results[name] = measurement.report()
+            print(_row(name, results[name]), file=sys.stderr)
+
+    return {
+        "meta": {
+            "started_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "database": engine.dialect.name,
+            "python": platform.python_version(),
+            "courses": catalog.courses,
+            "lessons_per_course": catalog.lessons_per_course,
+            "exercises_per_lesson": catalog.exercises_per_lesson,
+            "requests": requests,
+            "concurrency": concurrency,
+            "warmup": warmup,
+        },
+        "endpoints": results,
+    }
+
+
+def _row(name: str, report: dict[str, Any]) -> str:
+    return (
+        f"{name:<52} {report['p50_ms']:8.2f} {report['p95_ms']:8.2f} "
+        f"{report['p99_ms']:8.2f} ms {report['rps']:9.1f} req/s "
+        f"{report['queries_per_request']:6.2f} q/req"
+        + (
+            f"  {report['errors']} errors ({report['status']})"
+            if report["errors"]
+            else ""
+        )
+    )
@@ -0,0 +1,140 @@
+"""
+Deterministic catalog for the API benchmark.
+
+Rows get fixed ids, titles and timestamps, so two runs against freshly
+seeded databases see the same data and the same response sizes.
+"""
+
+import random
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import delete, func, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from app.crud import counts
+from app.db.base import Base
+from app.models import Counter, Course, Exercise, Lesson
+
+SEEDED_AT = datetime(2026, 1, 1)
+AUTHORS = 20
+CHUNK_SIZE = 5000
+
+WORDS = (
+    "python variables loops functions classes objects recursion sorting "
+    "lists dictionaries strings files exceptions generators decorators async "
+    "testing databases queries indexes algorithms graphs trees hashing"
+).split()
+
+
+@dataclass(frozen=True)
+class Catalog:
+    courses: int
+    lessons_per_course: int
+    exercises_per_lesson: int
+
+    @property
+    def lessons(self) -> int:
+        return self.courses * self.lessons_per_course
+
+    @property
+    def exercises(self) -> int:
+        return self.lessons * self.exercises_per_lesson
+
+
+def _phrase(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def _courses(catalog: Catalog, rng: random.Random) -> Iterator[dict[str, Any]]:
+    for course_id in range(1, catalog.courses + 1):
+        yield {
+            "id": course_id,
+            "author_id": 1 + course_id % AUTHORS,
+            "title": f"Course {course_id} {_phrase(rng, 3)}",
+            "description": _phrase(rng, 40),
+            "created_at": SEEDED_AT,
+            "updated_at": SEEDED_AT,
+        }
+
+
+def _lessons(catalog: Catalog, rng: random.Random) -> Iterator[dict[str, Any]]:
+    for lesson_id in range(1, catalog.lessons + 1):
+        yield {
+            "id": lesson_id,
+            "course_id": 1 + (lesson_id - 1) // catalog.lessons_per_course,
+            "title": f"Lesson {lesson_id} {_phrase(rng, 3)}",
+            "content": _phrase(rng, 80),
+            "video": None,
+            "created_at": SEEDED_AT,
+            "updated_at": SEEDED_AT,
+        }
+
+
+def _exercises(catalog: Catalog, rng: random.Random) -> Iterator[dict[str, Any]]:
+    for exercise_id in range(1, catalog.exercises + 1):
+        yield {
+            "id": exercise_id,
+            "lesson_id": 1 + (exercise_id - 1) // catalog.exercises_per_lesson,
+            "title": f"Exercise {exercise_id} {_phrase(rng, 3)}",
+            "content": _phrase(rng, 40),
+            "exercise": _phrase(rng, 10),
+            "created_at": SEEDED_AT,
+            "updated_at": SEEDED_AT,
+        }
+
+
+async def _insert(
+    conn: AsyncConnection, model: type[Base], rows: Iterator[dict[str, Any]]
+) -> None:
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == CHUNK_SIZE:
+            await conn.execute(insert(model), chunk)
+            chunk = []
+    if chunk:
+        await conn.execute(insert(model), chunk)
+
+
+async def seed(engine: AsyncEngine, catalog: Catalog, reset: bool = False) -> None:
+    """
+    Create the tables if needed and load the catalog.
+
+    Refuses to touch a database that already has courses unless ``reset``
+    is set, in which case every course, lesson, exercise and counter is
+    deleted first.
+    """
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        if reset:
+            for model in (Exercise, Lesson, Course, Counter):
+                await conn.execute(delete(model))
+        elif await conn.scalar(select(func.count()).select_from(Course)):
+            raise SystemExit(
+                "The database already has courses, pass --reset to replace them"
+            )
+
+        rng = random.Random(0)
+        await _insert(conn, Course, _courses(catalog, rng))
+        await _insert(conn, Lesson, _lessons(catalog, rng))
+        await _insert(conn, Exercise, _exercises(catalog, rng))
+        await counts.recount(conn)
+
+        if conn.dialect.name == "postgresql":
+            # explicit ids do not advance the sequences the POST requests use
+            for model in (Course, Lesson, Exercise):
+                table = model.__tablename__
+                await conn.execute(
+                    text(
+                        f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+                        f"(SELECT max(id) FROM {table}))"
+                    )
+                )
+
+    if engine.dialect.name == "postgresql":
+        async with engine.connect() as conn:
+            autocommit = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            await autocommit.execute(text("ANALYZE courses, lessons, exercises"))
@@ -0,0 +1,128 @@
+"""
+Benchmark: throughput of app.server as the number of workers grows.
+
+Starts ``python -m app.server`` with each worker count in turn, waits for
+``/ready`` and loads it over HTTP for a fixed time from several client
+processes, so the load generator does not become the bottleneck on one
+core. The database is the one configured in ``.env``; seed it first, for
+example by a run of ``python -m benchmarks.api``.
+
+    python -m benchmarks.scaling --workers 1 2 4 --duration 10
+    python -m benchmarks.scaling --path "/api/v1/courses/1" --clients 4
+"""
+
+import argparse
+import asyncio
+import os
+import signal
+import statistics
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import httpx
+
+from app.server import available_cpus
+
+
+async def _load(
+    base_url: str, paths: list[str], connections: int, duration: float
+) -> list[float]:
+    latencies: list[float] = []
+    deadline = time.monotonic() + duration
+    limits = httpx.Limits(max_connections=connections)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits) as client:
+
+        async def worker(offset: int) -> None:
+            i = offset
+            while time.monotonic() < deadline:
+                started = time.perf_counter()
+                response = await client.get(paths[i % len(paths)])
+                latencies.append(time.perf_counter() - started)
+                response.raise_for_status()
+                i += 1
+
+        await asyncio.gather(*(worker(n) for n in range(connections)))
+    return latencies
+
+
+def _client(
+    base_url: str, paths: list[str], connections: int, duration: float
+) -> list[float]:
+    return asyncio.run(_load(base_url, paths, connections, duration))
+
+
+def _wait_ready(
+    base_url: str, server: subprocess.Popen[bytes], timeout: float = 60
+) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise SystemExit(f"server exited with {server.returncode}")
+        try:
+            if httpx.get(f"{base_url}/ready").status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.2)
+    raise SystemExit("server did not become ready")
+
+
+def measure(workers: int, args: argparse.Namespace) -> tuple[float, list[float]]:
+    base_url = f"http://127.0.0.1:{args.port}"
+    env = {**os.environ, "SHUTDOWN_DRAIN_SECONDS": "0"}
+    server = subprocess.Popen(
+        [sys.executable, "-m", "app.server", "--host", "127.0.0.1"]
+        + ["--port", str(args.port), "--workers", str(workers)],
+        env=env,
+    )
+    try:
+        _wait_ready(base_url, server)
+        with ProcessPoolExecutor(args.clients) as pool:
+            futures = [
+                pool.submit(
+                    _client, base_url, args.path, args.connections, args.duration
+                )
+                for _ in range(args.clients)
+            ]
+            latencies = [latency for future in futures for latency in future.result()]
+    finally:
+        server.send_signal(signal.SIGTERM)
+        server.wait(timeout=60)
+    return len(latencies) / args.duration, latencies
+
+
+def main() -> None:
+    cpus = available_cpus()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=sorted({1, 2, 4, cpus} & set(range(1, cpus + 1))),
+    )
+    parser.add_argument("--path", action="append", help="repeat for several paths")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per run")
+    parser.add_argument("--clients", type=int, default=cpus, help="client processes")
+    parser.add_argument("--connections", type=int, default=16, help="per client")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+    args.path = args.path or ["/api/v1/courses?limit=20", "/api/v1/courses/1"]
+
+    print(f"{cpus} CPUs available, {args.clients} x {args.connections} connections")
+    print(f"{'workers':>7} {'req/s':>10} {'p50 ms':>8} {'p99 ms':>8} {'speedup':>8}")
+    baseline = 0.0
+    for workers in args.workers:
+        rps, latencies = measure(workers, args)
+        cuts = statistics.quantiles(latencies, n=100)
+        baseline = baseline or rps
+        print(
+            f"{workers:>7} {rps:>10.1f} {cuts[49] * 1000:>8.2f} "
+            f"{cuts[98] * 1000:>8.2f} {rps / baseline:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Benchmark: full-text search latency on PostgreSQL.
+
+Runs ``crud.search`` against the database configured in ``.env``, which must
+be migrated (``alembic upgrade head``) so the search vectors and GIN indexes
+exist. ``--seed`` first inserts a synthetic catalog of that many rows in
+total (1% courses, 9% lessons, 90% exercises) with generate_series. The
+vocabulary has 32 words, so a single term matches about two thirds of the
+rows and every match is ranked: a worst case rather than a typical catalog.
+
+    python -m benchmarks.search --seed 1000000
+    python -m benchmarks.search --queries 200
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from sqlalchemy import text
+
+from app import crud
+from app.crud import counts
+from app.db.session import AsyncSessionLocal, engine
+
+WORDS = (
+    "python variables loops functions classes objects recursion sorting "
+    "lists dictionaries strings files exceptions generators decorators async "
+    "testing databases queries indexes algorithms graphs trees hashing "
+    "closures iterators modules packages typing dataclasses regex parsing"
+).split()
+
+# random phrase of ``n`` vocabulary words; the reference to the outer ``g``
+# makes PostgreSQL evaluate it per row instead of once
+PHRASE = (
+    "(SELECT string_agg((CAST(:words AS text[]))[1 + floor(random() * :size)::int],"
+    " ' ') FROM generate_series(1, {n}) WHERE g > 0)"
+)
+
+SEED = (
+    """
+    INSERT INTO courses (author_id, title, description)
+    SELECT 1 + g % 100, 'Course ' || {title}, {body}
+    FROM generate_series(1, :courses) AS g
+    """,
+    """
+    INSERT INTO lessons (course_id, title, content)
+    SELECT c.id, 'Lesson ' || {title}, {body}
+    FROM generate_series(1, :per_course) AS g,
+        (SELECT id FROM courses ORDER BY id DESC LIMIT :courses) AS c
+    """,
+    """
+    INSERT INTO exercises (lesson_id, title, content)
+    SELECT l.id, 'Exercise ' || {title}, {body}
+    FROM generate_series(1, :per_lesson) AS g,
+        (SELECT id FROM lessons ORDER BY id DESC LIMIT :lessons) AS l
+    """,
+)
+
+
+async def seed(rows: int) -> None:
+    courses = max(rows // 100, 1)
+    params = {
+        "words": WORDS,
+        "size": len(WORDS),
+        "courses": courses,
+        "per_course": 9,
+        "lessons": courses * 9,
+        "per_lesson": 10,
+    }
+    started = time.perf_counter()
+    async with engine.begin() as conn:
+        for stmt in SEED:
+            sql = stmt.format(title=PHRASE.format(n=3), body=PHRASE.format(n=40))
+            await conn.execute(text(sql), params)
+        # the rows bypassed the CRUD layer, which maintains the counters
+        await counts.recount(conn)
+    async with engine.connect() as conn:
+        autocommit = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await autocommit.execute(text("ANALYZE courses, lessons, exercises"))
+    print(f"seeded ~{rows} rows in {time.perf_counter() - started:.1f} s")
+
+
+async def run(queries: int, limit: int) -> None:
+    rng = random.Random(0)
+    # single words, conjunctions and a phrase
+    terms = [
+        *WORDS,
+        *(f"{rng.choice(WORDS)} {rng.choice(WORDS)}" for _ in range(20)),
+        *(f'"{rng.choice(WORDS)} {rng.choice(WORDS)}"' for _ in range(10)),
+    ]
+    timings = []
+    async with AsyncSessionLocal() as db:
+        await crud.search(db, "warmup", limit=limit)
+        for _ in range(queries):
+            q = rng.choice(terms)
+            started = time.perf_counter()
+            await crud.search(db, q, limit=limit)
+            timings.append((time.perf_counter() - started) * 1000)
+
+    timings.sort()
+    print(f"{queries} queries, limit {limit}")
+    print(f"p50 {statistics.median(timings):7.2f} ms")
+    print(f"p95 {timings[int(len(timings) * 0.95) - 1]:7.2f} ms")
+    print(f"max {timings[-1]:7.2f} ms")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seed", type=int, default=0, help="rows to insert first")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    try:
+        if args.seed:
+            await seed(args.seed)
+        await run(args.queries, args.limit)
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
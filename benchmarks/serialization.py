@@ -0,0 +1,118 @@
+"""
+Micro-benchmark: list response serialization.
+
+Compares the previous path (ORM objects pushed through FastAPI's
+``serialize_response`` and ``JSONResponse``) with the row-mapping
+``ListSerializer`` path used by the list endpoints, on an in-memory SQLite
+database so the query cost of both paths is included as well.
+
+    python -m benchmarks.serialization --rows 100 --repeat 2000
+"""
+
+import argparse
+import asyncio
+import timeit
+from collections.abc import Callable
+from typing import List
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session
+
+from app.api.v1.serialization import exercise_fields
+from app.crud.columns import table_columns
+from app.db.base import Base
+from app.models import Course, Exercise, Lesson
+from app.schemas import ExerciseResponse
+
+
+def seed(session: Session, rows: int) -> None:
+    session.execute(insert(Course).values(id=1, author_id=1, title="Benchmark"))
+    session.execute(insert(Lesson).values(id=1, course_id=1, title="Benchmark"))
+    session.execute(
+        insert(Exercise),
+        [
+            {
+                "lesson_id": 1,
+                "title": f"Exercise {i}",
+                "content": "Write a function that sums two numbers. " * 10,
+                "exercise": "def add(a: int, b: int) -> int: ...",
+            }
+            for i in range(rows)
+        ],
+    )
+    session.commit()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    field = create_model_field("response", List[ExerciseResponse], mode="serialization")
+    exercise_list = exercise_fields.serializer(exercise_fields.all)
+    default_list = exercise_fields.serializer(exercise_fields.list_default)
+    default_columns = table_columns(
+        Exercise, exercise_fields.columns(exercise_fields.list_default)
+    )
+    loop = asyncio.new_event_loop()
+
+    with Session(engine) as session:
+        seed(session, args.rows)
+        objects = session.scalars(select(Exercise)).all()
+        mappings = session.execute(select(Exercise.__table__)).mappings().all()
+
+        def orm_serialize() -> bytes:
+            content = loop.run_until_complete(
+                serialize_response(field=field, response_content=objects)
+            )
+            return bytes(JSONResponse(content).body)
+
+        def mappings_serialize() -> bytes:
+            return exercise_list.dump(mappings)
+
+        def orm_query_and_serialize() -> bytes:
+            session.expunge_all()
+            rows = session.scalars(select(Exercise)).all()
+            content = loop.run_until_complete(
+                serialize_response(field=field, response_content=rows)
+            )
+            return bytes(JSONResponse(content).body)
+
+        def mappings_query_and_serialize() -> bytes:
+            rows = session.execute(select(Exercise.__table__)).mappings().all()
+            return exercise_list.dump(rows)
+
+        def default_query_and_serialize() -> bytes:
+            rows = session.execute(select(*default_columns)).mappings().all()
+            return default_list.dump(rows)
+
+        cases: list[tuple[str, Callable[[], bytes]]] = [
+            ("serialize: ORM + FastAPI", orm_serialize),
+            ("serialize: mappings + TypeAdapter", mappings_serialize),
+            ("query + serialize: ORM + FastAPI", orm_query_and_serialize),
+            ("query + serialize: mappings + TypeAdapter", mappings_query_and_serialize),
+            ("query + serialize: default fieldset", default_query_and_serialize),
+        ]
+
+        print(f"{args.rows} rows per response, {args.repeat} repetitions")
+        baseline = 0.0
+        for index, (name, case) in enumerate(cases):
+            seconds = min(timeit.repeat(case, number=args.repeat, repeat=3))
+            per_call = seconds / args.repeat * 1e6
+            if index % 2 == 0:
+                baseline = per_call
+                print(f"{name:<45} {per_call:9.1f} us")
+            else:
+                print(f"{name:<45} {per_call:9.1f} us  ({baseline / per_call:.2f}x)")
+
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
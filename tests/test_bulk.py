@@ -0,0 +1,105 @@
+"""
+Bulk creates report items whose parent does not exist as not found, also
+when the parent is deleted between the existence check and the INSERT.
+"""
+
+from typing import Any
+
+import httpx
+import pytest
+from sqlalchemy import Select, delete
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import crud
+from app.db.session import engine
+from app.models import Course, Lesson
+from app.schemas import ExerciseCreate, LessonCreate
+
+pytestmark = pytest.mark.anyio
+
+Item = dict[str, Any]
+
+
+class _Scalars(list[int]):
+    def all(self) -> list[int]:
+        return self
+
+
+def _delete_after_check(
+    db: AsyncSession, monkeypatch: pytest.MonkeyPatch, model: Any
+) -> None:
+    """Delete every ``model`` row right after the first query of ``db``."""
+    scalars = db.scalars
+    checked = False
+
+    async def check_then_delete(*args: Any, **kwargs: Any) -> Any:
+        nonlocal checked
+        result = await scalars(*args, **kwargs)
+        if not checked:
+            checked = True
+            async with engine.begin() as conn:
+                await conn.execute(delete(model))
+        return result
+
+    monkeypatch.setattr(db, "scalars", check_then_delete)
+
+
+async def test_create_lessons_course_deleted(
+    db: AsyncSession, monkeypatch: pytest.MonkeyPatch, course: Item
+) -> None:
+    _delete_after_check(db, monkeypatch, Course)
+    lessons = [LessonCreate(title="Loops", course_id=course["id"])]
+
+    assert await crud.create_lessons(db, lessons) == [None]
+
+
+async def test_create_exercises_lesson_deleted(
+    db: AsyncSession, monkeypatch: pytest.MonkeyPatch, lesson: Item
+) -> None:
+    _delete_after_check(db, monkeypatch, Lesson)
+    exercises = [ExerciseCreate(title="Print a name", lesson_id=lesson["id"])]
+
+    assert await crud.create_exercises(db, exercises) == [None]
+
+
+async def test_create_lessons_missing_course(
+    client: httpx.AsyncClient, course: Item
+) -> None:
+    body = [
+        {"title": "Loops", "course_id": course["id"]},
+        {"title": "Loops", "course_id": 999},
+    ]
+    response = await client.post("/api/v1/lessons/bulk", json=body)
+
+    assert response.status_code == 207
+    created, missing = response.json()
+    assert created["created"] and created["item"]["course_id"] == course["id"]
+    assert missing == {
+        "index": 1,
+        "created": False,
+        "item": None,
+        "detail": "Course with id 999 not found",
+    }
+
+
+async def test_create_lessons_retries_once(
+    db: AsyncSession, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # the check always finds the course, the INSERT never does
+    scalars = db.scalars
+    checks = 0
+
+    async def stale_check(stmt: Any, *args: Any, **kwargs: Any) -> Any:
+        nonlocal checks
+        if isinstance(stmt, Select):
+            checks += 1
+            return _Scalars([999])
+        return await scalars(stmt, *args, **kwargs)
+
+    monkeypatch.setattr(db, "scalars", stale_check)
+    lessons = [LessonCreate(title="Loops", course_id=999)]
+
+    with pytest.raises(IntegrityError):
+        await crud.create_lessons(db, lessons)
+    assert checks == 2
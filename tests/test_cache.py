@@ -0,0 +1,39 @@
+"""
+Cached payloads go away with the rows they were built from, including rows
+removed by ON DELETE CASCADE.
+"""
+
+from typing import Any
+
+import httpx
+import pytest
+
+from app.core.cache import response_cache
+
+pytestmark = pytest.mark.anyio
+
+Item = dict[str, Any]
+
+
+async def test_exercise_dropped_with_course(
+    client: httpx.AsyncClient, lesson: Item, exercise: Item
+) -> None:
+    response_cache.clear()
+    # only the exercise is cached, its lesson is not
+    path = f"/api/v1/exercises/{exercise['id']}"
+    assert (await client.get(path)).status_code == 200
+
+    response = await client.delete(f"/api/v1/courses/{lesson['course_id']}")
+    assert response.status_code == 204
+    assert (await client.get(path)).status_code == 404
+
+
+async def test_lesson_dropped_with_course(
+    client: httpx.AsyncClient, lesson: Item
+) -> None:
+    path = f"/api/v1/lessons/{lesson['id']}"
+    assert (await client.get(path)).status_code == 200
+
+    response = await client.delete(f"/api/v1/courses/{lesson['course_id']}")
+    assert response.status_code == 204
+    assert (await client.get(path)).status_code == 404
@@ -0,0 +1,102 @@
+"""
+Deletes run one DELETE ... RETURNING on the table and leave the children
+to ON DELETE CASCADE; no row is loaded first, found or not.
+"""
+
+import re
+from collections.abc import Iterator
+from typing import Any
+
+import httpx
+import pytest
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import engine
+from app.models import Course, Exercise, Lesson
+
+pytestmark = pytest.mark.anyio
+
+Item = dict[str, Any]
+
+
+@pytest.fixture
+def statements() -> Iterator[list[str]]:
+    """SQL of every statement run on the primary while the test runs."""
+    ran: list[str] = []
+
+    def record(*args: Any) -> None:
+        ran.append(args[2])
+
+    event.listen(engine.sync_engine, "after_cursor_execute", record)
+    yield ran
+    event.remove(engine.sync_engine, "after_cursor_execute", record)
+
+
+def _on(table: str, ran: list[str]) -> list[str]:
+    """Statements that read or write ``table``, subqueries included."""
+    pattern = re.compile(rf"\b(FROM|INTO|UPDATE|JOIN) {table}\b")
+    return [sql for sql in ran if pattern.search(sql)]
+
+
+@pytest.mark.parametrize(
+    "table, path",
+    [
+        ("courses", "/api/v1/courses/{course_id}"),
+        ("lessons", "/api/v1/lessons/{lesson_id}"),
+        ("exercises", "/api/v1/exercises/{exercise_id}"),
+    ],
+)
+async def test_delete_runs_one_statement(
+    client: httpx.AsyncClient,
+    lesson: Item,
+    exercise: Item,
+    statements: list[str],
+    table: str,
+    path: str,
+) -> None:
+    ids = {
+        "course_id": lesson["course_id"],
+        "lesson_id": lesson["id"],
+        "exercise_id": exercise["id"],
+    }
+    statements.clear()
+    response = await client.delete(path.format(**ids))
+
+    assert response.status_code == 204
+    [statement] = _on(table, statements)
+    assert statement.startswith(f"DELETE FROM {table} ")
+    assert "RETURNING" in statement
+
+
+@pytest.mark.parametrize(
+    "table, path, name",
+    [
+        ("courses", "/api/v1/courses/999", "Course"),
+        ("lessons", "/api/v1/lessons/999", "Lesson"),
+        ("exercises", "/api/v1/exercises/999", "Exercise"),
+    ],
+)
+async def test_delete_missing(
+    client: httpx.AsyncClient,
+    statements: list[str],
+    table: str,
+    path: str,
+    name: str,
+) -> None:
+    response = await client.delete(path)
+
+    assert response.status_code == 404
+    assert response.json() == {"detail": f"{name} with id 999 not found"}
+    [statement] = _on(table, statements)
+    assert statement.startswith(f"DELETE FROM {table} ")
+
+
+async def test_delete_course_cascades(
+    client: httpx.AsyncClient, db: AsyncSession, lesson: Item, exercise: Item
+) -> None:
+    response = await client.delete(f"/api/v1/courses/{lesson['course_id']}")
+
+    assert response.status_code == 204
+    for model in (Course, Lesson, Exercise):
+        assert await db.scalar(select(func.count()).select_from(model)) == 0
@@ -0,0 +1,42 @@
+"""
+NDJSON exports filtered by ``updated_since``, given with or without a UTC
+offset.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+
+import httpx
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+Item = dict[str, Any]
+
+
+@pytest.mark.parametrize("name", ["courses", "lessons", "exercises", "catalog"])
+@pytest.mark.parametrize(
+    "offset, rows",
+    [(timedelta(hours=-1), 1), (timedelta(hours=1), 0)],
+    ids=["before", "after"],
+)
+@pytest.mark.parametrize("tz", [None, timezone.utc, timezone(timedelta(hours=2))])
+async def test_export_updated_since(
+    client: httpx.AsyncClient,
+    exercise: Item,
+    name: str,
+    offset: timedelta,
+    rows: int,
+    tz: Optional[timezone],
+) -> None:
+    since = datetime.fromisoformat(exercise["updated_at"]) + offset
+    if tz is not None:
+        # the same instant, written with an offset
+        since = since.replace(tzinfo=timezone.utc).astimezone(tz)
+
+    response = await client.get(
+        f"/api/v1/export/{name}.ndjson", params={"updated_since": since.isoformat()}
+    )
+
+    assert response.status_code == 200
+    assert len(response.text.splitlines()) == rows
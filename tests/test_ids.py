@@ -0,0 +1,40 @@
+"""
+Multi-gets with ``?ids=``: request order, missing ids, rejected values.
+"""
+
+from typing import Any
+
+import httpx
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+Item = dict[str, Any]
+
+
+@pytest.mark.parametrize("path", ["courses", "lessons", "exercises"])
+async def test_ids_in_request_order(
+    client: httpx.AsyncClient, exercise: Item, path: str
+) -> None:
+    response = await client.get(f"/api/v1/{path}", params={"ids": "999,1,1"})
+
+    assert response.status_code == 200
+    assert [row["id"] for row in response.json()] == [1]
+    assert response.headers["X-Missing-Ids"] == "999"
+
+
+@pytest.mark.parametrize("path", ["courses", "lessons", "exercises"])
+@pytest.mark.parametrize("ids", ["0", "00", "1,2147483648", "99999999999999999999"])
+async def test_ids_out_of_range(client: httpx.AsyncClient, path: str, ids: str) -> None:
+    response = await client.get(f"/api/v1/{path}", params={"ids": ids})
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "ids must be between 1 and 2147483647"}
+
+
+@pytest.mark.parametrize("ids", ["1,a", "-1", "+3", " 7", "1_000", "1.0", "\u0663"])
+async def test_ids_not_integers(client: httpx.AsyncClient, ids: str) -> None:
+    response = await client.get("/api/v1/courses", params={"ids": ids})
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "ids must be comma separated integers"}
@@ -0,0 +1,64 @@
+"""
+Catalog import through POST /internal/import.
+"""
+
+import asyncio
+import json
+import time
+from typing import Any
+
+import httpx
+import pytest
+
+from app.importer import loader
+
+pytestmark = pytest.mark.anyio
+
+
+def _ndjson(rows: list[dict[str, Any]]) -> str:
+    return "\n".join(json.dumps(row) for row in rows)
+
+
+async def test_import_keeps_the_event_loop_free(
+    client: httpx.AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    records = loader._records
+
+    def slow_records(*args: Any) -> Any:
+        time.sleep(0.2)
+        return records(*args)
+
+    monkeypatch.setattr(loader, "_records", slow_records)
+    courses = _ndjson([{"title": "Imported", "author_id": 1}])
+    ticks = 0
+
+    async def tick() -> None:
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    ticker = asyncio.create_task(tick())
+    try:
+        response = await client.post(
+            "/api/v1/internal/import", files={"courses": ("courses.ndjson", courses)}
+        )
+    finally:
+        ticker.cancel()
+
+    assert response.status_code == 200, response.text
+    assert response.json()["courses"] == 1
+    # the loop kept running while the rows were validated
+    assert ticks >= 10
+
+
+async def test_import_invalid_row(client: httpx.AsyncClient) -> None:
+    courses = _ndjson([{"title": "Imported", "author_id": 1}, {"title": "No author"}])
+    response = await client.post(
+        "/api/v1/internal/import", files={"courses": ("courses.ndjson", courses)}
+    )
+
+    assert response.status_code == 422
+    assert response.json()["detail"].startswith(
+        "Import failed, nothing was written: courses.ndjson:2: author_id"
+    )
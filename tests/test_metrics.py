@@ -0,0 +1,28 @@
+"""
+DB time and query counts attributed to the request that ran the queries.
+"""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.metrics import QueryTiming, current_queries
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_failed_statement_is_not_timed(db: AsyncSession) -> None:
+    timing = QueryTiming()
+    token = current_queries.set(timing)
+    try:
+        with pytest.raises(DBAPIError):
+            await db.execute(text("SELECT 1 / 0"))
+        await db.rollback()
+        await db.execute(text("SELECT pg_sleep(0.05)"))
+    finally:
+        current_queries.reset(token)
+
+    # the failed statement left no start time behind for the next one
+    assert timing.queries == 1
+    assert 0.05 <= timing.seconds < 1
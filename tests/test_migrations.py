@@ -0,0 +1,13 @@
+"""
+The models and the migrations describe the same schema.
+"""
+
+from alembic import command
+from alembic.config import Config
+
+from app.db.startup import ALEMBIC_INI
+
+
+def test_no_pending_autogenerate_operations() -> None:
+    # raises when autogenerate would emit anything against the head revision
+    command.check(Config(str(ALEMBIC_INI)))
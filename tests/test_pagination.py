@@ -0,0 +1,99 @@
+"""
+Cursor pagination: walking the X-Next-Cursor chain returns every row once.
+"""
+
+from typing import Any
+
+import httpx
+import pytest
+
+from app.api.v1.pagination import NEXT_CURSOR_HEADER
+from app.crud.pagination import encode_cursor
+
+pytestmark = pytest.mark.anyio
+
+Item = dict[str, Any]
+
+
+async def _walk(client: httpx.AsyncClient, path: str, **params: Any) -> list[int]:
+    ids: list[int] = []
+    while True:
+        response = await client.get(path, params=params)
+        assert response.status_code == 200, response.text
+        ids += [row["id"] for row in response.json()]
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if cursor is None:
+            return ids
+        params["cursor"] = cursor
+
+
+async def test_walk_courses(client: httpx.AsyncClient) -> None:
+    body = [{"title": f"Course {i}", "author_id": 1} for i in range(5)]
+    await client.post("/api/v1/courses/bulk", json=body)
+
+    assert await _walk(client, "/api/v1/courses", limit=2) == [1, 2, 3, 4, 5]
+
+
+async def test_walk_lessons_by_course(client: httpx.AsyncClient, course: Item) -> None:
+    body = [{"title": f"Lesson {i}", "course_id": course["id"]} for i in range(5)]
+    created = (await client.post("/api/v1/lessons/bulk", json=body)).json()
+
+    path = f"/api/v1/lessons/courses/{course['id']}/lessons"
+    assert await _walk(client, path, limit=2) == [
+        result["item"]["id"] for result in created
+    ]
+
+
+async def test_walk_search(client: httpx.AsyncClient) -> None:
+    body = [{"title": f"Python {i}", "author_id": 1} for i in range(5)]
+    await client.post("/api/v1/courses/bulk", json=body)
+
+    ids = await _walk(client, "/api/v1/search", q="python", limit=2)
+    assert sorted(ids) == [1, 2, 3, 4, 5]
+
+
+@pytest.mark.parametrize(
+    "path, key",
+    [
+        ("/api/v1/courses", [1.5]),
+        ("/api/v1/courses", [2**31]),
+        ("/api/v1/courses", [True]),
+        ("/api/v1/courses", ["1"]),
+        ("/api/v1/courses", [1, 2]),
+        ("/api/v1/lessons/courses/1/lessons", [1, 2.5]),
+        ("/api/v1/search", [-0.1, 0.5, 1]),
+        ("/api/v1/search", [-0.1, 0, 2**31]),
+    ],
+)
+async def test_forged_cursor(
+    client: httpx.AsyncClient, course: Item, path: str, key: list[Any]
+) -> None:
+    params = {"q": "python", "cursor": encode_cursor(*key)}
+    response = await client.get(path, params=params)
+
+    assert response.status_code == 400
+
+
+async def test_search_cursor_takes_float_rank(
+    client: httpx.AsyncClient, course: Item
+) -> None:
+    cursor = encode_cursor(-1.0, 0, 0)
+    response = await client.get(f"/api/v1/search?q=python&cursor={cursor}")
+
+    assert response.status_code == 200
+    assert [row["id"] for row in response.json()] == [course["id"]]
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "/api/v1/lessons/courses/{id}/lessons",
+        "/api/v1/exercises/lessons/{id}/exercises",
+    ],
+)
+async def test_zero_limit(client: httpx.AsyncClient, lesson: Item, path: str) -> None:
+    parent_id = lesson["course_id"] if "courses" in path else lesson["id"]
+    response = await client.get(path.format(id=parent_id), params={"limit": 0})
+
+    assert response.status_code == 200
+    assert response.json() == []
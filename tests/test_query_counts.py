@@ -0,0 +1,279 @@
+"""
+Statements per request, pinned for every endpoint.
+
+Each test runs one request inside ``assert_max_queries``, with the response
+cache cold. A change that adds a query to an endpoint, such as an N+1
+loop or a lazy load, fails here with the statements that ran.
+"""
+
+import json
+from typing import Any
+
+import httpx
+import pytest
+
+from app.core.cache import response_cache
+from app.db.query_budget import assert_max_queries
+
+pytestmark = pytest.mark.anyio
+
+Item = dict[str, Any]
+
+
+# courses
+
+
+async def test_create_course(client: httpx.AsyncClient) -> None:
+    body = {"title": "Rust for beginners", "author_id": 2}
+    with assert_max_queries(3):
+        response = await client.post("/api/v1/courses", json=body)
+    assert response.status_code == 201
+
+
+async def test_create_courses(client: httpx.AsyncClient) -> None:
+    body = [{"title": f"Course {i}", "author_id": i % 2 + 1} for i in range(10)]
+    with assert_max_queries(2):
+        response = await client.post("/api/v1/courses/bulk", json=body)
+    assert response.status_code == 207
+
+
+async def test_get_courses(client: httpx.AsyncClient, course: Item) -> None:
+    with assert_max_queries(2):
+        response = await client.get("/api/v1/courses")
+    assert response.status_code == 200
+    assert response.headers["X-Total-Count"] == "1"
+
+
+async def test_get_courses_by_ids(client: httpx.AsyncClient, course: Item) -> None:
+    with assert_max_queries(1):
+        response = await client.get(f"/api/v1/courses?ids={course['id']},999")
+    assert response.status_code == 200
+    assert [row["id"] for row in response.json()] == [course["id"]]
+    assert response.headers["X-Missing-Ids"] == "999"
+
+
+async def test_suggest_courses(client: httpx.AsyncClient, course: Item) -> None:
+    with assert_max_queries(1):
+        response = await client.get("/api/v1/courses/suggest?prefix=pyth")
+    assert response.status_code == 200
+    assert [row["id"] for row in response.json()] == [course["id"]]
+
+
+async def test_get_course(client: httpx.AsyncClient, course: Item) -> None:
+    with assert_max_queries(1):
+        response = await client.get(f"/api/v1/courses/{course['id']}")
+    assert response.status_code == 200
+
+
+async def test_get_course_not_modified(client: httpx.AsyncClient, course: Item) -> None:
+    etag = (await client.get(f"/api/v1/courses/{course['id']}")).headers["ETag"]
+    # answered by the updated_at probe, not by the cached payload
+    response_cache.clear()
+    with assert_max_queries(1):
+        response = await client.get(
+            f"/api/v1/courses/{course['id']}", headers={"If-None-Match": etag}
+        )
+    assert response.status_code == 304
+
+
+async def test_get_course_tree(
+    client: httpx.AsyncClient, lesson: Item, exercise: Item
+) -> None:
+    with assert_max_queries(3):
+        response = await client.get(f"/api/v1/courses/{lesson['course_id']}/tree")
+    assert response.status_code == 200
+    assert response.json()["lessons"][0]["exercises"][0]["id"] == exercise["id"]
+
+
+async def test_update_course(client: httpx.AsyncClient, course: Item) -> None:
+    with assert_max_queries(1):
+        response = await client.put(
+            f"/api/v1/courses/{course['id']}", json={"title": "Python advanced"}
+        )
+    assert response.status_code == 200
+
+
+async def test_delete_course(
+    client: httpx.AsyncClient, lesson: Item, exercise: Item
+) -> None:
+    with assert_max_queries(4):
+        response = await client.delete(f"/api/v1/courses/{lesson['course_id']}")
+    assert response.status_code == 204
+
+
+# lessons
+
+
+async def test_create_lesson(client: httpx.AsyncClient, course: Item) -> None:
+    body = {"title": "Loops", "course_id": course["id"]}
+    with assert_max_queries(3):
+        response = await client.post("/api/v1/lessons", json=body)
+    assert response.status_code == 201
+
+
+async def test_create_lessons(client: httpx.AsyncClient, course: Item) -> None:
+    body = [{"title": f"Lesson {i}", "course_id": course["id"]} for i in range(10)]
+    with assert_max_queries(3):
+        response = await client.post("/api/v1/lessons/bulk", json=body)
+    assert response.status_code == 207
+
+
+async def test_get_lessons(client: httpx.AsyncClient, lesson: Item) -> None:
+    with assert_max_queries(2):
+        response = await client.get("/api/v1/lessons")
+    assert response.status_code == 200
+
+
+async def test_get_lessons_by_course(client: httpx.AsyncClient, lesson: Item) -> None:
+    with assert_max_queries(2):
+        response = await client.get(
+            f"/api/v1/lessons/courses/{lesson['course_id']}/lessons"
+        )
+    assert response.status_code == 200
+    assert [row["id"] for row in response.json()] == [lesson["id"]]
+
+
+async def test_get_lesson(client: httpx.AsyncClient, lesson: Item) -> None:
+    with assert_max_queries(1):
+        response = await client.get(f"/api/v1/lessons/{lesson['id']}")
+    assert response.status_code == 200
+
+
+async def test_update_lesson(client: httpx.AsyncClient, lesson: Item) -> None:
+    with assert_max_queries(1):
+        response = await client.put(
+            f"/api/v1/lessons/{lesson['id']}", json={"title": "Constants"}
+        )
+    assert response.status_code == 200
+
+
+async def test_delete_lesson(client: httpx.AsyncClient, exercise: Item) -> None:
+    with assert_max_queries(3):
+        response = await client.delete(f"/api/v1/lessons/{exercise['lesson_id']}")
+    assert response.status_code == 204
+
+
+# exercises
+
+
+async def test_create_exercise(client: httpx.AsyncClient, lesson: Item) -> None:
+    body = {"title": "Print a name", "lesson_id": lesson["id"]}
+    with assert_max_queries(3):
+        response = await client.post("/api/v1/exercises", json=body)
+    assert response.status_code == 201
+
+
+async def test_create_exercises(client: httpx.AsyncClient, lesson: Item) -> None:
+    body = [{"title": f"Exercise {i}", "lesson_id": lesson["id"]} for i in range(10)]
+    with assert_max_queries(3):
+        response = await client.post("/api/v1/exercises/bulk", json=body)
+    assert response.status_code == 207
+
+
+async def test_get_exercises(client: httpx.AsyncClient, exercise: Item) -> None:
+    with assert_max_queries(2):
+        response = await client.get("/api/v1/exercises")
+    assert response.status_code == 200
+
+
+async def test_get_exercises_by_lesson(
+    client: httpx.AsyncClient, exercise: Item
+) -> None:
+    with assert_max_queries(2):
+        response = await client.get(
+            f"/api/v1/exercises/lessons/{exercise['lesson_id']}/exercises"
+        )
+    assert response.status_code == 200
+    assert [row["id"] for row in response.json()] == [exercise["id"]]
+
+
+async def test_get_exercise(client: httpx.AsyncClient, exercise: Item) -> None:
+    with assert_max_queries(1):
+        response = await client.get(f"/api/v1/exercises/{exercise['id']}")
+    assert response.status_code == 200
+
+
+async def test_update_exercise(client: httpx.AsyncClient, exercise: Item) -> None:
+    with assert_max_queries(1):
+        response = await client.put(
+            f"/api/v1/exercises/{exercise['id']}", json={"title": "Print two names"}
+        )
+    assert response.status_code == 200
+
+
+async def test_delete_exercise(client: httpx.AsyncClient, exercise: Item) -> None:
+    with assert_max_queries(2):
+        response = await client.delete(f"/api/v1/exercises/{exercise['id']}")
+    assert response.status_code == 204
+
+
+# authors and search
+
+
+async def test_get_author_courses(client: httpx.AsyncClient, exercise: Item) -> None:
+    with assert_max_queries(3):
+        response = await client.get("/api/v1/authors/1/courses")
+    assert response.status_code == 200
+    assert response.json()[0]["exercise_count"] == 1
+
+
+async def test_search(client: httpx.AsyncClient, exercise: Item) -> None:
+    with assert_max_queries(1):
+        response = await client.get("/api/v1/search?q=python")
+    assert response.status_code == 200
+    assert response.json()[0]["type"] == "course"
+
+
+# exports
+
+
+@pytest.mark.parametrize(
+    "name", ["courses", "lessons", "exercises", "catalog"], ids=lambda name: name
+)
+async def test_export(client: httpx.AsyncClient, exercise: Item, name: str) -> None:
+    # the catalog streams courses and loads lessons and exercises per batch
+    with assert_max_queries(3 if name == "catalog" else 1):
+        response = await client.get(f"/api/v1/export/{name}.ndjson")
+    assert response.status_code == 200
+    assert len(response.text.splitlines()) == 1
+
+
+# operational endpoints
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "/",
+        "/ready",
+        "/metrics",
+        "/api/v1/internal/cache",
+        "/api/v1/internal/cache/suggest",
+        "/api/v1/internal/replicas",
+        "/api/v1/internal/pool",
+        "/api/v1/internal/coalescing",
+    ],
+)
+async def test_operational(client: httpx.AsyncClient, path: str) -> None:
+    with assert_max_queries(0):
+        response = await client.get(path)
+    # /ready is 503 because the transport does not run the lifespan
+    assert response.status_code in (200, 503)
+
+
+async def test_import(client: httpx.AsyncClient) -> None:
+    courses = "\n".join(
+        json.dumps({"key": f"c{i}", "title": f"Imported {i}", "author_id": 1})
+        for i in range(10)
+    )
+    lessons = "\n".join(
+        json.dumps({"course_key": f"c{i}", "title": f"Lesson {i}"}) for i in range(10)
+    )
+    files = {
+        "courses": ("courses.ndjson", courses),
+        "lessons": ("lessons.ndjson", lessons),
+    }
+    with assert_max_queries(11):
+        response = await client.post("/api/v1/internal/import", files=files)
+    assert response.status_code == 200, response.text
+    assert response.json()["lessons"] == 10
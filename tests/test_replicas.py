@@ -0,0 +1,132 @@
+"""
+Reads on replicas: sessions check out a connection only when they query,
+an unreachable replica is skipped in favour of the primary, and a client
+reading its own writes is not served what a lagging replica returned.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any
+
+import httpx
+import pytest
+from sqlalchemy import NullPool, event, make_url, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.config import settings
+from app.crud.coalesce import read_flights
+from app.db.replicas import Replica
+from app.db.session import (
+    RECENT_WRITE_HEADER,
+    _create_engine,
+    _sessionmaker,
+    engine,
+    replicas,
+)
+
+pytestmark = pytest.mark.anyio
+
+Item = dict[str, Any]
+
+
+async def _replica(monkeypatch: pytest.MonkeyPatch, url: str) -> AsyncIterator[Replica]:
+    replica_engine = _create_engine(url)
+    replica = Replica(replica_engine, _sessionmaker(replica_engine))
+    monkeypatch.setattr(replicas, "replicas", [replica])
+    yield replica
+    await replica_engine.dispose()
+
+
+@pytest.fixture
+async def replica(monkeypatch: pytest.MonkeyPatch) -> AsyncIterator[Replica]:
+    # the test database stands in for a replica of itself
+    async for replica in _replica(monkeypatch, settings.DATABASE_URL):
+        yield replica
+
+
+@pytest.fixture
+async def dead_replica(monkeypatch: pytest.MonkeyPatch) -> AsyncIterator[Replica]:
+    url = make_url(settings.DATABASE_URL).set(host="127.0.0.1", port=1)
+    async for replica in _replica(monkeypatch, url.render_as_string(False)):
+        yield replica
+
+
+@pytest.fixture
+async def lagging_replica(
+    monkeypatch: pytest.MonkeyPatch, course: Item
+) -> AsyncIterator[Replica]:
+    """A copy of the test database taken now, which sees no later writes."""
+    url = make_url(settings.DATABASE_URL)
+    name = f"{url.database}_replica"
+    admin = create_async_engine(
+        url.set(database="postgres"), isolation_level="AUTOCOMMIT", poolclass=NullPool
+    )
+    # the template database must have no other sessions
+    await engine.dispose()
+    async with admin.connect() as conn:
+        await conn.execute(text(f'DROP DATABASE IF EXISTS "{name}"'))
+        await conn.execute(text(f'CREATE DATABASE "{name}" TEMPLATE "{url.database}"'))
+    try:
+        replica_url = url.set(database=name).render_as_string(False)
+        async for replica in _replica(monkeypatch, replica_url):
+            yield replica
+    finally:
+        async with admin.connect() as conn:
+            await conn.execute(text(f'DROP DATABASE IF EXISTS "{name}"'))
+        await admin.dispose()
+
+
+async def test_coalesced_reads_share_a_checkout(
+    client: httpx.AsyncClient,
+    monkeypatch: pytest.MonkeyPatch,
+    replica: Replica,
+    lesson: Item,
+    exercise: Item,
+) -> None:
+    monkeypatch.setattr(read_flights, "enabled", True)
+    # the fixtures' writes would send reads to the primary for a while
+    client.cookies.clear()
+    checkouts: list[object] = []
+
+    def record(dbapi_connection: Any, *args: Any) -> None:
+        checkouts.append(dbapi_connection)
+
+    event.listen(replica.engine.sync_engine, "checkout", record)
+
+    path = f"/api/v1/courses/{lesson['course_id']}/tree"
+    responses = await asyncio.gather(*(client.get(path) for _ in range(20)))
+
+    assert {response.status_code for response in responses} == {200}
+    # the health probe and the one session that ran the queries
+    assert len(checkouts) == 2
+
+
+async def test_dead_replica_falls_back_to_primary(
+    client: httpx.AsyncClient, dead_replica: Replica, course: Item
+) -> None:
+    client.cookies.clear()
+    response = await client.get(f"/api/v1/courses/{course['id']}/tree")
+
+    assert response.status_code == 200
+    assert not dead_replica.healthy
+
+
+async def test_pinned_read_skips_what_a_lagging_replica_cached(
+    client: httpx.AsyncClient, lagging_replica: Replica, course: Item
+) -> None:
+    path = f"/api/v1/courses/{course['id']}"
+    response = await client.put(path, json={"title": "Python advanced"})
+    assert response.status_code == 200
+
+    # the replica has not seen the update yet, and its answer gets cached
+    client.cookies.clear()
+    stale = await client.get(path)
+    assert stale.json()["title"] == "Python basics"
+
+    pinned = {RECENT_WRITE_HEADER: "1"}
+    response = await client.get(path, headers=pinned)
+    assert response.json()["title"] == "Python advanced"
+
+    conditional = {**pinned, "If-None-Match": stale.headers["ETag"]}
+    response = await client.get(path, headers=conditional)
+    assert response.status_code == 200